@@ -0,0 +1,119 @@
+"""
+Builds data/word_pools.bin, the memory-mapped word pools the generation engine gathers from.
+
+The word lists below are the source of truth. Every table the generators
+need is rendered here once (separators pre-joined, numbers pre-formatted,
+pairs of pools pre-combined), so nothing has to be parsed or built when the
+engine starts. Rerun after editing a list and commit the result:
+
+    python build_word_pools.py [--output data/word_pools.bin]
+"""
+import argparse
+import datetime
+import itertools
+
+from word_pools import DEFAULT_PATH, write_pools
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+    "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Christopher", "Lisa", "Daniel", "Nancy",
+    "Matthew", "Betty", "Anthony", "Margaret", "Mark", "Sandra", "Donald", "Ashley",
+    "Steven", "Kimberly", "Paul", "Emily", "Andrew", "Donna", "Joshua", "Michelle",
+    "Kenneth", "Carol", "Kevin", "Amanda", "Brian", "Dorothy", "George", "Melissa",
+    "Timothy", "Deborah", "Ronald", "Stephanie", "Edward", "Rebecca", "Jason", "Sharon",
+    "Jeffrey", "Laura", "Ryan", "Cynthia", "Jacob", "Kathleen", "Gary", "Amy",
+    "Nicholas", "Angela", "Eric", "Shirley", "Jonathan", "Anna", "Stephen", "Brenda",
+    "Larry", "Pamela", "Justin", "Emma", "Scott", "Nicole", "Brandon", "Helen",
+    "Benjamin", "Samantha", "Samuel", "Katherine", "Gregory", "Christine", "Alexander", "Debra",
+    "Frank", "Rachel", "Patrick", "Carolyn", "Raymond", "Janet", "Jack", "Catherine",
+    "Dennis", "Maria", "Jerry", "Heather", "Tyler", "Diane", "Aaron", "Ruth",
+]
+
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas",
+    "Taylor", "Moore", "Jackson", "Martin", "Lee", "Perez", "Thompson", "White",
+    "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson", "Walker", "Young",
+    "Allen", "King", "Wright", "Scott", "Torres", "Nguyen", "Hill", "Flores",
+    "Green", "Adams", "Nelson", "Baker", "Hall", "Rivera", "Campbell", "Mitchell",
+    "Carter", "Roberts", "Gomez", "Phillips", "Evans", "Turner", "Diaz", "Parker",
+    "Cruz", "Edwards", "Collins", "Reyes", "Stewart", "Morris", "Morales", "Murphy",
+    "Cook", "Rogers", "Gutierrez", "Ortiz", "Morgan", "Cooper", "Peterson", "Bailey",
+    "Reed", "Kelly", "Howard", "Ramos", "Kim", "Cox", "Ward", "Richardson",
+    "Watson", "Brooks", "Chavez", "Wood", "James", "Bennett", "Gray", "Mendoza",
+    "Ruiz", "Hughes", "Price", "Alvarez", "Castillo", "Sanders", "Patel", "Myers",
+]
+
+STREET_NAMES = [
+    "Main", "Oak", "Pine", "Maple", "Cedar", "Elm", "Washington", "Lake",
+    "Hill", "Park", "Walnut", "Sunset", "Lincoln", "Jackson", "Church", "River",
+    "Highland", "Mill", "Spring", "Chestnut", "Willow", "Meadow", "Forest", "Ridge",
+    "Franklin", "Madison", "Jefferson", "Center", "Valley", "Cherry", "Adams", "Birch",
+    "Dogwood", "Hickory", "Magnolia", "Poplar", "Sycamore", "Laurel", "Harbor", "Prospect",
+    "Railroad", "Broad", "Water", "Union", "Market", "Front", "Bridge", "Summit",
+]
+
+STREET_SUFFIXES = [
+    "St", "Ave", "Rd", "Blvd", "Ln", "Dr", "Ct", "Way", "Pl", "Ter",
+]
+
+EMAIL_DOMAINS = [
+    "gmail.com", "yahoo.com", "outlook.com", "hotmail.com", "icloud.com",
+    "proton.me", "aol.com", "mail.com", "example.com", "example.org",
+]
+
+# Every birth date the engine can ask for (its age reference date and maximum age must fall inside)
+DATES_START = datetime.date(1900, 1, 1)
+DATES_END = datetime.date(2030, 12, 31)
+
+
+def _joined(*word_lists):
+    """Every combination of the lists' entries, concatenated (the last list varies fastest)."""
+    return ["".join(words) for words in itertools.product(*word_lists)]
+
+
+def pool_words():
+    """Returns {pool name: list of strings} for every pool the engine uses."""
+    first = [w + " " for w in FIRST_NAMES]
+    email_first = [w.lower() + "." for w in FIRST_NAMES]
+    email_last = [w.lower() for w in LAST_NAMES]
+    email_domains = ["@" + d for d in EMAIL_DOMAINS]
+    streets = [w + " " for w in STREET_NAMES]
+    numbers = [str(i) for i in range(10000)]
+
+    days = (DATES_END - DATES_START).days + 1
+    return {
+        # Full names and email local parts share one index layout, which is what lets an email follow its name
+        "full_names": _joined(first, LAST_NAMES),
+        "email_locals": _joined(email_first, email_last),
+        "email_suffixes": _joined(numbers[:1000], email_domains),
+        "email_domains": email_domains,
+        "street_names": streets,
+        "street_suffixes": list(STREET_SUFFIXES),
+        "streets": _joined(streets, STREET_SUFFIXES),
+        # Pre-rendered numbers, so they are formatted by lookup instead of per-cell str()
+        "numbers": numbers,
+        "house_numbers": [f"{i} " for i in range(10000)],
+        "area_codes": [f"({i}) " for i in range(1000)],
+        "exchanges": [f"{i}-" for i in range(1000)],
+        "line_numbers": [f"{i:04d}" for i in range(10000)],
+        "dates": [(DATES_START + datetime.timedelta(days=i)).isoformat() for i in range(days)],
+    }
+
+
+def build(path=DEFAULT_PATH):
+    write_pools(path, pool_words())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the memory-mapped word pools.")
+    parser.add_argument("--output", default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    build(args.output)
+    print(f"✅ Word pools written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
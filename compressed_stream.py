@@ -0,0 +1,179 @@
+"""
+A write-only file wrapper that compresses on a thread pool: gzip, zstd or lz4.
+
+Writes are collected into blocks of at least `block_bytes`, and every block
+is compressed on its own into a complete gzip member, zstd frame or lz4
+frame. The compressed blocks are written to the underlying file in the
+order the data came in. All three formats allow members/frames to be
+concatenated, so the result is one ordinary file for gzip -d, zstd -d,
+lz4 -d or gzip.open(). The compressors release the GIL while they work, so
+the threads really do run on separate cores.
+
+zstd and lz4 need the 'zstandard' and 'lz4' packages, which are only
+imported when that codec is used.
+"""
+import gzip
+import os
+import threading
+from collections import deque
+
+# Smallest amount of data compressed as one member / frame
+BLOCK_BYTES = 4 << 20
+
+# File extension -> codec
+COMPRESSION_EXTENSIONS = {".gz": "gzip", ".zst": "zstd", ".lz4": "lz4"}
+
+# Optional codec packages, imported on first use by _import_codec_package()
+zstandard = lz4_frame = None
+
+
+def _import_codec_package(codec):
+    """Imports the package `codec` needs (if any) into this module's globals."""
+    global zstandard, lz4_frame
+    try:
+        if codec == "zstd" and zstandard is None:
+            import zstandard as _zstandard
+            zstandard = _zstandard
+        elif codec == "lz4" and lz4_frame is None:
+            import lz4.frame as _lz4_frame
+            lz4_frame = _lz4_frame
+    except ImportError:
+        package = "zstandard" if codec == "zstd" else "lz4"
+        raise ImportError(f"'{package}' is not installed. Please run 'pip install {package}'")
+
+
+def _gzip_compressor(level):
+    level = 6 if level is None else level
+    # mtime=0 keeps the output identical from run to run
+    return lambda block: gzip.compress(block, compresslevel=level, mtime=0)
+
+
+def _zstd_compressor(level):
+    level = 3 if level is None else level
+    local = threading.local()  # ZstdCompressor objects must not be shared between threads
+
+    def compress(block):
+        compressor = getattr(local, "compressor", None)
+        if compressor is None:
+            compressor = local.compressor = zstandard.ZstdCompressor(level=level)
+        return compressor.compress(block)
+
+    return compress
+
+
+def _lz4_compressor(level):
+    level = 0 if level is None else level
+    return lambda block: lz4_frame.compress(block, compression_level=level)
+
+
+# Codec -> function of the compression level (None for the codec's default) returning compress(block)
+CODECS = {
+    "gzip": _gzip_compressor,
+    "zstd": _zstd_compressor,
+    "lz4": _lz4_compressor,
+}
+
+
+def compression_for_path(path):
+    """Returns the codec a file name's extension asks for, or None."""
+    return COMPRESSION_EXTENSIONS.get(os.path.splitext(path)[1].lower())
+
+
+class CompressedStream:
+    """
+    Compresses everything written to it into `stream`, `threads` blocks at a time.
+
+    At most two blocks per thread are in flight, so memory stays bounded
+    however fast data arrives. close() writes the last block and waits for
+    the rest; it does not close `stream`. Leaving a `with` block on an
+    exception discards whatever is not compressed yet instead.
+    """
+
+    def __init__(self, stream, codec, level=None, threads=None, block_bytes=BLOCK_BYTES):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown compression '{codec}'; choose one of {', '.join(CODECS)}")
+        _import_codec_package(codec)
+        self.stream = stream
+        self.codec = codec
+        self.block_bytes = block_bytes
+        self.threads = threads or os.cpu_count() or 1
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.closed = False
+
+        self._compress = CODECS[codec](level)
+        self._chunks = []  # Written data not yet handed to the pool
+        self._chunk_bytes = 0
+        self._pending = deque()  # Futures of compressed blocks, in write order
+        from concurrent.futures import ThreadPoolExecutor  # Only paid for by compressed exports
+        self._pool = ThreadPoolExecutor(max_workers=self.threads, thread_name_prefix="compress")
+
+    def writable(self):
+        return True
+
+    def tell(self):
+        """Position in the uncompressed data."""
+        return self.bytes_in
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError("write to a closed CompressedStream")
+        size = len(data)
+        if size:
+            self._chunks.append(bytes(data))
+            self._chunk_bytes += size
+            self.bytes_in += size
+            if self._chunk_bytes >= self.block_bytes:
+                self._submit_block()
+        return size
+
+    def flush(self):
+        """Compresses and writes everything written so far (ending the current block early)."""
+        self._submit_block()
+        while self._pending:
+            self._write_block(self._pending.popleft().result())
+        self.stream.flush()
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self.closed = True
+            self._pool.shutdown(cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def discard(self):
+        """Drops everything not yet written to `stream` and stops the pool without waiting for it."""
+        if self.closed:
+            return
+        self.closed = True
+        self._chunks = []
+        self._chunk_bytes = 0
+        self._pending.clear()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _submit_block(self):
+        if not self._chunks:
+            return
+        block = self._chunks[0] if len(self._chunks) == 1 else b"".join(self._chunks)
+        self._chunks = []
+        self._chunk_bytes = 0
+        self._pending.append(self._pool.submit(self._compress, block))
+
+        # Write whatever is finished at the head, and wait once too much is in flight
+        while self._pending and (self._pending[0].done() or len(self._pending) > 2 * self.threads):
+            self._write_block(self._pending.popleft().result())
+
+    def _write_block(self, compressed):
+        self.stream.write(compressed)
+        self.bytes_out += len(compressed)
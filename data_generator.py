@@ -0,0 +1,713 @@
+"""
+Headless, column-oriented fake data engine for the Schema Builder field types.
+
+Every column is produced as a whole NumPy array: random index arrays are drawn
+in bulk and used to gather values from pre-loaded word pools, so there is no
+Python call per cell.
+
+A schema is first compiled into a GenerationPlan (see compile_schema()): field
+types are resolved to their value parts, weights are turned into cumulative
+tables and dependent columns are ordered after the columns they derive from.
+Plans are cached by schema hash, so repeated previews and exports of the same
+schema skip all of that.
+
+Randomness is drawn in fixed-size blocks of BLOCK_ROWS rows. Each block of
+each column gets its own stream derived from (seed, column key, block index),
+which makes any row range reproducible on its own: generating rows 0-1M in one
+go yields exactly the same values as generating them in any number of slices.
+"""
+import datetime
+import os
+import threading
+import zlib
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from word_pools import load_default_pools
+
+# Field types offered by the Schema Builder dropdown
+FIELD_TYPES = [
+    "Full Name",
+    "Email Address",
+    "Phone Number",
+    "Street Address",
+    "Date of Birth"
+]
+
+# Rows per random stream block (see module docstring)
+BLOCK_ROWS = 4096
+
+# Rows per process-pool shard (a whole number of blocks)
+SHARD_ROWS = 64 * BLOCK_ROWS
+
+# Default rows per streamed batch, and the largest request generate() will hold in memory at once
+BATCH_ROWS = 16 * BLOCK_ROWS
+MAX_MATERIALIZED_ROWS = 5_000_000
+
+# Date of Birth range (fixed so generated fixtures never drift with the clock)
+DOB_START = np.datetime64("1945-01-01")
+DOB_END = np.datetime64("2006-12-31")
+
+# Ages (the min_age / max_age options) are computed on this date, for the same reason
+AGE_REFERENCE_DATE = datetime.date(2025, 1, 1)
+MAX_AGE = 110
+
+# --- Word Pools ---
+# Memory-mapped from data/word_pools.bin (see build_word_pools.py for the word lists);
+# each pool is only decoded into strings the first time a generator gathers from it.
+_POOLS = load_default_pools()
+
+# Relative frequencies for pools that are far from uniform in real data (same order as the pools)
+EMAIL_DOMAIN_WEIGHTS = [40, 12, 10, 8, 8, 3, 3, 2, 7, 7]
+STREET_SUFFIX_WEIGHTS = [30, 20, 18, 6, 8, 10, 3, 2, 2, 1]
+
+_FULL_NAMES = _POOLS["full_names"]
+_EMAIL_LOCALS = _POOLS["email_locals"]  # Same index layout as _FULL_NAMES
+_EMAIL_SUFFIXES = _POOLS["email_suffixes"]  # _EMAIL_NUMBERS x _EMAIL_DOMAINS
+_EMAIL_DOMAINS = _POOLS["email_domains"]
+_STREET_NAMES = _POOLS["street_names"]
+_STREET_SUFFIXES = _POOLS["street_suffixes"]
+_STREETS = _POOLS["streets"]  # _STREET_NAMES x _STREET_SUFFIXES
+_NUMBERS = _POOLS["numbers"]
+_EMAIL_NUMBERS = _NUMBERS[:1000]
+_HOUSE_NUMBERS = _POOLS["house_numbers"]
+_AREA_CODES = _POOLS["area_codes"]
+_EXCHANGES = _POOLS["exchanges"]
+_LINE_NUMBERS = _POOLS["line_numbers"]
+
+# One contiguous run of ISO dates, so any birth date range is a slice of it
+_DATES = _POOLS["dates"]
+_DATES_START = np.datetime64(_DATES[0], "D")
+
+
+# --- Random Streams ---
+def column_key(field_name):
+    """Stable per-column stream key, so adding or reordering fields leaves other columns unchanged."""
+    return zlib.crc32(field_name.encode("utf-8"))
+
+
+class RandomBlocks:
+    """
+    The random streams of one column for the rows [start, stop).
+
+    Every draw consumes whole blocks and is then cut down to the requested rows,
+    so a value depends only on its block's stream and its position inside the
+    block, never on where the requested range began or ended.
+    """
+
+    def __init__(self, seed, key, start, stop):
+        first_block = start // BLOCK_ROWS
+        last_block = -(-stop // BLOCK_ROWS)
+        self.rngs = [
+            np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=(key, block))))
+            for block in range(first_block, last_block)
+        ]
+        self.offset = start - first_block * BLOCK_ROWS
+        self.num_rows = stop - start
+
+    def integers(self, low, high):
+        """Draws one integer in [low, high) per row."""
+        if not self.rngs:
+            return np.empty(0, dtype=np.int64)
+        drawn = np.concatenate([rng.integers(low, high, size=BLOCK_ROWS) for rng in self.rngs])
+        return drawn[self.offset:self.offset + self.num_rows]
+
+    def random(self):
+        """Draws one float in [0, 1) per row."""
+        if not self.rngs:
+            return np.empty(0, dtype=np.float64)
+        drawn = np.concatenate([rng.random(BLOCK_ROWS) for rng in self.rngs])
+        return drawn[self.offset:self.offset + self.num_rows]
+
+
+class IndexPermutation:
+    """
+    A seeded bijection of [0, size) onto itself, evaluated for whole arrays of row indices.
+
+    A balanced Feistel network permutes the smallest even-bit power of two
+    covering `size`; indices that land outside [0, size) are walked through
+    the network again until they fall inside (cycle walking), which keeps the
+    mapping a bijection on [0, size). Mapping each global row index through
+    it gives every row a distinct value index, with no memory of earlier
+    rows and no retries as the space fills up.
+    """
+
+    ROUNDS = 4
+    _MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+    _MIX_2 = np.uint64(0x94D049BB133111EB)
+
+    def __init__(self, size, seed, key):
+        self.size = size
+        half_bits = max(1, (int(size - 1).bit_length() + 1) // 2)
+        self.half_bits = np.uint64(half_bits)
+        self.half_mask = np.uint64((1 << half_bits) - 1)
+        self.round_keys = np.random.SeedSequence(seed, spawn_key=(key, 0x756E6971)).generate_state(self.ROUNDS, np.uint64)
+
+    def _round(self, right, round_key):
+        # splitmix64 finalizer of (right ^ key), cut down to half width
+        mixed = right ^ round_key
+        mixed = (mixed ^ (mixed >> np.uint64(30))) * self._MIX_1
+        mixed = (mixed ^ (mixed >> np.uint64(27))) * self._MIX_2
+        return (mixed ^ (mixed >> np.uint64(31))) & self.half_mask
+
+    def _encrypt(self, values):
+        left = values >> self.half_bits
+        right = values & self.half_mask
+        for round_key in self.round_keys:
+            left, right = right, left ^ self._round(right, round_key)
+        return (left << self.half_bits) | right
+
+    def __call__(self, indices):
+        values = self._encrypt(np.asarray(indices, dtype=np.uint64))
+        outside = values >= self.size
+        while outside.any():
+            values[outside] = self._encrypt(values[outside])
+            outside = values >= self.size
+        return values.astype(np.int64)
+
+
+# --- Value Parts ---
+# A column is the concatenation of its parts; each part picks one pool entry per row.
+
+class Pick:
+    """
+    Picks a random entry of `pool`.
+
+    Entries are uniform unless `weights` (one per entry) are given; those are
+    turned into a cumulative table once, here, and sampled with a binary
+    search per row.
+    """
+
+    __slots__ = ("pool", "cumulative")
+
+    def __init__(self, pool, weights=None):
+        self.pool = pool
+        self.cumulative = None
+        if weights is not None:
+            if len(weights) != len(pool):
+                raise ValueError("Need exactly one weight per pool entry")
+            cumulative = np.cumsum(np.asarray(weights, dtype=np.float64))
+            self.cumulative = cumulative / cumulative[-1]
+
+    def indices(self, blocks, source_draws):
+        if self.cumulative is None:
+            return blocks.integers(0, len(self.pool))
+        picked = np.searchsorted(self.cumulative, blocks.random(), side="right")
+        return np.minimum(picked, len(self.pool) - 1)
+
+
+class Joined:
+    """
+    Several picks looked up as one part.
+
+    `pool` holds every combination of the parts' pools, pre-joined by
+    build_word_pools.py (the last part varies fastest); the per-part indices
+    are folded into one index into it, so the row values cost a single
+    gather instead of one string concatenation per pick.
+    """
+
+    __slots__ = ("parts", "pool")
+
+    def __init__(self, pool, *parts):
+        expected = int(np.prod([len(part.pool) for part in parts]))
+        if len(pool) != expected:
+            raise ValueError(f"Joined pool {pool.name} has {len(pool)} entries, expected {expected}")
+        self.parts = parts
+        self.pool = pool
+
+    def indices(self, blocks, source_draws):
+        combined = None
+        for part in self.parts:
+            indices = part.indices(blocks, source_draws)
+            combined = indices if combined is None else combined * len(part.pool) + indices
+        return combined
+
+
+class FromSource:
+    """Reuses the indices drawn for part `part` of the source column, looked up in a different pool."""
+
+    __slots__ = ("part", "pool")
+
+    def __init__(self, part, pool):
+        self.part = part
+        self.pool = pool
+
+    def indices(self, blocks, source_draws):
+        return source_draws[self.part]
+
+
+# The "42@gmail.com" part of an email, shared by the independent and derived forms
+_EMAIL_SUFFIX = Joined(_EMAIL_SUFFIXES, Pick(_EMAIL_NUMBERS), Pick(_EMAIL_DOMAINS, weights=EMAIL_DOMAIN_WEIGHTS))
+
+
+FIELD_TYPE_PARTS = {
+    "Full Name": (Pick(_FULL_NAMES),),
+    "Email Address": (Pick(_EMAIL_LOCALS), _EMAIL_SUFFIX),
+    "Phone Number": (Pick(_AREA_CODES[200:]), Pick(_EXCHANGES[200:]), Pick(_LINE_NUMBERS)),
+    "Street Address": (Pick(_HOUSE_NUMBERS[1:]), Joined(_STREETS, Pick(_STREET_NAMES), Pick(_STREET_SUFFIXES, weights=STREET_SUFFIX_WEIGHTS))),
+    "Date of Birth": (),  # Built per field from its age options, see _date_of_birth_parts()
+}
+
+# Types that can follow another column: type -> (source type, parts). An email
+# takes the name drawn for its row as its local part ("Ann Lee" -> "ann.lee42@...").
+DERIVED_FIELD_PARTS = {
+    "Email Address": ("Full Name", (FromSource(0, _EMAIL_LOCALS), _EMAIL_SUFFIX)),
+}
+
+# Value spaces of the types that can be made unique: uniform picks only (see ColumnPlan).
+# A unique email spends its number part on uniqueness, so its local part cannot follow a name.
+UNIQUE_FIELD_PARTS = {
+    "Email Address": (Pick(_EMAIL_LOCALS), Pick(_NUMBERS), Pick(_EMAIL_DOMAINS)),  # ~1 billion values
+    "Phone Number": (Pick(_AREA_CODES[200:]), Pick(_EXCHANGES[200:]), Pick(_LINE_NUMBERS)),  # 6.4 billion
+}
+
+# Options each type accepts (Field.options in schema_model):
+#   source             name of the column to derive from; by default the first
+#                      column of the source type, "" for an independent column
+#   min_age / max_age  ages (whole years, on AGE_REFERENCE_DATE) to draw birth dates for
+#   unique             true to never repeat a value within the table
+FIELD_OPTIONS = {
+    "Full Name": set(),
+    "Email Address": {"source", "unique"},
+    "Phone Number": {"unique"},
+    "Street Address": set(),
+    "Date of Birth": {"min_age", "max_age"},
+}
+
+
+def _birth_date_bounds(min_age, max_age):
+    """First and last birth date (inclusive) of someone aged min_age..max_age on AGE_REFERENCE_DATE."""
+    def years_before(years):
+        try:
+            return AGE_REFERENCE_DATE.replace(year=AGE_REFERENCE_DATE.year - years)
+        except ValueError:  # Feb 29 on a non-leap year
+            return AGE_REFERENCE_DATE.replace(year=AGE_REFERENCE_DATE.year - years, day=28)
+
+    return years_before(max_age + 1) + datetime.timedelta(days=1), years_before(min_age)
+
+
+def _date_of_birth_parts(field_name, options):
+    if "min_age" not in options and "max_age" not in options:
+        first, last = DOB_START, DOB_END
+    else:
+        min_age = options.get("min_age", 0)
+        max_age = options.get("max_age", MAX_AGE)
+        if not (isinstance(min_age, int) and isinstance(max_age, int) and 0 <= min_age <= max_age <= MAX_AGE):
+            raise ValueError(f"Ages for field '{field_name}' must be whole numbers with 0 <= min_age <= max_age <= {MAX_AGE}")
+        first, last = (np.datetime64(day, "D") for day in _birth_date_bounds(min_age, max_age))
+
+    # The dates table is contiguous, so an age range is just a slice of it
+    offset = int((first - _DATES_START).astype(int))
+    count = int((last - first).astype(int)) + 1
+    if offset < 0 or offset + count > len(_DATES):
+        raise ValueError(f"Birth dates for field '{field_name}' fall outside the packed date table")
+    return (Pick(_DATES[offset:offset + count]),)
+
+
+# --- Generation Plans ---
+class ColumnPlan:
+    """
+    How to generate one column: its stream key, value parts and the column it derives from (if any).
+
+    A unique column has only uniform Picks. Instead of drawing them, each
+    global row index is mapped through an IndexPermutation of every
+    combination of the parts and decoded back into one index per part, so
+    no two rows anywhere in the table share a value.
+    """
+
+    __slots__ = ("name", "field_type", "key", "parts", "source", "unique")
+
+    def __init__(self, name, field_type, parts, source=None, unique=False):
+        self.name = name
+        self.field_type = field_type
+        self.key = column_key(name)
+        self.parts = parts
+        self.source = source
+        self.unique = unique
+
+    @property
+    def unique_capacity(self):
+        """How many distinct values the column can produce (only meaningful for unique columns)."""
+        capacity = 1
+        for part in self.parts:
+            capacity *= len(part.pool)
+        return capacity
+
+    @property
+    def dictionary(self):
+        """
+        The pool every value of this column is an entry of, or None when values combine several parts.
+
+        For such columns RecordBatch.codes holds each row's index into this
+        pool, which columnar exporters use as dictionary codes.
+        """
+        if self.unique or len(self.parts) != 1:
+            return None
+        return self.parts[0].pool
+
+    def may_contain(self, characters):
+        """False only if no value of this column can contain any of `characters` (used by exporters to skip escaping)."""
+        return any(part.pool.contains_any(characters) for part in self.parts)
+
+    def generate(self, start, stop, seed, source_draws=None):
+        """Returns (values, drawn indices per part) for rows [start, stop)."""
+        if self.unique:
+            draws = self._unique_draws(start, stop, seed)
+        else:
+            blocks = RandomBlocks(seed, self.key, start, stop)
+            draws = [part.indices(blocks, source_draws) for part in self.parts]
+
+        values = self.parts[0].pool.values[draws[0]]
+        for part, indices in zip(self.parts[1:], draws[1:]):
+            values = values + part.pool.values[indices]
+        return values, draws
+
+    def _unique_draws(self, start, stop, seed):
+        capacity = self.unique_capacity
+        if stop > capacity:
+            raise ValueError(f"Unique field '{self.name}' can only hold {capacity:,} distinct values")
+
+        combined = IndexPermutation(capacity, seed, self.key)(np.arange(start, stop, dtype=np.uint64))
+        draws = []
+        for part in reversed(self.parts):  # The last part varies fastest
+            combined, indices = np.divmod(combined, len(part.pool))
+            draws.append(indices)
+        return draws[::-1]
+
+
+class GenerationPlan:
+    """A compiled schema: its columns in dependency order, ready to generate any row range."""
+
+    __slots__ = ("key", "fields", "field_names", "columns", "by_name", "sources")
+
+    def __init__(self, key, fields, columns):
+        self.key = key
+        self.fields = fields  # ((field name, field type, option items), ...) in schema order
+        self.field_names = [field[0] for field in fields]
+        self.columns = columns  # ColumnPlans, every source before its dependents
+        self.by_name = {column.name: column for column in columns}
+        self.sources = {column.source for column in columns if column.source is not None}
+
+    def generate_rows(self, start, stop, seed):
+        if start < 0 or stop < start:
+            raise ValueError(f"Invalid row range: {start}-{stop}")
+
+        generated = {}
+        draws = {}
+        codes = {}
+        for column in self.columns:
+            values, column_draws = column.generate(start, stop, seed, draws.get(column.source))
+            generated[column.name] = values
+            if column.name in self.sources:
+                draws[column.name] = column_draws
+            if column.dictionary is not None:
+                codes[column.name] = column_draws[0]
+
+        return RecordBatch(start, stop - start, {name: generated[name] for name in self.field_names}, codes)
+
+
+def _order_by_dependency(columns):
+    """Orders columns so every source comes before the columns derived from it, otherwise keeping schema order."""
+    by_name = {column.name: column for column in columns}
+    ordered = []
+    placed = set()
+    visiting = set()
+
+    def place(column):
+        if column.name in placed:
+            return
+        if column.name in visiting:
+            raise ValueError(f"Circular field dependency involving '{column.name}'")
+        visiting.add(column.name)
+        if column.source is not None:
+            place(by_name[column.source])
+        visiting.discard(column.name)
+        placed.add(column.name)
+        ordered.append(column)
+
+    for column in columns:
+        place(column)
+    return ordered
+
+
+def _column_plan(field_name, field_type, options, types_by_name, first_of_type):
+    unknown = set(options) - FIELD_OPTIONS[field_type]
+    if unknown:
+        raise ValueError(f"Unknown option(s) {', '.join(sorted(unknown))} for {field_type} field '{field_name}'")
+
+    if field_type == "Date of Birth":
+        return ColumnPlan(field_name, field_type, _date_of_birth_parts(field_name, options))
+
+    if options.get("unique"):
+        if options.get("source"):
+            raise ValueError(f"Unique field '{field_name}' cannot also derive from '{options['source']}'")
+        return ColumnPlan(field_name, field_type, UNIQUE_FIELD_PARTS[field_type], unique=True)
+
+    if field_type in DERIVED_FIELD_PARTS:
+        source_type, derived_parts = DERIVED_FIELD_PARTS[field_type]
+        source = options.get("source", first_of_type.get(source_type))
+        if source:
+            if types_by_name.get(source) != source_type:
+                raise ValueError(f"Field '{field_name}' can only derive from a {source_type} field, not '{source}'")
+            return ColumnPlan(field_name, field_type, derived_parts, source)
+
+    return ColumnPlan(field_name, field_type, FIELD_TYPE_PARTS[field_type])
+
+
+def _compile(key, fields):
+    types_by_name = {}
+    first_of_type = {}
+    for field_name, field_type, _ in fields:
+        if field_type not in FIELD_TYPE_PARTS:
+            raise ValueError(f"Unknown field type '{field_type}' for field '{field_name}'")
+        if field_name in types_by_name:
+            raise ValueError(f"Duplicate field name '{field_name}'")
+        types_by_name[field_name] = field_type
+        first_of_type.setdefault(field_type, field_name)
+
+    columns = [
+        _column_plan(field_name, field_type, dict(options), types_by_name, first_of_type)
+        for field_name, field_type, options in fields
+    ]
+    return GenerationPlan(key, fields, _order_by_dependency(columns))
+
+
+# Compiled plans, most recently used last
+MAX_CACHED_PLANS = 32
+_plans = OrderedDict()
+_plans_lock = threading.Lock()
+
+
+def _cached_plan(key, fields):
+    with _plans_lock:
+        plan = _plans.get(key)
+        if plan is not None:
+            _plans.move_to_end(key)
+            return plan
+
+    plan = _compile(key, fields)
+    with _plans_lock:
+        _plans[key] = plan
+        while len(_plans) > MAX_CACHED_PLANS:
+            _plans.popitem(last=False)
+    return plan
+
+
+def compile_schema(schema):
+    """
+    Returns the GenerationPlan for a schema, compiling it only on first use.
+
+    `schema` is a schema_model.Schema (cached by its content hash), any
+    sequence of (field name, field type[, options]) tuples (cached by value),
+    or an already compiled plan. Raises ValueError for unknown types and duplicate
+    field names.
+    """
+    if isinstance(schema, GenerationPlan):
+        return schema
+    fields = tuple(_field_spec(field) for field in schema)
+    return _cached_plan(getattr(schema, "content_hash", None) or fields, fields)
+
+
+def _field_spec(field):
+    """(name, type, sorted option items) for a schema_model.Field or a (name, type[, options]) tuple."""
+    if isinstance(field, (tuple, list)):
+        field_name, field_type, *rest = field
+        options = rest[0] if rest else None
+    else:
+        field_name, field_type = field
+        options = getattr(field, "options", None)
+    return field_name, field_type, tuple(sorted((options or {}).items()))
+
+
+# --- Batches ---
+class RecordBatch:
+    """
+    A contiguous range of generated rows, stored column by column.
+
+    `codes` has, for each column with a ColumnPlan.dictionary, the index of
+    every row's value in that pool.
+    """
+
+    __slots__ = ("start", "num_rows", "columns", "codes")
+
+    def __init__(self, start, num_rows, columns, codes=None):
+        self.start = start
+        self.num_rows = num_rows
+        self.columns = columns  # dict: field name -> object array
+        self.codes = codes or {}  # dict: field name -> int64 array
+
+    @property
+    def field_names(self):
+        return list(self.columns)
+
+    def to_rows(self):
+        """Materializes the batch as a list of tuples (only meant for small batches)."""
+        return list(zip(*self.columns.values()))
+
+    @classmethod
+    def concat(cls, batches):
+        """Joins consecutive batches into one, in the given order."""
+        batches = list(batches)
+        if not batches:
+            raise ValueError("Cannot concatenate an empty list of batches")
+        if len(batches) == 1:
+            return batches[0]
+
+        columns = {
+            name: np.concatenate([batch.columns[name] for batch in batches])
+            for name in batches[0].columns
+        }
+        codes = {
+            name: np.concatenate([batch.codes[name] for batch in batches])
+            for name in batches[0].codes
+        }
+        return cls(batches[0].start, sum(batch.num_rows for batch in batches), columns, codes)
+
+
+def new_seed():
+    """Returns a fresh random master seed."""
+    return int(np.random.SeedSequence().entropy % (2 ** 63))
+
+
+def generate_rows(schema, start, stop, seed):
+    """
+    Generates rows [start, stop) of a schema.
+
+    `schema` is anything compile_schema() accepts. The result is a RecordBatch
+    whose columns follow the schema order.
+    """
+    return compile_schema(schema).generate_rows(start, stop, seed)
+
+
+def generate(schema, num_rows, seed=None):
+    """
+    Generates the first `num_rows` rows of a schema as a single RecordBatch.
+
+    Large requests should be streamed with iter_batches() instead; this refuses
+    anything above MAX_MATERIALIZED_ROWS.
+    """
+    _check_materialized_size(num_rows)
+    if seed is None:
+        seed = new_seed()
+    return generate_rows(schema, 0, num_rows, seed)
+
+
+def _check_materialized_size(num_rows):
+    if num_rows > MAX_MATERIALIZED_ROWS:
+        raise ValueError(
+            f"{num_rows:,} rows is too many to hold in memory "
+            f"(limit {MAX_MATERIALIZED_ROWS:,}); stream them with iter_batches()"
+        )
+
+
+# --- Multi-Process Generation ---
+def shard_ranges(num_rows, shard_rows=SHARD_ROWS):
+    """Splits [0, num_rows) into consecutive (start, stop) shards."""
+    if shard_rows <= 0:
+        raise ValueError("shard_rows must be positive")
+    return [(start, min(start + shard_rows, num_rows)) for start in range(0, num_rows, shard_rows)]
+
+
+def _pack_batch(batch):
+    """Encodes each column as one NUL-separated UTF-8 blob, which crosses the process boundary far faster than pickled strings."""
+    return batch.start, batch.num_rows, {
+        name: "\0".join(column.tolist()).encode("utf-8") for name, column in batch.columns.items()
+    }, batch.codes
+
+
+def _unpack_batch(packed):
+    start, num_rows, blobs, codes = packed
+    columns = {}
+    for name, blob in blobs.items():
+        column = np.empty(num_rows, dtype=object)
+        if num_rows:
+            column[:] = blob.decode("utf-8").split("\0")
+        columns[name] = column
+    return RecordBatch(start, num_rows, columns, codes)
+
+
+def _generate_shard(task):
+    """Process-pool entry point: generates one shard and packs (or encodes) it for transfer."""
+    key, fields, start, stop, seed, encode = task
+    plan = _cached_plan(key, fields)
+    batch = plan.generate_rows(start, stop, seed)
+    if encode is None:
+        return _pack_batch(batch)
+    return batch.num_rows, encode(plan, batch)
+
+
+def _run_shards(plan, num_rows, seed, batch_rows, workers, encode):
+    """Yields the results of _generate_shard for consecutive shards, in order, on `workers` processes."""
+    # Imported here: it pulls in multiprocessing, which single-process callers (the CLI) never need
+    from concurrent.futures import ProcessPoolExecutor
+
+    ranges = shard_ranges(num_rows, batch_rows)
+    max_in_flight = 2 * workers
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        pending = deque()
+        for start, stop in ranges:
+            # Workers get the schema itself, not the plan, and compile it once per process
+            pending.append(pool.submit(_generate_shard, (plan.key, plan.fields, start, stop, seed, encode)))
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_batches(schema, num_rows, seed=None, batch_rows=BATCH_ROWS, workers=1):
+    """
+    Yields the rows of a schema as consecutive RecordBatches of `batch_rows` rows.
+
+    Only a bounded number of batches exist at any time (one, or two per worker
+    when `workers` > 1), so memory stays flat regardless of `num_rows`. The
+    batches are identical for any worker count.
+    """
+    if seed is None:
+        seed = new_seed()
+    plan = compile_schema(schema)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or num_rows <= batch_rows:
+        for start, stop in shard_ranges(num_rows, batch_rows):
+            yield plan.generate_rows(start, stop, seed)
+        return
+
+    for packed in _run_shards(plan, num_rows, seed, batch_rows, workers, None):
+        yield _unpack_batch(packed)
+
+
+def iter_encoded_batches(schema, num_rows, encode, seed=None, batch_rows=BATCH_ROWS, workers=1):
+    """
+    Like iter_batches(), but yields (row count, encode(plan, batch)) for each batch.
+
+    With several workers the encoding runs in the worker processes as well,
+    so only the encoded output crosses the process boundary. `encode` must be
+    picklable (a module-level function or an instance of a module-level class).
+    """
+    if seed is None:
+        seed = new_seed()
+    plan = compile_schema(schema)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or num_rows <= batch_rows:
+        for start, stop in shard_ranges(num_rows, batch_rows):
+            batch = plan.generate_rows(start, stop, seed)
+            yield batch.num_rows, encode(plan, batch)
+        return
+
+    yield from _run_shards(plan, num_rows, seed, batch_rows, workers, encode)
+
+
+def generate_parallel(schema, num_rows, seed=None, workers=None, shard_rows=SHARD_ROWS):
+    """
+    Generates `num_rows` rows on a pool of worker processes and joins the shards in order.
+
+    Every shard draws from the same (seed, column, block) streams the
+    single-process path uses, so the result is identical for any number of
+    workers and any shard size.
+    """
+    _check_materialized_size(num_rows)
+    if num_rows == 0:
+        return generate_rows(schema, 0, 0, seed or 0)
+    return RecordBatch.concat(iter_batches(schema, num_rows, seed, batch_rows=shard_rows, workers=workers))
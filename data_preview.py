@@ -0,0 +1,177 @@
+import sys
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QLabel, QPushButton, QTableView, QHeaderView, QAbstractItemView
+)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+from data_generator import compile_schema, new_seed
+from theme import DATA_PREVIEW_SCOPE, apply_theme
+
+
+# --- Lazy Table Model ---
+class PreviewTableModel(QAbstractTableModel):
+    """
+    Read-only table model that generates rows on demand from the seeded engine.
+
+    Rows are produced in pages of PAGE_ROWS and only the most recently used
+    pages are kept, so the cost of a preview depends on what is on screen,
+    not on how many rows the preview claims to have.
+    """
+    PAGE_ROWS = 256
+    MAX_CACHED_PAGES = 12
+
+    def __init__(self, schema, seed, num_rows=1_000_000, parent=None):
+        super().__init__(parent)
+        # Compiled (or fetched from the plan cache) once; every page reuses it
+        self.plan = compile_schema(schema)
+        self.field_names = self.plan.field_names
+        self.seed = seed
+        self.num_rows = num_rows
+        self._pages = OrderedDict()  # page index -> RecordBatch
+
+    # --- Model Interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.num_rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.field_names)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.field_names[section]
+        return str(section + 1)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        row = index.row()
+        page = self._page(row // self.PAGE_ROWS)
+        return page.columns[self.field_names[index.column()]][row - page.start]
+
+    # --- Paging ---
+    def _page(self, page_index):
+        """Returns a generated page, generating it (and evicting the oldest one) if needed."""
+        page = self._pages.get(page_index)
+        if page is not None:
+            self._pages.move_to_end(page_index)
+            return page
+
+        start = page_index * self.PAGE_ROWS
+        stop = min(start + self.PAGE_ROWS, self.num_rows)
+        page = self.plan.generate_rows(start, stop, self.seed)
+
+        self._pages[page_index] = page
+        if len(self._pages) > self.MAX_CACHED_PAGES:
+            self._pages.popitem(last=False)
+        return page
+
+    def prefetch(self, first_row, last_row):
+        """Makes sure the pages covering [first_row, last_row] plus one page either side are ready."""
+        if self.num_rows == 0:
+            return
+        first_page = max(0, first_row // self.PAGE_ROWS - 1)
+        last_page = min((self.num_rows - 1) // self.PAGE_ROWS, last_row // self.PAGE_ROWS + 1)
+        for page_index in range(first_page, last_page + 1):
+            self._page(page_index)
+
+    def set_seed(self, seed):
+        """Switches to a new seed and drops every cached page."""
+        self.beginResetModel()
+        self.seed = seed
+        self._pages.clear()
+        self.endResetModel()
+
+
+# --- Preview Window ---
+class DataPreviewWindow(QMainWindow):
+    ROW_HEIGHT = 32
+
+    def __init__(self, schema, seed=None, num_rows=1_000_000):
+        super().__init__()
+        self.setWindowTitle("Data Generator - Preview")
+        self.setGeometry(140, 140, 1200, 800)
+        self.setObjectName(DATA_PREVIEW_SCOPE)
+        apply_theme()
+
+        self.model = PreviewTableModel(schema, seed if seed is not None else new_seed(), num_rows, self)
+        self._setup_ui()
+
+    def _setup_ui(self):
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+
+        main_layout = QVBoxLayout(main_widget)
+        main_layout.setContentsMargins(30, 20, 30, 30)
+        main_layout.setSpacing(15)
+
+        # --- Header Row (Title, Row Count and Seed, New Seed Button) ---
+        header_layout = QHBoxLayout()
+
+        title_group = QVBoxLayout()
+        title_label = QLabel("Data Preview")
+        title_label.setObjectName("mainTitle")
+
+        self.info_label = QLabel()
+        self.info_label.setObjectName("subTitle")
+        self._update_info_label()
+
+        title_group.addWidget(title_label)
+        title_group.addWidget(self.info_label)
+        header_layout.addLayout(title_group)
+        header_layout.addStretch(1)
+
+        reseed_button = QPushButton("↻ New Seed")
+        reseed_button.setObjectName("previewButton")
+        reseed_button.setCursor(Qt.PointingHandCursor)
+        reseed_button.clicked.connect(self.reseed)
+        header_layout.addWidget(reseed_button)
+
+        main_layout.addLayout(header_layout)
+
+        # --- Table (fixed row heights keep the view from measuring every row) ---
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.setWordWrap(False)
+        self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        self.table_view.verticalScrollBar().valueChanged.connect(self._prefetch_visible_rows)
+
+        main_layout.addWidget(self.table_view)
+
+    def _update_info_label(self):
+        self.info_label.setText(f"{self.model.num_rows:,} rows · seed {self.model.seed}")
+
+    def _prefetch_visible_rows(self):
+        """Warms the pages just above and below the viewport while the user scrolls."""
+        viewport_height = self.table_view.viewport().height()
+        first_row = max(self.table_view.rowAt(0), 0)
+        last_row = self.table_view.rowAt(viewport_height - 1)
+        if last_row < 0:
+            # Past the last row, or no usable viewport yet (layout, minimised): assume a viewport's worth
+            last_row = min(first_row + max(1, viewport_height // self.ROW_HEIGHT), self.model.num_rows - 1)
+        self.model.prefetch(first_row, last_row)
+
+    def reseed(self):
+        """Regenerates the preview with a fresh seed."""
+        self.model.set_seed(new_seed())
+        self._update_info_label()
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    window = DataPreviewWindow([
+        ("full_name", "Full Name"),
+        ("email", "Email Address"),
+        ("phone", "Phone Number"),
+        ("address", "Street Address"),
+        ("date_of_birth", "Date of Birth"),
+    ])
+    window.show()
+    sys.exit(app.exec_())
@@ -1,24 +1,46 @@
 import os
 import sys
 import smtplib
+import threading
 import time
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from PyQt5.QtWidgets import QMessageBox
 
-# Import Firebase Admin SDK
-try:
-    import firebase_admin
-    from firebase_admin import credentials, firestore, auth
-    from firebase_admin import exceptions as firebase_exceptions
-except ImportError:
-    print("Error: 'firebase-admin' is not installed. Please run 'pip install firebase-admin'")
-    sys.exit(1)
+from email_templates import VerificationEmailTemplate
+from firestore_batch import FirestoreWriteBatcher
+from link_cache import VerificationLinkCache
+from mail_queue import MailQueue, smtp_connection_factory
+
+# Firebase Admin SDK modules, imported on first use by _import_firebase()
+# (importing them takes longer than painting the first window)
+firebase_admin = None
+credentials = firestore = auth = firebase_exceptions = None
+
+
+def _import_firebase():
+    """Imports the Firebase Admin SDK into this module's globals."""
+    global firebase_admin, credentials, firestore, auth, firebase_exceptions
+    if firebase_admin is not None:
+        return
+
+    try:
+        from firebase_admin import credentials as _credentials, firestore as _firestore, auth as _auth
+        from firebase_admin import exceptions as _firebase_exceptions
+        import firebase_admin as _firebase_admin
+    except ImportError:
+        raise ImportError("'firebase-admin' is not installed. Please run 'pip install firebase-admin'")
+
+    credentials, firestore, auth = _credentials, _firestore, _auth
+    firebase_exceptions = _firebase_exceptions
+    firebase_admin = _firebase_admin
 
 
 class DatabaseManager:
     """
     Handles all interactions with Firebase with REAL email sending.
+
+    Construction is cheap: the Firebase SDK is imported and connected on a
+    background thread (start_background_init), or on first use at the latest,
+    and SMTP connections are only opened when the first email is sent.
     """
 
     # ⚠️ Replace with your Firebase service account key
@@ -34,31 +56,115 @@ class DatabaseManager:
         'sender_name': 'DataForge'
     }
 
+    # Seconds to wait for the mail queue to deliver a message we report on
+    EMAIL_SEND_TIMEOUT = 60
+    # Seconds to wait for a flushed Firestore write we report on
+    FIRESTORE_WRITE_TIMEOUT = 30
+
     def __init__(self):
-        """Initialize Firebase and test email configuration."""
-        self._initialize_firebase()
+        """Check email configuration; Firebase and SMTP are initialized lazily."""
         self.email_enabled = self._check_email_config()
 
-    def _initialize_firebase(self):
-        """Initialize Firebase Admin SDK."""
-        if not os.path.exists(self.FIREBASE_KEY_PATH):
+        # UID of the signed-in user (set by sign_in_user)
+        self.current_user_uid = None
+
+        # Firebase state, filled in by _initialize_firebase on the init thread
+        self.app = None
+        self._db = None
+        self._init_error = None
+        self._init_thread = None
+        self._init_lock = threading.Lock()
+
+        # Created on first use (see the properties below)
+        self._mail_queue = None
+        self._writer = None
+
+        # Verification email compiled once and reused for every message
+        self.email_template = VerificationEmailTemplate(self.EMAIL_CONFIG['sender_name'],
+                                                        self.EMAIL_CONFIG['sender_email'])
+
+        # Reuses verification links and throttles repeat emails per address
+        self.link_cache = VerificationLinkCache()
+
+    @classmethod
+    def check_firebase_key(cls):
+        """Cheap startup check that the service account key exists; shows an error and exits if not."""
+        if not os.path.exists(cls.FIREBASE_KEY_PATH):
             QMessageBox.critical(None, "Configuration Error",
-                                 f"Firebase key not found at: {self.FIREBASE_KEY_PATH}")
+                                 f"Firebase key not found at: {cls.FIREBASE_KEY_PATH}")
             sys.exit(1)
 
+    # --- Deferred Initialization ---
+    def start_background_init(self):
+        """Starts importing and connecting Firebase on a background thread (idempotent)."""
+        with self._init_lock:
+            if self._init_thread is None:
+                self._init_thread = threading.Thread(target=self._initialize_firebase,
+                                                     name="FirebaseInit", daemon=True)
+                self._init_thread.start()
+
+    def _ensure_initialized(self):
+        """Waits for Firebase to be ready. Returns None, or a user-facing error message if init failed."""
+        self.start_background_init()
+        self._init_thread.join()
+        if self._init_error:
+            return f"❌ Firebase is not available: {self._init_error}"
+        return None
+
+    @property
+    def db(self):
+        error = self._ensure_initialized()
+        if error:
+            raise RuntimeError(error)
+        return self._db
+
+    @property
+    def mail_queue(self):
+        """Pooled, kept-alive SMTP connections with a background send queue (None if email is disabled)."""
+        if self._mail_queue is None and self.email_enabled:
+            with self._init_lock:
+                if self._mail_queue is None:
+                    self._mail_queue = MailQueue(smtp_connection_factory(self.EMAIL_CONFIG))
+        return self._mail_queue
+
+    @property
+    def writer(self):
+        """Groups user/project/schema writes into Firestore batch commits."""
+        if self._writer is None:
+            db = self.db
+            with self._init_lock:
+                if self._writer is None:
+                    self._writer = FirestoreWriteBatcher(db)
+        return self._writer
+
+    def close(self):
+        """Commits pending Firestore writes, flushes queued mail and closes pooled SMTP connections."""
+        if self._writer is not None:
+            self._writer.close()
+        if self._mail_queue is not None:
+            self._mail_queue.close()
+
+    def _initialize_firebase(self):
+        """Initialize Firebase Admin SDK (runs on the init thread, so it must not touch any widgets)."""
+        started = time.perf_counter()
         try:
+            if not os.path.exists(self.FIREBASE_KEY_PATH):
+                raise FileNotFoundError(f"Firebase key not found at: {self.FIREBASE_KEY_PATH}")
+
+            _import_firebase()
+
             cred = credentials.Certificate(self.FIREBASE_KEY_PATH)
             if not firebase_admin._apps:
                 self.app = firebase_admin.initialize_app(cred)
             else:
                 self.app = firebase_admin.get_app()
 
-            self.db = firestore.client()
-            print("✅ Firebase initialized successfully")
+            self._db = firestore.client()
+            print(f"✅ Firebase initialized successfully ({(time.perf_counter() - started) * 1000:.0f} ms, in background)")
 
         except Exception as e:
-            QMessageBox.critical(None, "Firebase Error", f"Could not initialize Firebase: {e}")
-            sys.exit(1)
+            self._init_error = str(e)
+            print(f"❌ Could not initialize Firebase: {e}")
 
     def _check_email_config(self):
         """Check if email is properly configured."""
@@ -76,10 +182,11 @@ class DatabaseManager:
             return False
         return True
 
-    def _send_verification_email(self, email, verification_link):
+    def _send_verification_email(self, email, verification_link, wait=True):
         """
-        Actually sends a verification email via SMTP.
-        Returns True if email was sent successfully.
+        Actually sends a verification email via the pooled SMTP mail queue.
+        Returns True if email was sent successfully. With wait=False the message
+        is only queued (bulk flows), and True means it was accepted for sending.
         """
         if not self.email_enabled:
             print(f"📧 [DEV MODE] Verification link for {email}: {verification_link}")
@@ -87,94 +194,16 @@ class DatabaseManager:
             return False
 
         try:
-            # Create email message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = 'Verify Your Email - DataForge'
-            msg['From'] = f"{self.EMAIL_CONFIG['sender_name']} <{self.EMAIL_CONFIG['sender_email']}>"
-            msg['To'] = email
-
-            # Create HTML email content
-            html = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            </head>
-            <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto;">
-                <div style="background: linear-gradient(135deg, #A68CC8 0%, #8d70b5 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
-                    <h1 style="color: white; margin: 0;">Verify Your Email</h1>
-                </div>
-
-                <div style="background: white; padding: 30px; border-radius: 0 0 10px 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-                    <p>Hello,</p>
-
-                    <p>Thank you for creating an account with <strong>DataForge</strong>!</p>
-
-                    <p>Please verify your email address by clicking the button below:</p>
-
-                    <div style="text-align: center; margin: 30px 0;">
-                        <a href="{verification_link}" 
-                           style="background: #A68CC8; color: white; padding: 12px 30px; 
-                                  text-decoration: none; border-radius: 5px; font-weight: bold;
-                                  display: inline-block;">
-                            Verify Email Address
-                        </a>
-                    </div>
-
-                    <p>Or copy and paste this link into your browser:</p>
-                    <div style="background: #f5f5f5; padding: 15px; border-radius: 5px; margin: 15px 0; word-break: break-all;">
-                        <code style="font-size: 12px;">{verification_link}</code>
-                    </div>
-
-                    <p>This verification link will expire in 24 hours.</p>
-
-                    <p>If you didn't create this account, please ignore this email.</p>
-
-                    <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
-
-                    <p style="color: #666; font-size: 12px;">
-                        If you're having trouble clicking the button, copy and paste the URL above 
-                        into your web browser.
-                    </p>
-                </div>
-
-                <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
-                    <p>© {time.strftime('%Y')} DataForge. All rights reserved.</p>
-                </div>
-            </body>
-            </html>
-            """
-
-            # Plain text version (for email clients that don't support HTML)
-            text = f"""
-            Verify Your Email - DataForge
-
-            Please verify your email address by clicking this link:
-            {verification_link}
-
-            If you can't click the link, copy and paste it into your browser.
-
-            This link will expire in 24 hours.
-
-            If you didn't create this account, please ignore this email.
-            """
-
-            msg.attach(MIMEText(text, 'plain'))
-            msg.attach(MIMEText(html, 'html'))
-
-            # Connect to SMTP server and send email
-            print(f"📤 Connecting to SMTP server: {self.EMAIL_CONFIG['smtp_server']}")
-
-            if self.EMAIL_CONFIG['use_tls']:
-                server = smtplib.SMTP(self.EMAIL_CONFIG['smtp_server'], self.EMAIL_CONFIG['smtp_port'])
-                server.starttls()  # Enable TLS encryption
-            else:
-                server = smtplib.SMTP_SSL(self.EMAIL_CONFIG['smtp_server'], self.EMAIL_CONFIG['smtp_port'])
+            # Render from the precompiled template (only recipient, link and year change per message)
+            message_bytes = self.email_template.render(email, verification_link)
 
-            server.login(self.EMAIL_CONFIG['sender_email'], self.EMAIL_CONFIG['sender_password'])
-            server.send_message(msg)
-            server.quit()
+            # Hand the message to the mail queue, which reuses an open SMTP connection
+            future = self.mail_queue.enqueue(self.EMAIL_CONFIG['sender_email'], [email], message_bytes)
+            if not wait:
+                print(f"📤 Verification email queued for: {email}")
+                return True
+
+            future.result(timeout=self.EMAIL_SEND_TIMEOUT)
 
             print(f"✅ Verification email sent to: {email}")
             return True
@@ -188,7 +217,12 @@ class DatabaseManager:
             return False
 
     def _generate_verification_link(self, email):
-        """Generate a verification link using Firebase Admin SDK."""
+        """Generate a verification link using Firebase Admin SDK (reusing a recently generated one)."""
+        cached_link = self.link_cache.get(email)
+        if cached_link:
+            print(f"🔗 Reusing cached verification link for: {email}")
+            return cached_link
+
         try:
             # Get project ID
             project_id = self.app.project_id if hasattr(self, 'app') else 'fakedatagen'
@@ -219,6 +253,7 @@ class DatabaseManager:
             # Also log the link for testing
             print(f"🔗 Full verification link: {verification_link[:100]}...")
 
+            self.link_cache.put(email, verification_link)
             return verification_link
 
         except firebase_exceptions.FirebaseError as e:
@@ -255,6 +290,10 @@ class DatabaseManager:
         """
         Creates a new user and sends a REAL verification email.
         """
+        error = self._ensure_initialized()
+        if error:
+            return False, error
+
         try:
             # 1. Create user in Firebase Auth
             user = auth.create_user(
@@ -266,7 +305,8 @@ class DatabaseManager:
 
             print(f"✅ User created: {user.uid}")
 
-            # 2. Generate verification link
+            # 2. Generate verification link (never reuse links cached for an earlier account with this email)
+            self.link_cache.invalidate(email)
             verification_link = self._generate_verification_link(email)
 
             if not verification_link:
@@ -274,12 +314,14 @@ class DatabaseManager:
                 print("⚠️  Could not generate verification link, but user was created")
             else:
                 # 3. Send actual verification email
+                self.link_cache.reserve_send(email)
                 email_sent = self._send_verification_email(email, verification_link)
 
                 if not email_sent and self.email_enabled:
+                    self.link_cache.cancel_send(email)
                     print("⚠️  Email sending failed, but user was created")
 
-            # 4. Store user data in Firestore
+            # 4. Store user data in Firestore, right away: sign-up only reports success once it is saved
             user_ref = self.db.collection('users').document(user.uid)
             user_ref.set({
                 'full_name': full_name,
@@ -339,21 +381,32 @@ class DatabaseManager:
         """
         Checks for email verification status.
         """
+        error = self._ensure_initialized()
+        if error:
+            return False, error
+
         try:
             # Fetch user by email
             user = auth.get_user_by_email(email)
 
             if not user.email_verified:
-                # Offer to resend verification
+                # Offer to resend verification, at most once per throttle interval
                 if self.email_enabled:
+                    if not self.link_cache.reserve_send(email):
+                        return False, (
+                            "❌ Email not verified!\n\n"
+                            "📧 A verification email was sent recently.\n"
+                            "Please check your inbox and spam folder."
+                        )
+
                     verification_link = self._generate_verification_link(email)
-                    if verification_link:
-                        self._send_verification_email(email, verification_link)
+                    if verification_link and self._send_verification_email(email, verification_link):
                         return False, (
                             "❌ Email not verified!\n\n"
                             "📧 A new verification email has been sent.\n"
                             "Please check your inbox and spam folder."
                         )
+                    self.link_cache.cancel_send(email)
 
                 return False, (
                     "❌ Email not verified!\n\n"
@@ -361,6 +414,7 @@ class DatabaseManager:
                     "Or contact support for assistance."
                 )
 
+            self.current_user_uid = user.uid
             return True, "✅ Sign in successful! Welcome back!"
 
         except firebase_exceptions.NotFoundError:
@@ -371,12 +425,20 @@ class DatabaseManager:
 
     def resend_verification_email(self, email):
         """Resends verification email."""
+        error = self._ensure_initialized()
+        if error:
+            return False, error
+
         try:
             user = auth.get_user_by_email(email)
 
             if user.email_verified:
                 return True, "✅ Email is already verified!"
 
+            if self.email_enabled and not self.link_cache.reserve_send(email):
+                wait_seconds = self.link_cache.seconds_until_send_allowed(email)
+                return False, f"⏳ A verification email was sent recently. Please wait {wait_seconds}s before resending."
+
             verification_link = self._generate_verification_link(email)
 
             if verification_link:
@@ -385,12 +447,14 @@ class DatabaseManager:
                     if email_sent:
                         return True, f"📧 Verification email resent to {email}"
                     else:
+                        self.link_cache.cancel_send(email)
                         return False, "❌ Failed to send email"
                 else:
                     print(f"\n🔗 RESEND VERIFICATION LINK FOR {email}:")
                     print(verification_link)
                     return True, "📧 Check console for verification link"
             else:
+                self.link_cache.cancel_send(email)
                 return False, "❌ Failed to generate verification link"
 
         except firebase_exceptions.NotFoundError:
@@ -398,6 +462,157 @@ class DatabaseManager:
         except Exception as e:
             return False, f"❌ Error: {e}"
 
+    # --- Projects and Schemas ---
+    def list_projects_page(self, owner_uid, page_size=20, cursor=None):
+        """
+        Fetches one page of a user's projects, most recently updated first.
+
+        Uses a cursor-based query (start_after the last document of the previous
+        page), so each page costs the same no matter how deep the user scrolls.
+        Returns (True, (projects, next_cursor)) where next_cursor is None on the
+        last page, or (False, message). Needs the composite Firestore index
+        projects(owner_uid ASC, updated_at DESC).
+        """
+        error = self._ensure_initialized()
+        if error:
+            return False, error
+
+        try:
+            query = (self.db.collection('projects')
+                     .where('owner_uid', '==', owner_uid)
+                     .order_by('updated_at', direction=firestore.Query.DESCENDING)
+                     .limit(page_size + 1))  # One extra document tells us whether another page exists
+            if cursor is not None:
+                query = query.start_after(cursor)
+
+            snapshots = list(query.stream())
+            has_more = len(snapshots) > page_size
+            snapshots = snapshots[:page_size]
+
+            projects = []
+            for snapshot in snapshots:
+                data = snapshot.to_dict()
+                updated_at = data.get('updated_at')
+                projects.append({
+                    'id': snapshot.id,
+                    'title': data.get('title', ''),
+                    'description': data.get('description', ''),
+                    'date': f"{updated_at.month}/{updated_at.day}/{updated_at.year}" if updated_at else ''
+                })
+
+            next_cursor = snapshots[-1] if has_more else None
+            return True, (projects, next_cursor)
+
+        except Exception as e:
+            return False, f"❌ Could not load projects: {e}"
+
+    def save_project(self, owner_uid, project_id, title, description):
+        """Creates or updates a project document (committed through the write batcher)."""
+        error = self._ensure_initialized()
+        if error:
+            return False, error
+
+        try:
+            project_ref = self.db.collection('projects').document(project_id)
+            future = self.writer.set(project_ref, {
+                'owner_uid': owner_uid,
+                'title': title,
+                'description': description,
+                'updated_at': firestore.SERVER_TIMESTAMP
+            }, merge=True)
+            self.writer.flush()
+            future.result(timeout=self.FIRESTORE_WRITE_TIMEOUT)
+            return True, f"✅ Project '{title}' saved."
+        except Exception as e:
+            return False, f"❌ Could not save project: {e}"
+
+    def delete_project(self, project_id):
+        """Deletes a project document (committed through the write batcher)."""
+        error = self._ensure_initialized()
+        if error:
+            return False, error
+
+        try:
+            future = self.writer.delete(self.db.collection('projects').document(project_id))
+            self.writer.flush()
+            future.result(timeout=self.FIRESTORE_WRITE_TIMEOUT)
+            return True, "🗑️ Project deleted."
+        except Exception as e:
+            return False, f"❌ Could not delete project: {e}"
+
+    def save_schema(self, project_id, schema, wait=True):
+        """
+        Saves a schema_model.Schema and one document per field, batched into as few commits as possible.
+        Field documents left over from a longer earlier version are deleted in the same batches.
+        Each field document keeps the field's generation options, and the schema document
+        its content hash, so a reloaded schema generates exactly the same data.
+        """
+        error = self._ensure_initialized()
+        if error:
+            return False, error
+
+        schema_name = schema.name
+        try:
+            schema_ref = self.db.collection('projects').document(project_id).collection('schemas').document(schema_name)
+            futures = [self.writer.set(schema_ref, {
+                'name': schema_name,
+                'version': schema.to_dict()['version'],
+                'field_count': len(schema),
+                'content_hash': schema.content_hash,
+                'updated_at': firestore.SERVER_TIMESTAMP
+            })]
+            fields_ref = schema_ref.collection('fields')
+            field_ids = set()
+            for position, field in enumerate(schema.fields):
+                field_id = f"{position:05d}"
+                field_ids.add(field_id)
+                futures.append(self.writer.set(fields_ref.document(field_id), {
+                    'name': field.name,
+                    'type': field.type,
+                    'options': field.options,
+                    'position': position
+                }))
+            # A shorter schema saved over a longer one must not leave the old trailing fields behind
+            for field_ref in fields_ref.list_documents():
+                if field_ref.id not in field_ids:
+                    futures.append(self.writer.delete(field_ref))
+
+            if wait:
+                self.writer.flush()
+                for future in futures:
+                    future.result(timeout=self.FIRESTORE_WRITE_TIMEOUT)
+            return True, f"✅ Schema '{schema_name}' saved."
+
+        except Exception as e:
+            return False, f"❌ Could not save schema: {e}"
+
+    def store_user_profiles(self, profiles):
+        """
+        Bulk-provisions Firestore user documents from (uid, full_name, email) tuples.
+        Thousands of profiles become a handful of batch commits.
+        """
+        error = self._ensure_initialized()
+        if error:
+            return False, error
+
+        try:
+            futures = [
+                self.writer.set(self.db.collection('users').document(uid), {
+                    'full_name': full_name,
+                    'email': email,
+                    'created_at': firestore.SERVER_TIMESTAMP,
+                    'auth_uid': uid,
+                    'email_verified': False
+                })
+                for uid, full_name, email in profiles
+            ]
+            self.writer.flush()
+            for future in futures:
+                future.result(timeout=self.FIRESTORE_WRITE_TIMEOUT)
+            return True, f"✅ {len(futures)} user profiles stored."
+        except Exception as e:
+            return False, f"❌ Could not store user profiles: {e}"
+
 
 # If you were to run this file alone for testing, you'd need to mock the QApplication:
 if __name__ == '__main__':
@@ -408,7 +623,12 @@ if __name__ == '__main__':
 
     # Initialize the database manager for testing purposes
     try:
+        DatabaseManager.check_firebase_key()
         db_manager = DatabaseManager()
+        error = db_manager._ensure_initialized()
+        if error:
+            print(error)
+            sys.exit(1)
         print("\nDatabaseManager initialized successfully.")
 
         # Test configuration
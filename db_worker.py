@@ -0,0 +1,72 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class TaskSignals(QObject):
+    """Signals of a single background call; they are delivered on the GUI thread."""
+    finished = pyqtSignal(object)  # The call's return value
+    failed = pyqtSignal(str)  # The exception message if the call raised
+
+
+class DatabaseTask(QRunnable):
+    """Runs one callable on a QThreadPool thread and reports back through TaskSignals."""
+
+    def __init__(self, fn, args, kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+
+class DatabaseExecutor(QObject):
+    """
+    Runs DatabaseManager calls off the GUI thread.
+
+    Every DatabaseManager method does network I/O (Firebase Auth, Firestore,
+    SMTP), so the UI submits calls here by method name and gets the result back
+    through a callback on the GUI thread. Several calls can be in flight at once.
+    """
+
+    def __init__(self, db_manager, max_threads=8, parent=None):
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._in_flight = set()  # Keeps TaskSignals alive until their result is delivered
+
+    def submit(self, method_name, *args, on_result=None, on_error=None, **kwargs):
+        """
+        Calls db_manager.<method_name>(*args, **kwargs) on a worker thread.
+
+        `on_result` receives the return value and `on_error` the message of any
+        exception; both run on the GUI thread. Returns the task's TaskSignals.
+        """
+        task = DatabaseTask(getattr(self.db_manager, method_name), args, kwargs)
+        signals = task.signals
+        self._in_flight.add(signals)
+
+        if on_result is not None:
+            signals.finished.connect(on_result)
+        if on_error is not None:
+            signals.failed.connect(on_error)
+        signals.finished.connect(lambda _result: self._in_flight.discard(signals))
+        signals.failed.connect(lambda _message: self._in_flight.discard(signals))
+
+        self.pool.start(task)
+        return signals
+
+    def pending_count(self):
+        """Number of submitted calls whose result has not been delivered yet."""
+        return len(self._in_flight)
+
+    def wait_for_done(self, msecs=-1):
+        """Blocks until every running call has returned (used on shutdown)."""
+        return self.pool.waitForDone(msecs)
@@ -0,0 +1,201 @@
+import html
+import re
+import secrets
+import textwrap
+import time
+from email import policy
+from email.message import EmailMessage
+
+
+class CompiledTemplate:
+    """
+    A template parsed once into pre-encoded byte literals and named slots.
+
+    Placeholders are written as {{name}}. Rendering only joins the cached
+    literals with the slot values, so no parsing or encoding of the static
+    text happens per message.
+    """
+
+    PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+
+    __slots__ = ("_literals", "_slots")
+
+    def __init__(self, source):
+        pieces = self.PLACEHOLDER.split(source)
+        # split() alternates literal, slot name, literal, ...
+        self._literals = [piece.encode("ascii") for piece in pieces[0::2]]
+        self._slots = pieces[1::2]
+
+    @property
+    def slot_names(self):
+        return set(self._slots)
+
+    def render(self, values):
+        """Joins the literals with the given slot values (bytes)."""
+        parts = [self._literals[0]]
+        for slot, literal in zip(self._slots, self._literals[1:]):
+            parts.append(values[slot])
+            parts.append(literal)
+        return b"".join(parts)
+
+
+# --- Verification Email Content ---
+VERIFICATION_SUBJECT = "Verify Your Email - DataForge"
+
+# Kept to plain ASCII (entities instead of symbols) so the parts can be sent as 7bit without re-encoding
+VERIFICATION_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+</head>
+<body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333; max-width: 600px; margin: 0 auto;">
+    <div style="background: linear-gradient(135deg, #A68CC8 0%, #8d70b5 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
+        <h1 style="color: white; margin: 0;">Verify Your Email</h1>
+    </div>
+
+    <div style="background: white; padding: 30px; border-radius: 0 0 10px 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+        <p>Hello,</p>
+
+        <p>Thank you for creating an account with <strong>DataForge</strong>!</p>
+
+        <p>Please verify your email address by clicking the button below:</p>
+
+        <div style="text-align: center; margin: 30px 0;">
+            <a href="{{link_html}}"
+               style="background: #A68CC8; color: white; padding: 12px 30px;
+                      text-decoration: none; border-radius: 5px; font-weight: bold;
+                      display: inline-block;">
+                Verify Email Address
+            </a>
+        </div>
+
+        <p>Or copy and paste this link into your browser:</p>
+        <div style="background: #f5f5f5; padding: 15px; border-radius: 5px; margin: 15px 0; word-break: break-all;">
+            <code style="font-size: 12px;">{{link_html}}</code>
+        </div>
+
+        <p>This verification link will expire in 24 hours.</p>
+
+        <p>If you didn't create this account, please ignore this email.</p>
+
+        <hr style="border: none; border-top: 1px solid #eee; margin: 30px 0;">
+
+        <p style="color: #666; font-size: 12px;">
+            If you're having trouble clicking the button, copy and paste the URL above
+            into your web browser.
+        </p>
+    </div>
+
+    <div style="text-align: center; margin-top: 20px; color: #999; font-size: 12px;">
+        <p>&copy; {{year}} DataForge. All rights reserved.</p>
+    </div>
+</body>
+</html>
+"""
+
+VERIFICATION_TEXT = """
+Verify Your Email - DataForge
+
+Please verify your email address by clicking this link:
+{{link}}
+
+If you can't click the link, copy and paste it into your browser.
+
+This link will expire in 24 hours.
+
+If you didn't create this account, please ignore this email.
+"""
+
+
+class VerificationEmailTemplate:
+    """
+    Renders complete verification emails as raw MIME bytes.
+
+    The whole multipart/alternative document (headers, boundaries, part
+    headers, plain-text and HTML bodies) is compiled once; per message only
+    the recipient, the link and the year are filled in. Addresses or links
+    that are not plain ASCII fall back to building the message with the
+    email package.
+    """
+
+    def __init__(self, sender_name, sender_email, subject=VERIFICATION_SUBJECT):
+        self.sender = f"{sender_name} <{sender_email}>"
+        self.subject = subject
+        self.boundary = f"==============={secrets.token_hex(16)}=="
+
+        self._year = None
+        self._year_bytes = b""
+
+        html_body = self._normalize(VERIFICATION_HTML)
+        text_body = self._normalize(VERIFICATION_TEXT)
+
+        document = "\r\n".join([
+            f"Content-Type: multipart/alternative; boundary=\"{self.boundary}\"",
+            "MIME-Version: 1.0",
+            f"Subject: {subject}",
+            f"From: {self.sender}",
+            "To: {{to}}",
+            "",
+            f"--{self.boundary}",
+            "Content-Type: text/plain; charset=\"us-ascii\"",
+            "MIME-Version: 1.0",
+            "Content-Transfer-Encoding: 7bit",
+            "",
+            text_body,
+            f"--{self.boundary}",
+            "Content-Type: text/html; charset=\"us-ascii\"",
+            "MIME-Version: 1.0",
+            "Content-Transfer-Encoding: 7bit",
+            "",
+            html_body,
+            f"--{self.boundary}--",
+            "",
+        ])
+        self._compiled = CompiledTemplate(document)
+
+    @staticmethod
+    def _normalize(body):
+        """Dedents a body and switches it to CRLF line endings, as SMTP expects."""
+        return "\r\n".join(textwrap.dedent(body).strip("\n").split("\n"))
+
+    def _year_value(self):
+        year = time.strftime('%Y')
+        if year != self._year:
+            self._year = year
+            self._year_bytes = year.encode("ascii")
+        return self._year_bytes
+
+    def render(self, recipient, verification_link):
+        """Returns the complete message for one recipient as bytes, ready for sendmail()."""
+        if "\r" in recipient or "\n" in recipient:
+            raise ValueError(f"Invalid recipient address: {recipient!r}")
+        if not (recipient.isascii() and verification_link.isascii()):
+            return self._render_with_email_package(recipient, verification_link)
+
+        link = verification_link.encode("ascii")
+        return self._compiled.render({
+            "to": recipient.encode("ascii"),
+            "link": link,
+            "link_html": html.escape(verification_link, quote=True).encode("ascii"),
+            "year": self._year_value(),
+        })
+
+    def _render_with_email_package(self, recipient, verification_link):
+        """Slow path for non-ASCII addresses or links."""
+        year = time.strftime('%Y')
+
+        def fill(source, link_html):
+            body = textwrap.dedent(source).strip("\n")
+            return body.replace("{{link_html}}", link_html).replace("{{link}}", verification_link).replace("{{year}}", year)
+
+        # The modern API encodes a non-ASCII address so that it still parses back as that address
+        msg = EmailMessage(policy=policy.SMTP)
+        msg['Subject'] = self.subject
+        msg['From'] = self.sender
+        msg['To'] = recipient
+        msg.set_content(fill(VERIFICATION_TEXT, verification_link), cte='quoted-printable')
+        msg.add_alternative(fill(VERIFICATION_HTML, html.escape(verification_link, quote=True)), subtype='html',
+                            cte='quoted-printable')
+        return msg.as_bytes()
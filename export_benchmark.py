@@ -0,0 +1,92 @@
+"""
+Export throughput benchmark: encoding and end-to-end export speed next to raw disk bandwidth.
+
+Encoding is timed on pre-generated batches (no disk involved), the export
+is timed writing a real file, and disk bandwidth is measured by writing
+as many bytes as the export produced to the same directory. Every figure
+is in MB/s of output (for the Arrow formats, encoding is measured in MB/s
+of uncompressed Arrow data).
+
+    python export_benchmark.py [--rows 1000000] [--format csv] [--compression zstd] [--workers 1] [--dir /tmp]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from data_generator import BATCH_ROWS, compile_schema, iter_batches
+from compressed_stream import CODECS, COMPRESSION_EXTENSIONS
+from exporters import ArrowBatchWriter, EXPORT_FORMATS, export
+from schema_model import Schema
+
+BENCHMARK_SCHEMA = Schema([
+    ("Name", "Full Name"),
+    ("Email", "Email Address"),
+    ("Phone", "Phone Number"),
+    ("Address", "Street Address"),
+    ("Birthday", "Date of Birth"),
+], name="Benchmark")
+
+
+def measure_encoding(format, num_rows):
+    """Returns MB/s for encoding already generated batches."""
+    writer_class, _ = EXPORT_FORMATS[format]
+    plan = compile_schema(BENCHMARK_SCHEMA)
+    writer = writer_class(None, plan)
+    batches = list(iter_batches(plan, min(num_rows, 4 * BATCH_ROWS), seed=1))
+
+    started = time.perf_counter()
+    encoded = [writer.encode_batch(batch) for batch in batches]
+    seconds = time.perf_counter() - started
+    return sum(data.nbytes if hasattr(data, "nbytes") else len(data) for data in encoded) / 1e6 / seconds
+
+
+def measure_disk(directory, total_bytes, chunk_bytes=4 << 20):
+    """Returns MB/s for writing `total_bytes` in `chunk_bytes`-sized writes, flushed to disk."""
+    chunk = os.urandom(chunk_bytes)
+    with tempfile.NamedTemporaryFile(dir=directory) as f:
+        started = time.perf_counter()
+        written = 0
+        while written < total_bytes:
+            f.write(chunk)
+            written += len(chunk)
+        f.flush()
+        os.fsync(f.fileno())
+        return written / 1e6 / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure export throughput against disk bandwidth.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="csv")
+    parser.add_argument("--compression", choices=sorted(CODECS), help="Compress the export (sizes are then compressed bytes)")
+    parser.add_argument("--workers", type=int, default=1, help="Generator processes (0 = one per CPU)")
+    parser.add_argument("--dir", default=tempfile.gettempdir(), help="Where the test files are written")
+    args = parser.parse_args()
+    if args.compression and issubclass(EXPORT_FORMATS[args.format][0], ArrowBatchWriter):
+        parser.error(f"{args.format} files are compressed internally and can't take --compression")
+
+    encode_rate = measure_encoding(args.format, args.rows)
+
+    _, extension = EXPORT_FORMATS[args.format]
+    if args.compression:
+        extension += next(ext for ext, codec in COMPRESSION_EXTENSIONS.items() if codec == args.compression)
+    path = os.path.join(args.dir, f"export_benchmark{extension}")
+    try:
+        result = export(BENCHMARK_SCHEMA, path, args.rows, format=args.format, seed=1, workers=args.workers)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+    disk_rate = measure_disk(args.dir, result.bytes_written)
+
+    print(f"{args.format}{' + ' + args.compression if args.compression else ''}, {args.rows:,} rows, {result.bytes_written / 1e6:.0f} MB, "
+          f"{args.workers or os.cpu_count()} worker(s)")
+    print(f"Encoding only:     {encode_rate:8.0f} MB/s")
+    print(f"End-to-end export: {result.megabytes_per_second:8.0f} MB/s")
+    print(f"Disk write:        {disk_rate:8.0f} MB/s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
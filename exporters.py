@@ -0,0 +1,737 @@
+"""
+Writes generated schemas to files, straight from the engine's columnar batches.
+
+Every writer turns a whole RecordBatch into one bytes buffer and hands it to
+the stream in a single write() call. Rows are never formatted one at a time:
+a batch is laid out as a 2-D object array of values and separators and
+joined once. Escaping is only paid for columns whose word pools can produce
+characters that need it (see ColumnPlan.may_contain), which for the built-in
+field types is none of them.
+
+With several workers, batches are encoded in the generator processes too
+(see BatchEncoder), so the exporting process only writes bytes.
+
+Parquet and Arrow IPC go through pyarrow, which is only imported when one
+of those formats is used. SQL output comes as INSERT scripts, PostgreSQL
+COPY data (text or binary), or straight into a SQLite database (load_sqlite).
+Any of the text and COPY formats can be compressed on the fly (see
+compressed_stream.CompressedStream).
+"""
+import json
+import os
+import re
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+
+import numpy as np
+
+from compressed_stream import CompressedStream, compression_for_path
+from data_generator import BATCH_ROWS, compile_schema, iter_batches, iter_encoded_batches
+
+# pyarrow modules, imported on first use by _import_pyarrow() (only the Arrow formats need them)
+pa = pq = None
+
+
+def _import_pyarrow():
+    """Imports pyarrow into this module's globals."""
+    global pa, pq
+    if pa is not None:
+        return
+
+    try:
+        import pyarrow as _pa
+        import pyarrow.ipc  # noqa: F401 (makes _pa.ipc available)
+        import pyarrow.parquet as _pq
+    except ImportError:
+        raise ImportError("'pyarrow' is not installed. Please run 'pip install pyarrow'")
+
+    pa, pq = _pa, _pq
+
+
+class BatchWriter:
+    """
+    Base class: encodes RecordBatches of a compiled plan and writes each as one buffer.
+
+    Call begin() before the first batch and close() after the last. A writer
+    without a stream can still encode_batch(), which is how worker processes use it.
+    """
+
+    def __init__(self, stream, plan):
+        self.stream = stream
+        self.plan = plan
+        self.bytes_written = 0
+        self.rows_written = 0
+
+    def begin(self):
+        """Writes anything the format needs before the first batch (e.g. a header row)."""
+
+    def write_batch(self, batch):
+        self.write_encoded(batch.num_rows, self.encode_batch(batch))
+
+    def write_encoded(self, num_rows, data):
+        """Writes a batch already encoded by encode_batch() (possibly in another process)."""
+        self._write(data)
+        self.rows_written += num_rows
+
+    def encode_batch(self, batch):
+        raise NotImplementedError
+
+    def close(self):
+        """Writes anything the format needs after the last batch (the stream stays open)."""
+
+    def _write(self, data):
+        if data:
+            self.stream.write(data)
+            self.bytes_written += len(data)
+
+
+def _interleave(columns, separators, num_rows, prefix=None):
+    """
+    Joins the columns row by row into one string: [prefix] column_0 separators[0] column_1 separators[1] ...
+
+    The cells are laid out in a 2-D object array and joined in a single call,
+    so the cost is one C-level join rather than one format call per row.
+    """
+    first = 0 if prefix is None else 1
+    cells = np.empty((num_rows, first + 2 * len(columns)), dtype=object)
+    if prefix is not None:
+        cells[:, 0] = prefix
+    for i, (column, separator) in enumerate(zip(columns, separators)):
+        cells[:, first + 2 * i] = column
+        cells[:, first + 2 * i + 1] = separator
+    return "".join(cells.ravel().tolist())
+
+
+class CsvWriter(BatchWriter):
+    """RFC 4180 CSV with a header row; values are quoted only when they need it."""
+
+    SPECIAL_CHARACTERS = '",\r\n'
+
+    def __init__(self, stream, plan, line_terminator="\n", header=True):
+        super().__init__(stream, plan)
+        self.line_terminator = line_terminator
+        self.header = header
+        self.quoted = [plan.by_name[name].may_contain(self.SPECIAL_CHARACTERS) for name in plan.field_names]
+        self.separators = [","] * (len(plan.field_names) - 1) + [line_terminator]
+
+    def begin(self):
+        if self.header:
+            self._write((",".join(map(self._quote, self.plan.field_names)) + self.line_terminator).encode("utf-8"))
+
+    def _quote(self, value):
+        if any(character in value for character in self.SPECIAL_CHARACTERS):
+            return '"' + value.replace('"', '""') + '"'
+        return value
+
+    def encode_batch(self, batch):
+        if not batch.num_rows:
+            return b""
+        columns = []
+        for name, quoted in zip(self.plan.field_names, self.quoted):
+            column = batch.columns[name]
+            columns.append([self._quote(value) for value in column] if quoted else column)
+        return _interleave(columns, self.separators, batch.num_rows).encode("utf-8")
+
+
+class JsonLinesWriter(BatchWriter):
+    """One JSON object per line, keys in schema order."""
+
+    # Characters json.dumps would escape (besides the other control characters, checked below)
+    SPECIAL_CHARACTERS = '"\\' + "".join(map(chr, range(0x20)))
+
+    def __init__(self, stream, plan):
+        super().__init__(stream, plan)
+        self.escaped = [plan.by_name[name].may_contain(self.SPECIAL_CHARACTERS) for name in plan.field_names]
+
+        # Row layout: opening_0 value_0 opening_1 value_1 ... value_n closing. Plain string
+        # values are wrapped in the quotes carried by these separators; escaped ones bring their own.
+        self.openings = []
+        previous_close = ""
+        for i, (name, escaped) in enumerate(zip(plan.field_names, self.escaped)):
+            quote = "" if escaped else '"'
+            self.openings.append(previous_close + ("{" if i == 0 else ",") + json.dumps(name, ensure_ascii=False) + ":" + quote)
+            previous_close = quote
+        self.closing = previous_close + "}\n"
+
+    def encode_batch(self, batch):
+        if not batch.num_rows:
+            return b""
+        columns = []
+        for name, escaped in zip(self.plan.field_names, self.escaped):
+            column = batch.columns[name]
+            columns.append([json.dumps(value, ensure_ascii=False) for value in column] if escaped else column)
+
+        # The first opening starts each row; every other one follows the previous value
+        return _interleave(columns, self.openings[1:] + [self.closing], batch.num_rows,
+                           prefix=self.openings[0]).encode("utf-8")
+
+
+# Columns drawn from a single pool of at most this many entries are written dictionary-encoded
+DICTIONARY_MAX_ENTRIES = 1 << 16
+
+_EPOCH = np.datetime64("1970-01-01", "D")
+
+
+def _date_offset(column, epoch):
+    """
+    For a Date of Birth column, the days from `epoch` to the first date of its pool, else None.
+
+    The dates pool is contiguous, so a row's date is that offset plus its
+    RecordBatch.codes entry, with no string parsing.
+    """
+    if column.field_type != "Date of Birth" or column.dictionary is None:
+        return None
+    return int((np.datetime64(column.dictionary[0], "D") - epoch).astype(int))
+
+
+class ArrowBatchWriter(BatchWriter):
+    """
+    Base class of the pyarrow formats: encode_batch() returns a pyarrow.RecordBatch.
+
+    Columns drawn from one small pool (see ColumnPlan.dictionary) become
+    dictionary arrays over that pool, built straight from the batch's codes
+    without hashing any strings, and Date of Birth columns become date32.
+    Every batch shares the same dictionaries, so files never carry more
+    than one copy of them per row group.
+    """
+
+    def __init__(self, stream, plan, compression="zstd"):
+        _import_pyarrow()
+        super().__init__(stream, plan)
+        self.compression = compression
+        self._writer = None
+        self._dictionaries = {}  # field name -> pool as a pyarrow string array
+        self._date_offsets = {}  # field name -> days from 1970-01-01 to the pool's first date
+
+        fields = []
+        for name in plan.field_names:
+            column = plan.by_name[name]
+            pool = column.dictionary
+            date_offset = _date_offset(column, _EPOCH)
+            if date_offset is not None:
+                self._date_offsets[name] = date_offset
+                arrow_type = pa.date32()
+            elif pool is not None and len(pool) <= DICTIONARY_MAX_ENTRIES:
+                self._dictionaries[name] = pa.array(pool.values, pa.string())
+                arrow_type = pa.dictionary(pa.int32(), pa.string())
+            else:
+                arrow_type = pa.string()
+            fields.append(pa.field(name, arrow_type, nullable=False))
+        self.schema = pa.schema(fields)
+
+    def encode_batch(self, batch):
+        arrays = []
+        for name in self.plan.field_names:
+            if name in self._date_offsets:
+                days = (batch.codes[name] + self._date_offsets[name]).astype(np.int32)
+                arrays.append(pa.array(days, pa.date32()))
+            elif name in self._dictionaries:
+                codes = pa.array(batch.codes[name].astype(np.int32))
+                arrays.append(pa.DictionaryArray.from_arrays(codes, self._dictionaries[name]))
+            else:
+                arrays.append(pa.array(batch.columns[name], pa.string()))
+        return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self.bytes_written = self.stream.tell()
+
+
+class ParquetWriter(ArrowBatchWriter):
+    """
+    Parquet, streamed one row group at a time.
+
+    Encoded batches are collected until they add up to `row_group_rows` rows
+    and then written as a row group, so only one row group is held in memory.
+    Every column is dictionary-encoded per row group; Parquet falls back to
+    plain pages by itself once a column's dictionary grows too large.
+    """
+
+    def __init__(self, stream, plan, compression="zstd", row_group_rows=4 * BATCH_ROWS):
+        super().__init__(stream, plan, compression)
+        self.row_group_rows = row_group_rows
+        self._pending = []
+        self._pending_rows = 0
+
+    def begin(self):
+        self._writer = pq.ParquetWriter(self.stream, self.schema, compression=self.compression,
+                                        use_dictionary=True)
+
+    def write_encoded(self, num_rows, data):
+        self._pending.append(data)
+        self._pending_rows += num_rows
+        self.rows_written += num_rows
+        if self._pending_rows >= self.row_group_rows:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            table = pa.Table.from_batches(self._pending, self.schema)
+            self._writer.write_table(table, row_group_size=self.row_group_rows)
+            self._pending = []
+            self._pending_rows = 0
+
+    def close(self):
+        if self._writer is not None:
+            self._flush()
+        super().close()
+
+
+class ArrowIpcWriter(ArrowBatchWriter):
+    """Arrow IPC file format (Feather v2), one record batch per engine batch."""
+
+    def begin(self):
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        self._writer = pa.ipc.new_file(self.stream, self.schema, options=options)
+
+    def write_encoded(self, num_rows, data):
+        self._writer.write_batch(data)
+        self.rows_written += num_rows
+
+
+# --- SQL ---
+SQL_DIALECTS = ("sqlite", "postgres", "mysql")
+DEFAULT_TABLE = "generated_data"
+
+
+def _check_dialect(dialect):
+    if dialect not in SQL_DIALECTS:
+        raise ValueError(f"Unknown SQL dialect '{dialect}'; choose one of {', '.join(SQL_DIALECTS)}")
+
+
+def quote_identifier(name, dialect="postgres"):
+    """Quotes a table or column name for `dialect`."""
+    if dialect == "mysql":
+        return "`" + name.replace("`", "``") + "`"
+    return '"' + name.replace('"', '""') + '"'
+
+
+def create_table_sql(schema, table=DEFAULT_TABLE, dialect="postgres"):
+    """Returns a CREATE TABLE IF NOT EXISTS statement for a schema (unique fields get a UNIQUE constraint)."""
+    _check_dialect(dialect)
+    plan = compile_schema(schema)
+    definitions = []
+    for name in plan.field_names:
+        column = plan.by_name[name]
+        if column.field_type == "Date of Birth":
+            sql_type = "DATE"
+        else:
+            sql_type = "VARCHAR(255)" if dialect == "mysql" else "TEXT"
+        definition = f"{quote_identifier(name, dialect)} {sql_type} NOT NULL"
+        if column.unique:
+            definition += " UNIQUE"
+        definitions.append(definition)
+    return f"CREATE TABLE IF NOT EXISTS {quote_identifier(table, dialect)} (\n    " + ",\n    ".join(definitions) + "\n);\n"
+
+
+def copy_statement(schema, table=DEFAULT_TABLE, binary=False):
+    """Returns the PostgreSQL COPY ... FROM STDIN statement that reads PostgresCopyWriter / PostgresBinaryCopyWriter output."""
+    plan = compile_schema(schema)
+    columns = ", ".join(quote_identifier(name) for name in plan.field_names)
+    return f"COPY {quote_identifier(table)} ({columns}) FROM STDIN" + (" (FORMAT binary)" if binary else "") + ";\n"
+
+
+class SqlInsertWriter(BatchWriter):
+    """
+    A script of multi-row INSERT statements with `rows_per_statement` rows each.
+
+    Statements never span batches, so the last one of each batch may be
+    shorter. With `create_table` the script starts with create_table_sql(),
+    and with `transaction` the inserts are wrapped in BEGIN / COMMIT, which
+    makes loading it into SQLite many times faster.
+    """
+
+    def __init__(self, stream, plan, table=DEFAULT_TABLE, dialect="sqlite", rows_per_statement=1000,
+                 create_table=True, transaction=True):
+        super().__init__(stream, plan)
+        _check_dialect(dialect)
+        if rows_per_statement < 1:
+            raise ValueError("rows_per_statement must be at least 1")
+        self.table = table
+        self.dialect = dialect
+        self.rows_per_statement = rows_per_statement
+        self.create_table = create_table
+        self.transaction = transaction
+
+        # MySQL also treats backslashes in string literals as escapes
+        self.special_characters = "'\\" if dialect == "mysql" else "'"
+        self.escaped = [plan.by_name[name].may_contain(self.special_characters) for name in plan.field_names]
+        columns = ", ".join(quote_identifier(name, dialect) for name in plan.field_names)
+        self.statement_start = f"INSERT INTO {quote_identifier(table, dialect)} ({columns}) VALUES\n"
+
+        # Row layout as in JsonLinesWriter: plain values are wrapped in the quotes these carry
+        self.openings = []
+        previous_close = ""
+        for i, escaped in enumerate(self.escaped):
+            quote = "" if escaped else "'"
+            self.openings.append(previous_close + ("(" if i == 0 else ", ") + quote)
+            previous_close = quote
+        self.closing = previous_close + ")"
+
+    def _literal(self, value):
+        if self.dialect == "mysql":
+            value = value.replace("\\", "\\\\")
+        return "'" + value.replace("'", "''") + "'"
+
+    def begin(self):
+        header = ""
+        if self.create_table:
+            header += create_table_sql(self.plan, self.table, self.dialect)
+        if self.transaction:
+            header += "BEGIN;\n"
+        self._write(header.encode("utf-8"))
+
+    def encode_batch(self, batch):
+        num_rows = batch.num_rows
+        if not num_rows:
+            return b""
+        columns = []
+        for name, escaped in zip(self.plan.field_names, self.escaped):
+            column = batch.columns[name]
+            columns.append([self._literal(value) for value in column] if escaped else column)
+
+        # Every rows_per_statement-th row starts a statement, and the row before it (and the batch's last) ends one
+        starts = np.full(num_rows, self.openings[0], dtype=object)
+        starts[::self.rows_per_statement] = self.statement_start + self.openings[0]
+        ends = np.full(num_rows, self.closing + ",\n", dtype=object)
+        ends[self.rows_per_statement - 1::self.rows_per_statement] = self.closing + ";\n"
+        ends[-1] = self.closing + ";\n"
+        return _interleave(columns, self.openings[1:] + [ends], num_rows, prefix=starts).encode("utf-8")
+
+    def close(self):
+        if self.transaction:
+            self._write(b"COMMIT;\n")
+
+
+class PostgresCopyWriter(BatchWriter):
+    """
+    PostgreSQL COPY text format: one tab-separated line per row.
+
+    The output is the data only, for COPY ... FROM STDIN (see
+    copy_statement()). With `statement`, it is wrapped into a psql script
+    that runs that statement itself.
+    """
+
+    SPECIAL_CHARACTERS = "\\\t\n\r"
+    _ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+    def __init__(self, stream, plan, table=DEFAULT_TABLE, statement=False):
+        super().__init__(stream, plan)
+        self.table = table
+        self.statement = statement
+        self.escaped = [plan.by_name[name].may_contain(self.SPECIAL_CHARACTERS) for name in plan.field_names]
+        self.separators = ["\t"] * (len(plan.field_names) - 1) + ["\n"]
+
+    def begin(self):
+        if self.statement:
+            self._write(copy_statement(self.plan, self.table).encode("utf-8"))
+
+    def encode_batch(self, batch):
+        if not batch.num_rows:
+            return b""
+        columns = []
+        for name, escaped in zip(self.plan.field_names, self.escaped):
+            column = batch.columns[name]
+            columns.append([value.translate(self._ESCAPES) for value in column] if escaped else column)
+        return _interleave(columns, self.separators, batch.num_rows).encode("utf-8")
+
+    def close(self):
+        if self.statement:
+            self._write(b"\\.\n")
+
+
+_PG_EPOCH = np.datetime64("2000-01-01", "D")
+
+
+class PostgresBinaryCopyWriter(BatchWriter):
+    """
+    PostgreSQL COPY binary format, for COPY ... FROM STDIN (FORMAT binary).
+
+    Text columns are sent as UTF-8 and Date of Birth columns as dates (days
+    since 2000-01-01, taken from the batch's codes), matching the types of
+    create_table_sql(). Tuples are laid out for a whole batch at once with
+    NumPy rather than packed one field at a time.
+    """
+
+    SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+
+    def __init__(self, stream, plan):
+        super().__init__(stream, plan)
+        self._date_offsets = {}  # field name -> days from 2000-01-01 to the pool's first date
+        for name in plan.field_names:
+            date_offset = _date_offset(plan.by_name[name], _PG_EPOCH)
+            if date_offset is not None:
+                self._date_offsets[name] = date_offset
+
+    def begin(self):
+        # Flags and header extension length, both zero
+        self._write(self.SIGNATURE + struct.pack(">ii", 0, 0))
+
+    def encode_batch(self, batch):
+        num_rows = batch.num_rows
+        if not num_rows:
+            return b""
+        fields = []
+        for name in self.plan.field_names:
+            if name in self._date_offsets:
+                days = (batch.codes[name] + self._date_offsets[name]).astype(">i4")
+                fields.append((np.full(num_rows, 4, dtype=np.int64), days.tobytes()))
+            else:
+                fields.append(_utf8_column(batch.columns[name]))
+        return _binary_tuples(fields, num_rows)
+
+    def close(self):
+        self._write(struct.pack(">h", -1))
+
+
+def _utf8_column(values):
+    """Returns (byte length of each value, all values as one UTF-8 blob)."""
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    blob = "".join(values.tolist()).encode("utf-8")
+    if len(blob) != lengths.sum():
+        # Not all ASCII, so character counts are not byte counts
+        lengths = np.fromiter((len(value.encode("utf-8")) for value in values), dtype=np.int64, count=len(values))
+    return lengths, blob
+
+
+def _binary_tuples(fields, num_rows):
+    """
+    Lays out COPY binary tuples for [(lengths, blob), ...] fields: per row an int16
+    field count, then each field as an int32 byte length followed by its bytes.
+    """
+    row_sizes = np.full(num_rows, 2, dtype=np.int64)
+    for lengths, _ in fields:
+        row_sizes += 4 + lengths
+    row_starts = np.cumsum(row_sizes) - row_sizes
+
+    out = np.empty(int(row_sizes.sum()), dtype=np.uint8)
+    out[row_starts[:, None] + np.arange(2)] = np.frombuffer(struct.pack(">h", len(fields)), dtype=np.uint8)
+    position = row_starts + 2
+    for lengths, blob in fields:
+        out[position[:, None] + np.arange(4)] = lengths.astype(">i4").view(np.uint8).reshape(num_rows, 4)
+        position += 4
+        data = np.frombuffer(blob, dtype=np.uint8)
+        # Byte j of the blob belongs to value i: it goes to that value's position plus j minus the value's start
+        value_starts = np.cumsum(lengths) - lengths
+        out[np.repeat(position - value_starts, lengths) + np.arange(len(data))] = data
+        position += lengths
+    return out.tobytes()
+
+
+# Stand-ins for PostgreSQL's COPY input parsers, for checking exported data without a server
+_COPY_TEXT_ESCAPES = {"t": "\t", "n": "\n", "r": "\r", "b": "\b", "f": "\f", "v": "\v"}
+
+
+def parse_copy_text(data):
+    """Parses COPY text-format bytes into a list of tuples of strings (None for \\N)."""
+    rows = []
+    for line in data.decode("utf-8").split("\n"):
+        if not line or line == "\\.":
+            continue
+        rows.append(tuple(
+            None if value == "\\N" else re.sub(r"\\(.)", lambda m: _COPY_TEXT_ESCAPES.get(m[1], m[1]), value)
+            for value in line.split("\t")
+        ))
+    return rows
+
+
+def parse_copy_binary(data):
+    """Parses COPY binary-format bytes into a list of tuples of raw field bytes (None for NULL)."""
+    view = memoryview(data)
+    if bytes(view[:len(PostgresBinaryCopyWriter.SIGNATURE)]) != PostgresBinaryCopyWriter.SIGNATURE:
+        raise ValueError("Not PostgreSQL binary COPY data")
+    offset = len(PostgresBinaryCopyWriter.SIGNATURE)
+    _, extension_length = struct.unpack_from(">ii", view, offset)
+    offset += 8 + extension_length
+
+    rows = []
+    while True:
+        (count,) = struct.unpack_from(">h", view, offset)
+        offset += 2
+        if count == -1:
+            break
+        row = []
+        for _ in range(count):
+            (length,) = struct.unpack_from(">i", view, offset)
+            offset += 4
+            if length == -1:
+                row.append(None)
+                continue
+            row.append(bytes(view[offset:offset + length]))
+            offset += length
+        rows.append(tuple(row))
+    if offset != len(view):
+        raise ValueError("Trailing data after the COPY trailer")
+    return rows
+
+
+# (writer class, options, plan key) -> stream-less writer, per process, most recently used last
+MAX_CACHED_ENCODERS = 16
+_encoders = OrderedDict()
+_encoders_lock = threading.Lock()
+
+
+class BatchEncoder:
+    """
+    A picklable `encode(plan, batch)` callable for data_generator.iter_encoded_batches().
+
+    Each process builds one stream-less writer per plan and reuses it, so the
+    per-column setup (escaping checks, separators) is not repeated per batch.
+    """
+
+    __slots__ = ("writer_class", "options")
+
+    def __init__(self, writer_class, options=None):
+        self.writer_class = writer_class
+        self.options = tuple(sorted((options or {}).items()))
+
+    def __call__(self, plan, batch):
+        key = (self.writer_class, self.options, plan.key)
+        with _encoders_lock:
+            writer = _encoders.get(key)
+            if writer is not None:
+                _encoders.move_to_end(key)
+        if writer is None:
+            writer = self.writer_class(None, plan, **dict(self.options))
+            with _encoders_lock:
+                _encoders[key] = writer
+                while len(_encoders) > MAX_CACHED_ENCODERS:
+                    _encoders.popitem(last=False)
+        return writer.encode_batch(batch)
+
+    def __reduce__(self):
+        return BatchEncoder, (self.writer_class, dict(self.options))
+
+
+# Format name -> (writer class, file extension)
+EXPORT_FORMATS = {
+    "csv": (CsvWriter, ".csv"),
+    "jsonl": (JsonLinesWriter, ".jsonl"),
+    "parquet": (ParquetWriter, ".parquet"),
+    "arrow": (ArrowIpcWriter, ".arrow"),
+    "sql": (SqlInsertWriter, ".sql"),
+    "pgcopy": (PostgresCopyWriter, ".copy"),
+    "pgbinary": (PostgresBinaryCopyWriter, ".pgcopy"),
+}
+
+
+def format_for_path(path):
+    """Guesses the export format from a file name's extension, looking past a compression extension (data.csv.gz)."""
+    if compression_for_path(path):
+        path = os.path.splitext(path)[0]
+    extension = os.path.splitext(path)[1].lower()
+    for name, (_, format_extension) in EXPORT_FORMATS.items():
+        if extension == format_extension:
+            return name
+    raise ValueError(f"Can't tell the export format of '{path}'; choose one of {', '.join(EXPORT_FORMATS)}")
+
+
+class ExportResult:
+    __slots__ = ("path", "rows", "bytes_written", "seconds")
+
+    def __init__(self, path, rows, bytes_written, seconds):
+        self.path = path
+        self.rows = rows
+        self.bytes_written = bytes_written
+        self.seconds = seconds
+
+    @property
+    def megabytes_per_second(self):
+        return self.bytes_written / 1e6 / self.seconds if self.seconds else 0.0
+
+    def __repr__(self):
+        return (f"ExportResult({self.rows:,} rows, {self.bytes_written / 1e6:.1f} MB in {self.seconds:.2f} s, "
+                f"{self.megabytes_per_second:.0f} MB/s)")
+
+
+def export(schema, path, num_rows, format=None, seed=None, workers=1, batch_rows=BATCH_ROWS, progress=None,
+           codec=None, codec_level=None, codec_threads=None, **options):
+    """
+    Generates `num_rows` rows of a schema into the file at `path` and returns an ExportResult.
+
+    `format` is a key of EXPORT_FORMATS (guessed from the extension by
+    default) and `options` are passed on to its writer. Rows are streamed
+    batch by batch, so memory use does not grow with `num_rows`. `progress`,
+    if given, is called with the number of rows written after every batch.
+
+    `codec` compresses the whole file as a stream: "gzip", "zstd" or "lz4"
+    (guessed from a .gz, .zst or .lz4 extension by default), compressed on
+    `codec_threads` threads (one per CPU by default). ExportResult.bytes_written
+    is the size of the file as written, after compression. Parquet and Arrow
+    files take no codec; they compress internally, set by their writer's own
+    `compression` option.
+    """
+    format = format or format_for_path(path)
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{format}'; choose one of {', '.join(EXPORT_FORMATS)}")
+    writer_class, _ = EXPORT_FORMATS[format]
+    codec = codec or compression_for_path(path)
+    if codec and issubclass(writer_class, ArrowBatchWriter):
+        raise ValueError(f"{format} files are compressed internally; choose their codec with the compression option")
+    plan = compile_schema(schema)
+    if not plan.field_names:
+        raise ValueError("The schema has no fields to export")
+
+    started = time.perf_counter()
+    encode = BatchEncoder(writer_class, options)
+    with open(path, "wb") as file:
+        compressed = CompressedStream(file, codec, codec_level, codec_threads) if codec else None
+        with compressed or nullcontext(file) as stream:
+            writer = writer_class(stream, plan, **options)
+            writer.begin()
+            for rows, data in iter_encoded_batches(plan, num_rows, encode, seed, batch_rows=batch_rows, workers=workers):
+                writer.write_encoded(rows, data)
+                if progress is not None:
+                    progress(writer.rows_written)
+            writer.close()
+        bytes_written = file.tell()
+    return ExportResult(path, writer.rows_written, bytes_written, time.perf_counter() - started)
+
+
+def load_sqlite(schema, database, num_rows, table=DEFAULT_TABLE, seed=None, workers=1, batch_rows=BATCH_ROWS,
+                progress=None):
+    """
+    Generates `num_rows` rows of a schema straight into a SQLite table and returns an ExportResult.
+
+    `database` is a file path or an open sqlite3.Connection. The table is
+    created if it does not exist, and every batch goes in with one
+    executemany() call, all inside a single transaction: either every row
+    is loaded or, on any error, none are.
+    """
+    plan = compile_schema(schema)
+    if not plan.field_names:
+        raise ValueError("The schema has no fields to export")
+    columns = ", ".join(quote_identifier(name, "sqlite") for name in plan.field_names)
+    insert = (f"INSERT INTO {quote_identifier(table, 'sqlite')} ({columns}) "
+              f"VALUES ({', '.join('?' * len(plan.field_names))})")
+
+    started = time.perf_counter()
+    connection = sqlite3.connect(database) if isinstance(database, (str, os.PathLike)) else database
+    rows_written = 0
+    try:
+        connection.execute("BEGIN")
+        try:
+            connection.execute(create_table_sql(plan, table, "sqlite"))
+            for batch in iter_batches(plan, num_rows, seed, batch_rows=batch_rows, workers=workers):
+                connection.executemany(insert, zip(*(batch.columns[name].tolist() for name in plan.field_names)))
+                rows_written += batch.num_rows
+                if progress is not None:
+                    progress(rows_written)
+            connection.commit()
+        except BaseException:
+            connection.rollback()
+            raise
+    finally:
+        if connection is not database:
+            connection.close()
+
+    # A connection passed in has no path to report
+    path = os.fspath(database) if connection is not database else None
+    size = os.path.getsize(path) if path is not None and os.path.exists(path) else 0
+    return ExportResult(path, rows_written, size, time.perf_counter() - started)
@@ -0,0 +1,109 @@
+"""
+Headless generator: loads a schema saved by the Schema Builder and writes N rows of it to a file.
+
+Only the generation engine and the exporters are imported, never PyQt5 or
+firebase_admin, so it runs on CI machines with no display and no
+credentials. The same schema, seed and row count always produce the same
+file, whatever the worker count.
+
+    python fakedatagen.py SCHEMA --rows N --output PATH [--format csv] [--seed 42] [--workers 4]
+                          [--compression zstd] [--table name] [--dialect postgres]
+
+The format (and compression) are guessed from the output's extension:
+.csv, .jsonl, .parquet, .arrow, .sql, .copy, .pgcopy, .sqlite / .db, plus
+.gz, .zst or .lz4 on top of the text formats.
+"""
+import argparse
+import os
+import sys
+
+from compressed_stream import CODECS
+from data_generator import new_seed
+from exporters import ArrowBatchWriter, EXPORT_FORMATS, SQL_DIALECTS, export, format_for_path, load_sqlite
+from schema_model import Schema
+
+SQLITE_FORMAT = "sqlite"
+SQLITE_EXTENSIONS = (".sqlite", ".db")
+
+# Formats whose writers take a table name (pgcopy output then becomes a psql script running COPY into it)
+TABLE_FORMATS = {"sql", "pgcopy", SQLITE_FORMAT}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="fakedatagen", description="Generate fake data from a saved schema.")
+    parser.add_argument("schema", help="Schema file saved by the Schema Builder (.json or .dfschema)")
+    parser.add_argument("-n", "--rows", type=int, required=True, help="Number of rows to generate")
+    parser.add_argument("-o", "--output", required=True, help="File to write")
+    parser.add_argument("-f", "--format", choices=sorted(EXPORT_FORMATS) + [SQLITE_FORMAT],
+                        help="Output format (default: from the output's extension)")
+    parser.add_argument("-s", "--seed", type=int, help="Master seed (default: random, and printed)")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Generator processes (0 = one per CPU)")
+    parser.add_argument("-c", "--compression", choices=sorted(CODECS),
+                        help="Compress the output (default: from a .gz, .zst or .lz4 extension)")
+    parser.add_argument("--table", help="Table name for sql, pgcopy and sqlite output (pgcopy then includes the COPY statement)")
+    parser.add_argument("--dialect", choices=SQL_DIALECTS, help="SQL dialect for sql output (default: sqlite)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Don't print a summary")
+    args = parser.parse_args(argv)
+
+    if args.rows < 0:
+        parser.error("--rows can't be negative")
+    if args.workers < 0:
+        parser.error("--workers can't be negative")
+    if args.format is None:
+        if args.output.lower().endswith(SQLITE_EXTENSIONS):
+            args.format = SQLITE_FORMAT
+        else:
+            try:
+                args.format = format_for_path(args.output)
+            except ValueError as e:
+                parser.error(f"{e} (or pass --format)")
+    if args.table and args.format not in TABLE_FORMATS:
+        parser.error(f"--table only applies to {', '.join(sorted(TABLE_FORMATS))} output")
+    if args.dialect and args.format != "sql":
+        parser.error("--dialect only applies to sql output")
+    if args.compression and args.format == SQLITE_FORMAT:
+        parser.error("sqlite output can't be compressed")
+    if args.compression and issubclass(EXPORT_FORMATS[args.format][0], ArrowBatchWriter):
+        parser.error(f"{args.format} files are compressed internally and can't take --compression")
+    return args
+
+
+def run(args):
+    """Generates the requested file and returns its ExportResult."""
+    schema = Schema.from_file(args.schema)
+    schema.validate()
+
+    if args.format == SQLITE_FORMAT:
+        options = {"table": args.table} if args.table else {}
+        return load_sqlite(schema, args.output, args.rows, seed=args.seed, workers=args.workers, **options)
+
+    options = {}
+    if args.table:
+        options["table"] = args.table
+        if args.format == "pgcopy":
+            options["statement"] = True
+    if args.dialect:
+        options["dialect"] = args.dialect
+    return export(schema, args.output, args.rows, format=args.format, seed=args.seed, workers=args.workers,
+                  codec=args.compression, **options)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.seed is None:
+        args.seed = new_seed()
+
+    try:
+        result = run(args)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    if not args.quiet:
+        print(f"✅ {result.rows:,} rows written to {os.path.abspath(args.output)} ({args.format}, seed {args.seed}): "
+              f"{result.bytes_written / 1e6:.1f} MB in {result.seconds:.2f} s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+import threading
+from concurrent.futures import Future
+
+
+class FirestoreWriteBatcher:
+    """
+    Collects Firestore writes and commits them as WriteBatches.
+
+    set/update/delete only queue the write and return a Future that resolves
+    once the batch containing it has been committed. Pending writes are
+    committed in chunks of up to MAX_BATCH_OPS (Firestore's per-batch limit)
+    whenever that many are queued, every `flush_interval` seconds from a
+    background thread, or on flush(). Works with any client exposing
+    batch() (the real Firestore client, the emulator, or an in-memory fake).
+    """
+
+    MAX_BATCH_OPS = 500
+
+    def __init__(self, db, max_ops=MAX_BATCH_OPS, flush_interval=1.0):
+        if not 0 < max_ops <= self.MAX_BATCH_OPS:
+            raise ValueError(f"max_ops must be between 1 and {self.MAX_BATCH_OPS}")
+        self.db = db
+        self.max_ops = max_ops
+        self.flush_interval = flush_interval
+
+        self._pending = []  # (operation, reference, args, kwargs, future)
+        self._lock = threading.Lock()
+        self._commit_lock = threading.Lock()  # Keeps commits in submission order
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, name="FirestoreWriteBatcher", daemon=True)
+        self._flusher.start()
+
+    # --- Queuing Writes ---
+    def set(self, reference, data, merge=False):
+        return self._add("set", reference, (data,), {"merge": merge})
+
+    def update(self, reference, data):
+        return self._add("update", reference, (data,), {})
+
+    def delete(self, reference):
+        return self._add("delete", reference, (), {})
+
+    def _add(self, operation, reference, args, kwargs):
+        if self._closed.is_set():
+            raise RuntimeError("Write batcher is closed")
+
+        future = Future()
+        with self._lock:
+            self._pending.append((operation, reference, args, kwargs, future))
+            full = len(self._pending) >= self.max_ops
+        if full:
+            self.flush()
+        return future
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._pending)
+
+    # --- Committing ---
+    def flush(self):
+        """Commits every pending write; returns the number of writes committed."""
+        committed = 0
+        with self._commit_lock:
+            while True:
+                with self._lock:
+                    chunk = self._pending[:self.max_ops]
+                    del self._pending[:self.max_ops]
+                if not chunk:
+                    return committed
+                committed += self._commit(chunk)
+
+    def _commit(self, chunk):
+        # Building the batch can fail too (bad data or reference); the chunk is already
+        # out of _pending, so every failure must reach its futures
+        try:
+            batch = self.db.batch()
+            for operation, reference, args, kwargs, _ in chunk:
+                getattr(batch, operation)(reference, *args, **kwargs)
+            batch.commit()
+        except Exception as e:
+            print(f"❌ Firestore batch commit failed ({len(chunk)} writes): {e}")
+            for *_, future in chunk:
+                future.set_exception(e)
+            return 0
+
+        for *_, future in chunk:
+            future.set_result(True)
+        return len(chunk)
+
+    def _flush_periodically(self):
+        while not self._closed.wait(self.flush_interval):
+            if self.pending_count():
+                self.flush()
+
+    def close(self):
+        """Stops the background flusher and commits whatever is still pending."""
+        self._closed.set()
+        self._flusher.join()
+        self.flush()
@@ -0,0 +1,63 @@
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtCore import Qt, QDirIterator, QResource
+
+# Process-wide caches (QPixmaps belong to the GUI thread, so only use these from it)
+_source_pixmaps = {}  # path -> decoded QPixmap
+_scaled_pixmaps = {}  # (path, width, height, transform mode) -> scaled QPixmap
+
+
+def source_pixmap(path):
+    """Decodes an image file or Qt resource once and returns the shared QPixmap."""
+    pixmap = _source_pixmaps.get(path)
+    if pixmap is None:
+        pixmap = QPixmap(path)
+        _source_pixmaps[path] = pixmap
+    return pixmap
+
+
+def cached_pixmap(path, width, height=None, transform=Qt.SmoothTransformation):
+    """
+    Returns `path` scaled to fit width x height (keeping the aspect ratio).
+
+    Every distinct (path, size, transform mode) is decoded and scaled exactly
+    once; later calls return the same QPixmap. A missing file yields a null
+    pixmap, which is cached as well.
+    """
+    height = width if height is None else height
+    key = (path, width, height, transform)
+
+    pixmap = _scaled_pixmaps.get(key)
+    if pixmap is None:
+        source = source_pixmap(path)
+        pixmap = source if source.isNull() else source.scaled(width, height, Qt.KeepAspectRatio, transform)
+        _scaled_pixmaps[key] = pixmap
+    return pixmap
+
+
+def preload_resource_bundle(prefix=":/icons", sizes=(), rcc_path=None):
+    """
+    Decodes every image under a Qt resource prefix up front.
+
+    `rcc_path` optionally registers a compiled binary resource bundle first
+    (pyrcc5 -binary). Each image is also pre-scaled to every (width, height)
+    in `sizes`. Returns the number of images loaded.
+    """
+    if rcc_path is not None and not QResource.registerResource(rcc_path):
+        print(f"⚠️  Could not register resource bundle: {rcc_path}")
+        return 0
+
+    loaded = 0
+    iterator = QDirIterator(prefix, QDirIterator.Subdirectories)
+    while iterator.hasNext():
+        path = iterator.next()
+        if source_pixmap(path).isNull():
+            continue
+        for width, height in sizes:
+            cached_pixmap(path, width, height)
+        loaded += 1
+    return loaded
+
+
+def clear_cache():
+    _source_pixmaps.clear()
+    _scaled_pixmaps.clear()
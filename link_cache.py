@@ -0,0 +1,93 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class VerificationLinkCache:
+    """
+    In-process cache of verification links keyed by email, with per-address send throttling.
+
+    Links are reused for `ttl` seconds so repeated sign-in or resend attempts
+    do not each cost an Admin API round-trip; the least recently used entries
+    are evicted beyond `max_entries`. Independently, at most one verification
+    email per address is allowed every `min_send_interval` seconds. The cache
+    is shared by the database worker threads, so every method takes a lock.
+    """
+
+    def __init__(self, ttl=30 * 60, max_entries=10000, min_send_interval=60, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.min_send_interval = min_send_interval
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._links = OrderedDict()  # email -> (link, expires at)
+        self._last_sent = OrderedDict()  # email -> time of the last send
+
+    @staticmethod
+    def _key(email):
+        return email.strip().lower()
+
+    # --- Links ---
+    def get(self, email):
+        """Returns a cached, unexpired link for the address, or None."""
+        key = self._key(email)
+        with self._lock:
+            entry = self._links.get(key)
+            if entry is None:
+                return None
+            link, expires_at = entry
+            if self.clock() >= expires_at:
+                del self._links[key]
+                return None
+            self._links.move_to_end(key)
+            return link
+
+    def put(self, email, link):
+        key = self._key(email)
+        with self._lock:
+            self._links[key] = (link, self.clock() + self.ttl)
+            self._links.move_to_end(key)
+            while len(self._links) > self.max_entries:
+                self._links.popitem(last=False)
+
+    def invalidate(self, email):
+        """Forgets the cached link and send history for an address."""
+        key = self._key(email)
+        with self._lock:
+            self._links.pop(key, None)
+            self._last_sent.pop(key, None)
+
+    # --- Send Throttling ---
+    def seconds_until_send_allowed(self, email):
+        """Seconds until another email may go to this address (0 if allowed now)."""
+        key = self._key(email)
+        with self._lock:
+            last_sent = self._last_sent.get(key)
+            if last_sent is None:
+                return 0
+            return max(0, int(last_sent + self.min_send_interval - self.clock() + 0.999))
+
+    def reserve_send(self, email):
+        """
+        Claims the send slot for an address.
+
+        Returns False if an email went out within the throttle interval.
+        Otherwise records the send and returns True; call cancel_send() if the
+        send then fails, so the user can retry right away.
+        """
+        key = self._key(email)
+        with self._lock:
+            now = self.clock()
+            last_sent = self._last_sent.get(key)
+            if last_sent is not None and now - last_sent < self.min_send_interval:
+                return False
+            self._last_sent[key] = now
+            self._last_sent.move_to_end(key)
+            while len(self._last_sent) > self.max_entries:
+                self._last_sent.popitem(last=False)
+            return True
+
+    def cancel_send(self, email):
+        with self._lock:
+            self._last_sent.pop(self._key(email), None)
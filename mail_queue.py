@@ -0,0 +1,250 @@
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import Future
+
+
+def smtp_connection_factory(config):
+    """
+    Returns a function that opens an authenticated SMTP connection from an EMAIL_CONFIG dict.
+
+    TLS and login are the expensive part of sending mail; the MailQueue pays
+    them once per pooled connection instead of once per message.
+    """
+    def connect():
+        if config['use_tls']:
+            server = smtplib.SMTP(config['smtp_server'], config['smtp_port'], timeout=30)
+        else:
+            server = smtplib.SMTP_SSL(config['smtp_server'], config['smtp_port'], timeout=30)
+
+        try:
+            if config['use_tls']:
+                server.starttls()  # Enable TLS encryption
+            if config.get('sender_password'):
+                server.login(config['sender_email'], config['sender_password'])
+        except Exception:
+            server.close()  # Don't leak the socket of a connection that failed TLS or login
+            raise
+        return server
+
+    return connect
+
+
+class OutboundMessage:
+    """A fully rendered message waiting in the queue."""
+
+    __slots__ = ("sender", "recipients", "data", "future", "attempts")
+
+    def __init__(self, sender, recipients, data):
+        self.sender = sender
+        self.recipients = list(recipients)
+        self.data = data
+        self.future = Future()
+        self.attempts = 0
+
+
+class SMTPConnectionPool:
+    """
+    Keeps a few authenticated SMTP connections open between sends.
+
+    Idle connections are checked with NOOP before reuse and closed once they
+    have been idle longer than `idle_timeout` seconds.
+    """
+
+    def __init__(self, connect, size=2, idle_timeout=120.0):
+        self.connect = connect
+        self.idle_timeout = idle_timeout
+        self._idle = queue.LifoQueue()  # (connection, last used time)
+        self._slots = threading.BoundedSemaphore(size)
+
+    def acquire(self):
+        """Returns a live connection, opening a new one if no idle connection is usable."""
+        self._slots.acquire()
+        try:
+            while True:
+                try:
+                    server, last_used = self._idle.get_nowait()
+                except queue.Empty:
+                    return self.connect()
+
+                if time.monotonic() - last_used > self.idle_timeout:
+                    self._close(server)
+                    continue
+                try:
+                    if server.noop()[0] == 250:
+                        return server
+                except smtplib.SMTPException:
+                    pass
+                except OSError:
+                    pass
+                self._close(server)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, server, broken=False):
+        """Returns a connection to the pool, or closes it if it failed mid-send."""
+        if broken:
+            self._close(server)
+        else:
+            self._idle.put((server, time.monotonic()))
+        self._slots.release()
+
+    def close_all(self):
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._close(server)
+
+    @staticmethod
+    def _close(server):
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+class MailQueue:
+    """
+    Background outbound mail queue backed by an SMTPConnectionPool.
+
+    Worker threads take up to `batch_size` queued messages at a time and send
+    them over one pooled connection. A dropped connection is reopened and the
+    unsent messages are retried with exponential backoff; messages the server
+    rejects outright fail immediately. enqueue() returns a Future that
+    resolves to True once the message has been accepted by the server.
+    """
+
+    # Errors that mean the connection is unusable (retry on a fresh one)
+    CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError)
+
+    def __init__(self, connect, workers=2, batch_size=50, max_retries=3, backoff=1.0, idle_timeout=120.0):
+        self.pool = SMTPConnectionPool(connect, size=workers, idle_timeout=idle_timeout)
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+
+        self._queue = queue.Queue()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"MailQueue-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def enqueue(self, sender, recipients, data):
+        """Queues a rendered message (bytes) and returns its Future."""
+        if self._closed:
+            raise RuntimeError("Mail queue is closed")
+        message = OutboundMessage(sender, recipients, data)
+        self._queue.put(message)
+        return message.future
+
+    def flush(self, timeout=None):
+        """Blocks until every queued message has been sent or has failed."""
+        if timeout is None:
+            self._queue.join()
+            return True
+
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def close(self, timeout=10.0):
+        """Flushes pending mail, stops the workers and closes pooled connections."""
+        if self._closed:
+            return
+        self.flush(timeout)
+        self._closed = True
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self.pool.close_all()
+
+    # --- Worker ---
+    def _next_batch(self):
+        """Waits for one message, then takes whatever else is already queued (up to batch_size)."""
+        first = self._queue.get()
+        if first is None:
+            self._queue.task_done()
+            return None
+
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                message = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if message is None:
+                # Put the shutdown marker back for after this batch
+                self._queue.task_done()
+                self._queue.put(None)
+                break
+            batch.append(message)
+        return batch
+
+    def _worker(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            try:
+                self._send_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _send_batch(self, batch):
+        pending = batch
+        while pending:
+            try:
+                server = self.pool.acquire()
+            except smtplib.SMTPAuthenticationError as e:
+                # Retrying cannot fix bad credentials
+                for message in pending:
+                    message.future.set_exception(e)
+                return
+            except self.CONNECTION_ERRORS + (smtplib.SMTPException,) as e:
+                pending = self._retry_later(pending, e)
+                continue
+
+            broken = False
+            for index, message in enumerate(pending):
+                try:
+                    server.sendmail(message.sender, message.recipients, message.data)
+                except self.CONNECTION_ERRORS as e:
+                    broken = True
+                    pending = self._retry_later(pending[index:], e)
+                    break
+                except smtplib.SMTPException as e:
+                    message.future.set_exception(e)
+                else:
+                    message.future.set_result(True)
+            else:
+                pending = []
+
+            self.pool.release(server, broken=broken)
+
+    def _retry_later(self, messages, error):
+        """Counts a failed attempt, fails messages that ran out of retries and backs off before the next try."""
+        retry = []
+        for message in messages:
+            message.attempts += 1
+            if message.attempts > self.max_retries:
+                message.future.set_exception(error)
+            else:
+                retry.append(message)
+
+        if retry:
+            delay = self.backoff * (2 ** (retry[0].attempts - 1))
+            print(f"⚠️  SMTP error ({error}); retrying {len(retry)} message(s) in {delay:.1f}s")
+            time.sleep(delay)
+        return retry
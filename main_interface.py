@@ -1,16 +1,43 @@
 import sys
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QGridLayout, QLabel, QPushButton, QSpacerItem, QSizePolicy
+    QLayout, QLabel, QPushButton, QScrollArea, QStackedWidget, QMessageBox
 )
-from PyQt5.QtGui import QPixmap, QFont
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, QRect, QSize, pyqtSignal
+
+from icon_cache import cached_pixmap
+from theme import DASHBOARD_SCOPE, apply_theme
+
+DATABASE_ICON = "database_icon.png"
+
+
+# --- View Model for a Project Card ---
+class ProjectItem:
+    """The data a ProjectCard displays; the dashboard diffs lists of these."""
+
+    __slots__ = ("project_id", "title", "description", "date")
+
+    def __init__(self, project_id, title, description, date):
+        self.project_id = project_id
+        self.title = title
+        self.description = description
+        self.date = date
+
+    @classmethod
+    def from_dict(cls, project):
+        """Builds an item from a DatabaseManager.list_projects_page() entry."""
+        return cls(project['id'], project['title'], project['description'], project['date'])
 
 
 # --- Custom Widget for a single Project Card ---
 class ProjectCard(QWidget):
-    def __init__(self, title, description, date):
+    # Emitted with the project id when the trash button is clicked
+    delete_requested = pyqtSignal(str)
+
+    def __init__(self, item=None):
         super().__init__()
+        self.item = None
 
         # Give the widget an object name for QSS styling
         self.setObjectName("ProjectCard")
@@ -28,8 +55,9 @@ class ProjectCard(QWidget):
         # Database Icon
         icon_label = QLabel()
         # NOTE: You must have an image named 'database_icon.png' in the same directory
-        icon_label.setPixmap(QPixmap("database_icon.png").scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        icon_label.setStyleSheet("padding: 5px; background-color: #F3E8FF; border-radius: 8px;")
+        # (decoded and scaled once, then shared by every card)
+        icon_label.setPixmap(cached_pixmap(DATABASE_ICON, 40))
+        icon_label.setObjectName("CardIcon")
 
         # Delete Button (Initially hidden/faint, styled in QSS)
         self.delete_btn = QPushButton()
@@ -38,6 +66,7 @@ class ProjectCard(QWidget):
         self.delete_btn.setIcon(self.style().standardIcon(self.style().SP_TrashIcon))  # Fallback icon
         self.delete_btn.setIconSize(QSize(20, 20))
         self.delete_btn.setFixedSize(30, 30)
+        self.delete_btn.clicked.connect(lambda: self.item and self.delete_requested.emit(self.item.project_id))
 
         # Use QSS to style and handle hover state visibility/color
 
@@ -49,50 +78,213 @@ class ProjectCard(QWidget):
 
         # 2. Project Details
         # Title
-        title_label = QLabel(title)
-        title_label.setFont(QFont("Arial", 16, QFont.Bold))
-        layout.addWidget(title_label)
+        self.title_label = QLabel()
+        self.title_label.setFont(QFont("Arial", 16, QFont.Bold))
+        layout.addWidget(self.title_label)
 
         # Description
-        desc_label = QLabel(description)
-        desc_label.setStyleSheet("color: #6A6A6A;")
-        layout.addWidget(desc_label)
+        self.desc_label = QLabel()
+        self.desc_label.setObjectName("CardDescription")
+        layout.addWidget(self.desc_label)
 
         # Spacer to push the date to the bottom
         layout.addSpacing(10)
 
         # Date
-        date_label = QLabel(f"📅 {date}")
-        date_label.setStyleSheet("color: #6A6A6A; font-size: 11pt;")
-        layout.addWidget(date_label)
+        self.date_label = QLabel()
+        self.date_label.setObjectName("CardDate")
+        layout.addWidget(self.date_label)
 
         layout.addStretch(1)
 
+        if item is not None:
+            self.set_item(item)
+
+    def set_item(self, item):
+        """Shows `item`, touching only the labels whose text actually changed. Returns True if any did."""
+        previous = self.item
+        self.item = item
+        changed = False
+
+        if previous is None or previous.title != item.title:
+            self.title_label.setText(item.title)
+            changed = True
+        if previous is None or previous.description != item.description:
+            self.desc_label.setText(item.description)
+            changed = True
+        if previous is None or previous.date != item.date:
+            self.date_label.setText(f"📅 {item.date}")
+            changed = True
+        return changed
+
+
+# --- Card Grid Layout ---
+class CardGridLayout(QLayout):
+    """
+    Lays equally sized widgets out in reading order, `columns` to a row.
+
+    Unlike QGridLayout, a widget's cell is its index in the layout, so
+    inserting or removing one widget is a single call that shifts the cells
+    of the widgets after it without re-adding them.
+    """
+
+    def __init__(self, parent=None, columns=2, cell_size=QSize(280, 160), spacing=20):
+        super().__init__(parent)
+        self.columns = columns
+        self.cell_size = cell_size
+        self.cell_spacing = spacing
+        self._items = []
+
+    def addItem(self, item):
+        self._items.append(item)
+
+    def insertWidget(self, index, widget):
+        self.addWidget(widget)  # Qt creates (and later deletes) the layout item
+        self._items.insert(index, self._items.pop())
+        self.invalidate()
+
+    def count(self):
+        return len(self._items)
+
+    def itemAt(self, index):
+        return self._items[index] if 0 <= index < len(self._items) else None
+
+    def takeAt(self, index):
+        return self._items.pop(index) if 0 <= index < len(self._items) else None
+
+    def cell(self, index):
+        """(row, column) of the widget at `index`."""
+        return divmod(index, self.columns)
+
+    def sizeHint(self):
+        return self.minimumSize()
+
+    def minimumSize(self):
+        rows = -(-len(self._items) // self.columns)
+        margins = self.contentsMargins()
+        width = self.columns * self.cell_size.width() + (self.columns - 1) * self.cell_spacing
+        height = rows * self.cell_size.height() + max(0, rows - 1) * self.cell_spacing
+        return QSize(width + margins.left() + margins.right(), height + margins.top() + margins.bottom())
+
+    def setGeometry(self, rect):
+        super().setGeometry(rect)
+        margins = self.contentsMargins()
+        step_x = self.cell_size.width() + self.cell_spacing
+        step_y = self.cell_size.height() + self.cell_spacing
+        for index, item in enumerate(self._items):
+            row, column = self.cell(index)
+            item.setGeometry(QRect(rect.x() + margins.left() + column * step_x, rect.y() + margins.top() + row * step_y,
+                                   self.cell_size.width(), self.cell_size.height()))
+
+
+# --- Project Grid (recycles cards across updates) ---
+class ProjectGrid(QWidget):
+    """
+    Grid of ProjectCards kept in sync with a list of ProjectItems.
+
+    set_projects() diffs the new list against what is shown: cards are
+    matched by project id and keep their widgets and labels (set_item only
+    touches labels whose text changed), cards of removed projects are taken
+    out and kept for reuse instead of destroyed, and cards are only moved
+    when they are not already at their position. Because a card's grid cell
+    is its index in a CardGridLayout, putting one project first or deleting
+    one is a single insert or remove; the cards after it shift cells without
+    being re-added or relabelled.
+    """
+    delete_requested = pyqtSignal(str)
+
+    def __init__(self, columns=2):
+        super().__init__()
+        self.columns = columns
+        self.cards = {}  # project id -> ProjectCard
+        self.spare_cards = []
+
+        self.grid_layout = CardGridLayout(self, columns)
+        self.grid_layout.setContentsMargins(20, 20, 20, 20)
+
+    def cell_of(self, project_id):
+        """(row, column) of the card showing `project_id`."""
+        return self.grid_layout.cell(self.grid_layout.indexOf(self.cards[project_id]))
+
+    def set_projects(self, items):
+        """Makes the grid show `items` in order, reusing existing cards where possible."""
+        wanted_ids = {item.project_id for item in items}
+
+        # 1. Take out the cards of projects that are gone
+        for project_id in [pid for pid in self.cards if pid not in wanted_ids]:
+            card = self.cards.pop(project_id)
+            self.grid_layout.removeWidget(card)
+            card.hide()
+            self.spare_cards.append(card)
+
+        # 2. Update, recycle or create a card per item, moving it only if it is not at its position yet
+        for position, item in enumerate(items):
+            card = self.cards.get(item.project_id)
+            if card is None:
+                card = self.spare_cards.pop() if self.spare_cards else self._create_card()
+                self.cards[item.project_id] = card
+            card.set_item(item)
+
+            placed = self.grid_layout.itemAt(position)
+            if placed is None or placed.widget() is not card:
+                if self.grid_layout.indexOf(card) >= 0:
+                    self.grid_layout.removeWidget(card)
+                self.grid_layout.insertWidget(position, card)
+                card.show()
+
+    def _create_card(self):
+        card = ProjectCard()
+        card.delete_requested.connect(self.delete_requested.emit)
+        return card
+
 
 # --- The Main Application Window ---
 class DataForgeApp(QMainWindow):
-    def __init__(self):
+    GRID_COLUMNS = 2
+    # Load the next page once the scroll bar is this close (px) to the bottom
+    PREFETCH_MARGIN = 300
+
+    def __init__(self, db_manager=None, db_executor=None, page_size=20):
         super().__init__()
+        self.db_manager = db_manager
+        self.db_executor = db_executor
+        self.page_size = page_size
+
+        # Projects currently shown, in display order (ProjectItem view models)
+        self.projects = []
+
+        # Paging state (see load_projects)
+        self.next_cursor = None
+        self.has_more = False
+        self.loading = False
+        self.load_generation = 0  # Bumped on reload so late pages from an old load are ignored
+
         # NOTE: Window title is set by the calling AuthAppContainer
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.main_layout = QVBoxLayout(self.central_widget)
 
-        self.apply_styles()
+        self.setObjectName(DASHBOARD_SCOPE)
+        apply_theme()
         self.create_header()
 
-        # Container for the main content (Projects or Empty State)
+        # Container for the main content: a title bar shared by both states, then
+        # the Projects and Empty State pages, each built once and switched between
         self.content_container = QWidget()
         self.content_layout = QVBoxLayout(self.content_container)
         self.main_layout.addWidget(self.content_container)
 
-        # Simulate having projects for the initial view
-        self.has_projects = True
+        self.create_title_bar()
 
-        if self.has_projects:
-            self.show_projects()
-        else:
-            self.show_empty_state()
+        self.state_stack = QStackedWidget()
+        self.projects_page = self.create_projects_page()
+        self.empty_page = self.create_empty_state_page()
+        self.state_stack.addWidget(self.projects_page)
+        self.state_stack.addWidget(self.empty_page)
+        self.content_layout.addWidget(self.state_stack, 1)
+
+        # Projects are loaded page by page once a user has signed in (load_projects)
+        self.show_empty_state()
 
     # --- Header Bar ---
     def create_header(self):
@@ -125,21 +317,11 @@ class DataForgeApp(QMainWindow):
         # Add a subtle separator below the header
         separator = QWidget()
         separator.setFixedHeight(1)
-        separator.setStyleSheet("background-color: #E0E0E0;")
+        separator.setObjectName("HeaderSeparator")
         self.main_layout.addWidget(separator)
 
-    # --- Content State: Projects ---
-    def show_projects(self):
-        # Clear previous content
-        for i in reversed(range(self.content_layout.count())):
-            item = self.content_layout.itemAt(i)
-            if item.widget() is not None:
-                item.widget().setParent(None)
-            elif item.layout() is not None:
-                # Handle nested layouts if necessary (though not strictly needed here)
-                pass
-
-
+    # --- Title Bar (shared by both content states) ---
+    def create_title_bar(self):
         # Main Title and New Project Button
         title_bar = QWidget()
         title_layout = QHBoxLayout(title_bar)
@@ -163,69 +345,132 @@ class DataForgeApp(QMainWindow):
         subtitle_label.setContentsMargins(20, 0, 20, 10)
         self.content_layout.addWidget(subtitle_label)
 
-        # Project Grid
-        grid_widget = QWidget()
-        grid_layout = QGridLayout(grid_widget)
-        grid_layout.setContentsMargins(20, 20, 20, 20)
-        grid_layout.setHorizontalSpacing(20)
-        grid_layout.setVerticalSpacing(20)
-
-        # Add sample project cards (based on your image)
-        projects = [
-            ("7567575", "7567567", "12/3/2025"),
-            ("75757", "757575", "12/3/2025"),
-            ("5676765", "7575757", "12/3/2025"),
-            ("dan", "test", "11/8/2025"),
-        ]
-
-        # Populate the grid (2 columns)
-        for i, (title, desc, date) in enumerate(projects):
-            row = i // 2
-            col = i % 2
-            card = ProjectCard(title, desc, date)
-            grid_layout.addWidget(card, row, col)
-
-        # Add an empty column spacer to push items left
-        grid_layout.addItem(QSpacerItem(20, 20, QSizePolicy.Expanding, QSizePolicy.Minimum), 0, 2)
-        grid_layout.setRowStretch(len(projects) // 2 + 1, 1)  # Push content to top
-
-        self.content_layout.addWidget(grid_widget)
-        self.content_layout.addStretch(1)
-
-    # --- Content State: Empty State (No Projects) ---
-    def show_empty_state(self):
-        # Clear previous content
-        for i in reversed(range(self.content_layout.count())):
-            item = self.content_layout.itemAt(i)
-            if item.widget() is not None:
-                item.widget().setParent(None)
-            elif item.layout() is not None:
-                pass
-
+    # --- Content State: Projects ---
+    def create_projects_page(self):
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Project Grid, inside a scroll area that asks for more pages as it nears the bottom
+        self.project_grid = ProjectGrid(self.GRID_COLUMNS)
+        self.project_grid.delete_requested.connect(self.confirm_delete_project)
+
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidgetResizable(True)
+        self.scroll_area.setWidget(self.project_grid)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._on_scroll)
+        self.scroll_area.verticalScrollBar().rangeChanged.connect(lambda _min, _max: self._fill_viewport())
+        page_layout.addWidget(self.scroll_area, 1)
+
+        # Shows "Loading..." or errors below the grid
+        self.status_label = QLabel("")
+        self.status_label.setObjectName("PageSubtitle")
+        self.status_label.setAlignment(Qt.AlignCenter)
+        page_layout.addWidget(self.status_label)
+
+        return page
 
-        # Title bar (same as project view, just for context)
-        title_bar = QWidget()
-        title_layout = QHBoxLayout(title_bar)
-        title_layout.setContentsMargins(20, 10, 20, 10)
+    def show_projects(self):
+        self.state_stack.setCurrentWidget(self.projects_page)
+
+    def set_projects(self, projects):
+        """Shows `projects` (ProjectItems), recycling the cards already on screen."""
+        self.projects = list(projects)
+        self.project_grid.set_projects(self.projects)
+
+    def add_project(self, item):
+        """Shows a new or just updated project first, keeping the list newest first."""
+        self.set_projects([item] + [p for p in self.projects if p.project_id != item.project_id])
+        self.show_projects()
+
+    def remove_project(self, project_id):
+        """Drops one project; the cards after it shift back one cell."""
+        self.set_projects([p for p in self.projects if p.project_id != project_id])
+        if not self.projects and not self.has_more:
+            self.show_empty_state()
 
-        title_label = QLabel("Your Projects")
-        title_label.setObjectName("PageTitle")
+    def confirm_delete_project(self, project_id):
+        reply = QMessageBox.question(self, "Delete Project", "Delete this project?",
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if reply != QMessageBox.Yes:
+            return
+
+        self.remove_project(project_id)
+        if self.db_executor is not None:
+            self.db_executor.submit("delete_project", project_id,
+                                    on_result=self._on_delete_finished,
+                                    on_error=lambda error: self.status_label.setText(f"❌ {error}"))
+
+    def _on_delete_finished(self, result):
+        success, message = result
+        if not success:
+            self.status_label.setText(message)
+
+    # --- Project Paging ---
+    def load_projects(self):
+        """Starts over and loads the first page of the signed-in user's projects."""
+        self.load_generation += 1
+        self.next_cursor = None
+        self.has_more = False
+        self.loading = False
+        self.set_projects([])
+
+        if self.db_manager is None or self.db_executor is None or not self.db_manager.current_user_uid:
+            self.show_empty_state()
+            return
+
+        self.show_projects()
+        self._request_page()
+
+    def _request_page(self):
+        if self.loading:
+            return
+        self.loading = True
+        self.status_label.setText("Loading projects...")
+
+        generation = self.load_generation
+        self.db_executor.submit("list_projects_page", self.db_manager.current_user_uid,
+                                self.page_size, self.next_cursor,
+                                on_result=lambda result: self._on_page_loaded(generation, result),
+                                on_error=lambda error: self._on_page_loaded(generation, (False, f"❌ {error}")))
+
+    def _on_page_loaded(self, generation, result):
+        if generation != self.load_generation:
+            return  # A newer load_projects() superseded this request
+        self.loading = False
+        success, payload = result
+
+        if not success:
+            self.status_label.setText(payload)
+            return
+
+        projects, self.next_cursor = payload
+        self.has_more = self.next_cursor is not None
+        self.status_label.setText("")
+
+        if not projects and not self.projects:
+            self.show_empty_state()
+            return
 
-        title_layout.addWidget(title_label)
-        title_layout.addStretch(1)
+        self.set_projects(self.projects + [ProjectItem.from_dict(project) for project in projects])
+        self.show_projects()
+        self._fill_viewport()
 
-        new_project_btn = QPushButton("+ New Project")
-        new_project_btn.setObjectName("NewProjectButton")
-        new_project_btn.setCursor(Qt.PointingHandCursor)
-        title_layout.addWidget(new_project_btn)
+    def _on_scroll(self, value):
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        if self.has_more and value >= scroll_bar.maximum() - self.PREFETCH_MARGIN:
+            self._request_page()
 
-        self.content_layout.addWidget(title_bar)
+    def _fill_viewport(self):
+        """Keeps loading while the cards do not fill the visible area yet (no scroll bar to drive paging)."""
+        if self.has_more and self.scroll_area.verticalScrollBar().maximum() == 0:
+            self._request_page()
 
-        # Subtitle
-        subtitle_label = QLabel("Create and manage your data generation projects")
-        subtitle_label.setObjectName("PageSubtitle")
-        subtitle_label.setContentsMargins(20, 0, 20, 10)
-        self.content_layout.addWidget(subtitle_label)
+    # --- Content State: Empty State (No Projects) ---
+    def create_empty_state_page(self):
+        page = QWidget()
+        page_layout = QVBoxLayout(page)
+        page_layout.setContentsMargins(0, 0, 0, 0)
 
         # Empty State Container (White box in the middle)
         empty_state_widget = QWidget()
@@ -238,7 +483,7 @@ class DataForgeApp(QMainWindow):
         # Database Icon
         icon_label = QLabel()
         # NOTE: Using a scaled icon placeholder
-        icon_label.setPixmap(QPixmap("database_icon.png").scaled(60, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        icon_label.setPixmap(cached_pixmap(DATABASE_ICON, 60))
         empty_layout.addWidget(icon_label, alignment=Qt.AlignCenter)
 
         # No Projects Yet text
@@ -248,7 +493,7 @@ class DataForgeApp(QMainWindow):
 
         # Sub-text
         create_first_label = QLabel("Create your first project to start generating data")
-        create_first_label.setStyleSheet("color: #6A6A6A;")
+        create_first_label.setObjectName("EmptyStateHint")
         empty_layout.addWidget(create_first_label, alignment=Qt.AlignCenter)
 
         # Create Project Button
@@ -259,96 +504,14 @@ class DataForgeApp(QMainWindow):
         empty_layout.addWidget(create_btn, alignment=Qt.AlignCenter)
 
         # Vertically center the empty state widget
-        self.content_layout.addStretch(1)
-        self.content_layout.addWidget(empty_state_widget)
-        self.content_layout.addStretch(1)
-
-    # --- Qt Style Sheets (QSS) for Aesthetics and Hover Effects ---
-    def apply_styles(self):
-        style = """
-        /* --- General Window and Background --- */
-        QMainWindow, QWidget {
-            background-color: #F8F8F8;
-            font-family: Arial, sans-serif;
-        }
-
-        /* --- Logo and Titles --- */
-        #Logo {
-            font-size: 24pt;
-            font-weight: bold;
-            color: #5D5D5D; /* Darker text */
-        }
-        #PageTitle {
-            font-size: 20pt;
-            font-weight: bold;
-            padding-top: 10px;
-        }
-        #PageSubtitle {
-            font-size: 11pt;
-            color: #6A6A6A;
-            padding-left: 20px;
-            padding-bottom: 10px;
-        }
-
-        /* --- Header Buttons --- */
-        #SettingsButton {
-            background-color: white;
-            border: 1px solid #E0E0E0;
-            border-radius: 6px;
-            padding: 8px 15px;
-            color: #5D5D5D;
-        }
-        #SettingsButton:hover {
-            background-color: #F0F0F0; /* Light hover */
-        }
-
-        #SignOutButton, #NewProjectButton, #CreateProjectButton {
-            background-color: #A995C9; /* Default purple */
-            color: white;
-            border: none;
-            border-radius: 6px;
-            padding: 8px 15px;
-            font-weight: bold;
-        }
-        #SignOutButton:hover, #NewProjectButton:hover, #CreateProjectButton:hover {
-            background-color: #8C7BA9; /* Darker purple on hover */
-        }
-
-        /* --- Project Card Styles --- */
-        #ProjectCard {
-            background-color: white;
-            border-radius: 10px;
-            /* Using border for a subtle card look, as true box-shadow requires advanced techniques */
-            border: 1px solid #E0E0E0; 
-        }
-        #ProjectCard:hover {
-            border: 1px solid #A995C9; /* Highlight border on hover */
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1); /* Simulate shadow */
-        }
-
-        /* --- Delete Button on Card Hover (Image_fe35a0.png) --- */
-        #DeleteButton {
-            background: transparent;
-            border: none;
-            /* Initially faint icon - setting the image directly can be complex, so we'll style the background on hover */
-        }
-        #DeleteButton:hover {
-            background-color: #A995C9; /* Purple square on hover */
-            border-radius: 5px;
-            /* You would typically swap to a white trash icon here for contrast */
-            /* This example uses a standard system icon, which may not change color */
-        }
-
-        /* --- Empty State Container --- */
-        #EmptyState {
-            background-color: white;
-            border-radius: 10px;
-            border: 1px solid #E0E0E0;
-            min-height: 350px;
-            margin: 20px;
-        }
-        """
-        self.setStyleSheet(style)
+        page_layout.addStretch(1)
+        page_layout.addWidget(empty_state_widget)
+        page_layout.addStretch(1)
+
+        return page
+
+    def show_empty_state(self):
+        self.state_stack.setCurrentWidget(self.empty_page)
 
 
 # Define MainInterface as an alias for your main application class
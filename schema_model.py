@@ -0,0 +1,270 @@
+import hashlib
+import json
+import struct
+
+from data_generator import FIELD_TYPES, compile_schema
+
+SCHEMA_FORMAT_VERSION = 2
+
+# Binary layout (all integers little-endian):
+#   magic b"DFSC", u8 version, u16 + UTF-8 schema name, u32 field count,
+#   then per field: u16 + UTF-8 name, u8 + UTF-8 type,
+#   and from version 2 on, u16 + UTF-8 JSON options (empty when there are none)
+_MAGIC = b"DFSC"
+_HEADER = struct.Struct("<4sB")
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+
+class Field:
+    """
+    One column of a schema. Immutable; use Schema.replace_field() to change it.
+
+    `options` are the type-specific generation settings the engine
+    understands (see data_generator.FIELD_OPTIONS), e.g. {"min_age": 18}.
+    """
+
+    __slots__ = ("name", "type", "_options")
+
+    def __init__(self, name, field_type, options=None):
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "type", field_type)
+        object.__setattr__(self, "_options", tuple(sorted((options or {}).items())))
+
+    def __setattr__(self, attr, value):
+        raise AttributeError("Field is immutable")
+
+    @property
+    def options(self):
+        return dict(self._options)
+
+    def __iter__(self):
+        # Unpacks like the (field name, field type) pairs the generation engine takes
+        yield self.name
+        yield self.type
+
+    def __eq__(self, other):
+        return (isinstance(other, Field) and self.name == other.name and self.type == other.type
+                and self._options == other._options)
+
+    def __hash__(self):
+        return hash((self.name, self.type, self._options))
+
+    def __reduce__(self):
+        return Field, (self.name, self.type, self.options)
+
+    def __repr__(self):
+        if self._options:
+            return f"Field({self.name!r}, {self.type!r}, {self.options!r})"
+        return f"Field({self.name!r}, {self.type!r})"
+
+    def to_dict(self):
+        data = {"name": self.name, "type": self.type}
+        if self._options:
+            data["options"] = self.options
+        return data
+
+    def _options_json(self):
+        return json.dumps(self.options, sort_keys=True, separators=(",", ":")) if self._options else ""
+
+
+class Schema:
+    """
+    An ordered list of fields, edited by the schema builder and consumed by the generation engine.
+
+    Iterating a schema yields Fields, which unpack as (name, type) pairs, so a
+    Schema can be passed anywhere a list of pairs is accepted. The content
+    hash covers the fields only (not the schema name): two schemas with the
+    same hash generate the same data.
+    """
+
+    __slots__ = ("name", "_fields", "_hash")
+
+    def __init__(self, fields=(), name=""):
+        self.name = name
+        self._fields = [field if isinstance(field, Field) else Field(*field) for field in fields]
+        self._hash = None
+
+    # --- Reading ---
+    @property
+    def fields(self):
+        return tuple(self._fields)
+
+    @property
+    def field_names(self):
+        return [field.name for field in self._fields]
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __getitem__(self, index):
+        return self._fields[index]
+
+    def __eq__(self, other):
+        return isinstance(other, Schema) and self.name == other.name and self._fields == other._fields
+
+    def __repr__(self):
+        return f"Schema({self._fields!r}, name={self.name!r})"
+
+    def copy(self):
+        return Schema(self._fields, self.name)
+
+    def named_fields(self):
+        """Returns a copy without the fields whose name is still blank."""
+        return Schema([field for field in self._fields if field.name], self.name)
+
+    # --- Editing ---
+    def add_field(self, name="", field_type=FIELD_TYPES[0], index=None, options=None):
+        field = Field(name, field_type, options)
+        self._fields.insert(len(self._fields) if index is None else index, field)
+        self._hash = None
+        return field
+
+    def remove_field(self, index):
+        self._hash = None
+        return self._fields.pop(index)
+
+    def replace_field(self, index, name=None, field_type=None, options=None):
+        old = self._fields[index]
+        self._fields[index] = Field(old.name if name is None else name,
+                                    old.type if field_type is None else field_type,
+                                    old.options if options is None else options)
+        self._hash = None
+        return self._fields[index]
+
+    # --- Validation ---
+    def validate(self):
+        """Raises ValueError describing the first problem that would stop generation."""
+        if not self._fields:
+            raise ValueError("The schema has no fields.")
+        seen = set()
+        for field in self._fields:
+            if not field.name:
+                raise ValueError("Every field needs a name.")
+            if field.type not in FIELD_TYPES:
+                raise ValueError(f"Unknown field type {field.type!r} for field {field.name!r}.")
+            if field.name in seen:
+                raise ValueError(f"Field names must be unique ({field.name!r} is repeated).")
+            seen.add(field.name)
+        # Options and dependencies are checked by the engine itself (the plan is cached for later)
+        compile_schema(self)
+
+    # --- Hashing ---
+    @property
+    def content_hash(self):
+        """Hex SHA-256 of the fields (and their options) in order; cached until the next edit."""
+        if self._hash is None:
+            digest = hashlib.sha256()
+            for field in self._fields:
+                _write_text(digest.update, field.name, _U16)
+                _write_text(digest.update, field.type, _U8)
+                _write_text(digest.update, field._options_json(), _U16)
+            self._hash = digest.hexdigest()
+        return self._hash
+
+    # --- JSON ---
+    def to_dict(self):
+        return {
+            "version": SCHEMA_FORMAT_VERSION,
+            "name": self.name,
+            "fields": [field.to_dict() for field in self._fields],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        # Anything shaped differently from to_dict() output is reported as a ValueError, like bad JSON
+        try:
+            version = data.get("version", SCHEMA_FORMAT_VERSION)
+            if version > SCHEMA_FORMAT_VERSION:
+                raise ValueError(f"Unsupported schema version {version}")
+            fields = [Field(field["name"], field["type"], field.get("options")) for field in data.get("fields", [])]
+            return cls(fields, data.get("name", ""))
+        except KeyError as e:
+            raise ValueError(f"Malformed schema: a field is missing {e}") from None
+        except (AttributeError, TypeError):
+            raise ValueError("Malformed schema") from None
+
+    def to_json(self, indent=None):
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    @classmethod
+    def from_json(cls, text):
+        return cls.from_dict(json.loads(text))
+
+    # --- Binary ---
+    def to_bytes(self):
+        parts = [_HEADER.pack(_MAGIC, SCHEMA_FORMAT_VERSION)]
+        _write_text(parts.append, self.name, _U16)
+        parts.append(_U32.pack(len(self._fields)))
+        for field in self._fields:
+            _write_text(parts.append, field.name, _U16)
+            _write_text(parts.append, field.type, _U8)
+            _write_text(parts.append, field._options_json(), _U16)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        try:
+            return cls._from_bytes(memoryview(data))
+        except struct.error:
+            # A length or count ran past the end of the data
+            raise ValueError("Truncated serialized schema") from None
+        except json.JSONDecodeError:
+            raise ValueError("Malformed field options in serialized schema") from None
+
+    @classmethod
+    def _from_bytes(cls, view):
+        magic, version = _HEADER.unpack_from(view, 0)
+        if magic != _MAGIC:
+            raise ValueError("Not a serialized schema")
+        if version > SCHEMA_FORMAT_VERSION:
+            raise ValueError(f"Unsupported schema version {version}")
+
+        offset = _HEADER.size
+        name, offset = _read_text(view, offset, _U16)
+        (count,) = _U32.unpack_from(view, offset)
+        offset += _U32.size
+
+        fields = []
+        for _ in range(count):
+            field_name, offset = _read_text(view, offset, _U16)
+            field_type, offset = _read_text(view, offset, _U8)
+            options = None
+            if version >= 2:
+                options_json, offset = _read_text(view, offset, _U16)
+                options = json.loads(options_json) if options_json else None
+                if options is not None and not isinstance(options, dict):
+                    raise ValueError("Malformed field options in serialized schema")
+            fields.append(Field(field_name, field_type, options))
+        if offset != len(view):
+            raise ValueError("Trailing data after serialized schema")
+        return cls(fields, name)
+
+    # --- Files ---
+    @classmethod
+    def from_file(cls, path):
+        """Loads a schema saved by the Schema Builder, as JSON or binary (told apart by content, not extension)."""
+        with open(path, "rb") as f:
+            data = f.read()
+        if data.startswith(_MAGIC):
+            return cls.from_bytes(data)
+        return cls.from_json(data.decode("utf-8"))
+
+
+def _write_text(write, text, length_struct):
+    encoded = text.encode("utf-8")
+    write(length_struct.pack(len(encoded)))
+    write(encoded)
+
+
+def _read_text(view, offset, length_struct):
+    (length,) = length_struct.unpack_from(view, offset)
+    offset += length_struct.size
+    end = offset + length
+    if end > len(view):
+        raise ValueError("Truncated serialized schema")
+    return str(view[offset:end], "utf-8"), end
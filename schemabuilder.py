@@ -2,27 +2,43 @@ import sys
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
     QHBoxLayout, QPushButton, QLabel, QSizePolicy,
-    QSpacerItem, QLineEdit, QMenu  # QMenu is needed for the custom dropdown functionality
+    QSpacerItem, QLineEdit, QMenu, QMessageBox, QFileDialog, QCheckBox,  # QMenu is needed for the custom dropdown functionality
+    QInputDialog
 )
 from PyQt5.QtGui import QFont
-from PyQt5.QtCore import Qt, QSize, QPoint  # QPoint is needed for positioning the menu
+from PyQt5.QtCore import Qt, QSize, QPoint, QThreadPool  # QPoint is needed for positioning the menu
+
+from data_generator import FIELD_OPTIONS, FIELD_TYPES, new_seed
+from data_preview import DataPreviewWindow
+from db_worker import DatabaseTask
+from exporters import export, load_sqlite
+from schema_model import Schema
+from theme import SCHEMA_BUILDER_SCOPE, apply_theme
 
 
 class PreviewWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, schema=None, db_executor=None, project_id=None):
         super().__init__()
         self.setWindowTitle("Data Generator - Schema Builder")
         self.setGeometry(100, 100, 1440, 1024)
-        self.setStyleSheet(self._get_main_style())
+        self.setObjectName(SCHEMA_BUILDER_SCOPE)
+        apply_theme()
 
         # Instance variables for dynamic content
         self.schema_layout = None  # Will hold the QVBoxLayout of the schema card
-        self.field_widgets = []  # List to track all dynamically added field rows
+        self.field_widgets = []  # Field rows, in the same order as self.schema's fields
+        self.schema = Schema(name="Untitled Schema") if schema is None else schema.copy()
+        # With a project and executor, Save Schema writes to Firestore; otherwise it saves to a file
+        self.db_executor = db_executor
+        self.project_id = project_id
+        self.preview_seed = new_seed()  # Kept across Preview clicks so the same schema shows the same rows
+        self.preview_window = None
+        self.export_signals = None  # TaskSignals of the running export, if any
 
         self._setup_ui()
 
     # --- Field Creation Logic ---
-    def _create_field_row(self):
+    def _create_field_row(self, field):
         """Creates a single QWidget containing the Field Name, Field Type (Custom Dropdown), and Delete Button."""
         field_row_widget = QWidget()
         field_row_layout = QHBoxLayout(field_row_widget)
@@ -32,6 +48,8 @@ class PreviewWindow(QMainWindow):
         # Field Name Input
         name_input = QLineEdit()
         name_input.setPlaceholderText("e.g. username, email")
+        name_input.setText(field.name)
+        name_input.textChanged.connect(lambda text: self._rename_field(field_row_widget, text))
         field_row_layout.addWidget(name_input, 2)  # Takes 2 parts of stretch
 
         # --- REPLACING QComboBox with Composite Custom Dropdown ---
@@ -43,7 +61,7 @@ class PreviewWindow(QMainWindow):
 
         # 1. The actual display input (read-only)
         type_display = QLineEdit()
-        type_display.setText("Full Name")
+        type_display.setText(field.type)
         type_display.setReadOnly(True)
         type_display.setObjectName("typeDisplay")
 
@@ -58,9 +76,18 @@ class PreviewWindow(QMainWindow):
 
         field_row_layout.addWidget(type_group_widget, 2)
 
+        # Unique values (only offered for the types the engine can keep unique)
+        unique_checkbox = QCheckBox("Unique")
+        unique_checkbox.setChecked(bool(field.options.get("unique")))
+        unique_checkbox.setEnabled("unique" in FIELD_OPTIONS[field.type])
+        unique_checkbox.toggled.connect(lambda checked: self._set_field_unique(field_row_widget, checked))
+        field_row_layout.addWidget(unique_checkbox, 0)
+
         # Store references on the row widget so the handler can access the right elements
+        field_row_widget.name_input_ref = name_input
         field_row_widget.type_display_ref = type_display
         field_row_widget.dropdown_button_ref = dropdown_button
+        field_row_widget.unique_checkbox_ref = unique_checkbox
 
         # Connect the button to the custom menu handler
         # We pass the parent row widget so the handler knows which field to update
@@ -80,30 +107,46 @@ class PreviewWindow(QMainWindow):
 
     # --- Custom Dropdown Handlers ---
 
-    def _update_field_type(self, type_display_widget, type_name):
-        """Updates the text in the QLineEdit display with the selected type."""
-        type_display_widget.setText(type_name)
+    def _update_field_type(self, field_row_widget, type_name):
+        """Records the selected type in the schema and shows it in the row's display."""
+        index = self.field_widgets.index(field_row_widget)
+        # Options are type-specific; keep only those the new type understands
+        supported = FIELD_OPTIONS[type_name]
+        options = {key: value for key, value in self.schema[index].options.items() if key in supported}
+        self.schema.replace_field(index, field_type=type_name, options=options)
+
+        field_row_widget.type_display_ref.setText(type_name)
+        unique_checkbox = field_row_widget.unique_checkbox_ref
+        unique_checkbox.blockSignals(True)
+        unique_checkbox.setChecked(bool(options.get("unique")))
+        unique_checkbox.setEnabled("unique" in supported)
+        unique_checkbox.blockSignals(False)
+
+    def _set_field_unique(self, field_row_widget, unique):
+        index = self.field_widgets.index(field_row_widget)
+        options = self.schema[index].options
+        if unique:
+            options["unique"] = True
+        else:
+            options.pop("unique", None)
+        self.schema.replace_field(index, options=options)
+
+    def _rename_field(self, field_row_widget, name):
+        self.schema.replace_field(self.field_widgets.index(field_row_widget), name=name.strip())
 
     def _handle_open_type_dropdown(self, field_row_widget):
         """Handles the click on the dropdown button by showing a QMenu."""
         menu = QMenu(self)
 
-        # Define field types content
-        field_types = [
-            "Full Name",
-            "Email Address",
-            "Phone Number",
-            "Street Address",
-            "Date of Birth"
-        ]
+        # Field types are defined by the generation engine, so every entry has a generator behind it
+        field_types = FIELD_TYPES
 
-        type_display_widget = field_row_widget.type_display_ref
         dropdown_button = field_row_widget.dropdown_button_ref
 
         for type_name in field_types:
             action = menu.addAction(type_name)
-            # Crucial: pass both the selected type name AND the specific display widget to update
-            action.triggered.connect(lambda checked, t=type_name, d=type_display_widget: self._update_field_type(d, t))
+            # Crucial: pass both the selected type name AND the field row whose type display to update
+            action.triggered.connect(lambda checked, t=type_name, r=field_row_widget: self._update_field_type(r, t))
 
         # Position the menu right below the dropdown button
         # mapToGlobal converts the button's local coordinates to screen coordinates
@@ -113,12 +156,14 @@ class PreviewWindow(QMainWindow):
     # --- Dynamic Field Management ---
 
     def add_new_field(self):
-        """Creates a new field row and adds it to the schema layout."""
+        """Adds a field to the schema and a row for it to the schema layout."""
         if not self.schema_layout:
             print("Error: Schema layout not initialized.")
             return
+        self._add_field_row(self.schema.add_field())
 
-        new_field_widget = self._create_field_row()
+    def _add_field_row(self, field):
+        new_field_widget = self._create_field_row(field)
         self.field_widgets.append(new_field_widget)
 
         # Insert the new widget before the last two items: the QSpacerItem (spacer) and the QHBoxLayout (save row)
@@ -126,11 +171,116 @@ class PreviewWindow(QMainWindow):
         self.schema_layout.insertWidget(insert_index, new_field_widget)
 
     def _delete_field_row(self, widget_to_remove):
-        """Removes a field row widget from the layout and cleans up."""
+        """Removes a field from the schema and its row widget from the layout."""
+        self.schema.remove_field(self.field_widgets.index(widget_to_remove))
         widget_to_remove.setParent(None)  # Remove widget from its parent
         self.field_widgets.remove(widget_to_remove)
         widget_to_remove.deleteLater()  # Schedule for deletion
 
+    def get_schema(self):
+        """Returns a copy of the current Schema, skipping unnamed fields."""
+        return self.schema.named_fields()
+
+    def _validated_schema(self, title):
+        """Returns the named fields as a Schema, or None after telling the user what is wrong."""
+        schema = self.get_schema()
+        if not len(schema):
+            QMessageBox.information(self, title, "Add at least one named field first.")
+            return None
+        try:
+            schema.validate()
+        except ValueError as e:
+            QMessageBox.warning(self, title, str(e))
+            return None
+        return schema
+
+    def open_preview(self):
+        """Opens a lazily generated preview of the current schema."""
+        schema = self._validated_schema("Preview")
+        if schema is None:
+            return
+
+        self.preview_window = DataPreviewWindow(schema, seed=self.preview_seed)
+        self.preview_window.show()
+
+    # --- Saving ---
+    def save_schema(self):
+        """Saves the schema to the project in Firestore, or to a file when there is no project."""
+        schema = self._validated_schema("Save Schema")
+        if schema is None:
+            return
+
+        if self.db_executor is not None and self.project_id:
+            self.db_executor.submit('save_schema', self.project_id, schema,
+                                    on_result=self._on_schema_saved, on_error=self._on_schema_save_failed)
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self, "Save Schema", f"{schema.name}.json",
+                                              "Schema JSON (*.json);;Binary Schema (*.dfschema)")
+        if not path:
+            return
+        try:
+            if path.endswith(".dfschema"):
+                with open(path, "wb") as f:
+                    f.write(schema.to_bytes())
+            else:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(schema.to_json(indent=2))
+        except OSError as e:
+            QMessageBox.warning(self, "Save Schema", f"❌ Could not save schema: {e}")
+            return
+        QMessageBox.information(self, "Save Schema", f"✅ Schema '{schema.name}' saved.")
+
+    def _on_schema_saved(self, result):
+        success, message = result
+        if success:
+            QMessageBox.information(self, "Save Schema", message)
+        else:
+            QMessageBox.warning(self, "Save Schema", message)
+
+    def _on_schema_save_failed(self, error):
+        QMessageBox.warning(self, "Save Schema", f"❌ Could not save schema: {error}")
+
+    # --- Exporting ---
+    def export_data(self):
+        """Asks for a file and a row count, then generates the data into it on a background thread."""
+        if self.export_signals is not None:
+            QMessageBox.information(self, "Export", "An export is already running.")
+            return
+        schema = self._validated_schema("Export")
+        if schema is None:
+            return
+
+        path, _ = QFileDialog.getSaveFileName(self, "Export Data", f"{schema.name}.csv",
+                                              "CSV (*.csv);;JSON Lines (*.jsonl);;Parquet (*.parquet);;Arrow IPC (*.arrow);;"
+                                              "SQL INSERT script (*.sql);;PostgreSQL COPY (*.copy);;"
+                                              "PostgreSQL binary COPY (*.pgcopy);;SQLite database (*.sqlite *.db);;"
+                                              "Compressed (*.gz *.zst *.lz4)")
+        if not path:
+            return
+        num_rows, ok = QInputDialog.getInt(self, "Export Data", "Number of rows:", 10000, 1, 2_000_000_000)
+        if not ok:
+            return
+
+        # One worker: forking a process pool from a Qt process with live threads is not safe
+        if path.lower().endswith((".sqlite", ".db")):
+            task = DatabaseTask(load_sqlite, (schema, path, num_rows), {"workers": 1})
+        else:
+            task = DatabaseTask(export, (schema, path, num_rows), {"workers": 1})
+        self.export_signals = task.signals
+        task.signals.finished.connect(self._on_export_finished)
+        task.signals.failed.connect(self._on_export_failed)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_export_finished(self, result):
+        self.export_signals = None
+        QMessageBox.information(self, "Export", f"✅ Exported {result.rows:,} rows to {result.path} "
+                                                f"({result.megabytes_per_second:.0f} MB/s).")
+
+    def _on_export_failed(self, error):
+        self.export_signals = None
+        QMessageBox.warning(self, "Export", f"❌ Could not export data: {error}")
+
     # --- UI Setup ---
     def _setup_ui(self):
         # --- 1. Main Container Widget ---
@@ -188,8 +338,14 @@ class PreviewWindow(QMainWindow):
 
         preview_button = QPushButton("◎ Preview")
         preview_button.setObjectName("previewButton")
+        preview_button.clicked.connect(self.open_preview)
         header_layout.addWidget(preview_button)
 
+        export_button = QPushButton("⇩ Export")
+        export_button.setObjectName("previewButton")
+        export_button.clicked.connect(self.export_data)
+        header_layout.addWidget(export_button)
+
         outer_header_layout.addStretch(1)
         outer_header_layout.addWidget(inner_header_content)
         outer_header_layout.addStretch(1)
@@ -253,8 +409,7 @@ class PreviewWindow(QMainWindow):
         field_header_layout.setStretch(2, 2)
         schema_layout.addLayout(field_header_layout)
 
-        # --- Initial Field Row (Will be added dynamically by the method) ---
-        self.add_new_field()  # Call to create the first field row
+        # Spacer and Save row go in first so field rows can be inserted above them
 
         # Spacer before Save button (Index count - 2)
         spacer_item = QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Fixed)
@@ -269,8 +424,15 @@ class PreviewWindow(QMainWindow):
         save_row_layout.addStretch(1)
         save_row_layout.addWidget(save_button)
 
+        save_button.clicked.connect(self.save_schema)
         schema_layout.addLayout(save_row_layout)
 
+        # --- Field Rows: one per field of a loaded schema, or a first blank one ---
+        for field in self.schema:
+            self._add_field_row(field)
+        if not self.field_widgets:
+            self.add_new_field()
+
         content_layout.addWidget(schema_card, alignment=Qt.AlignHCenter)
 
         # Add final stretch
@@ -278,162 +440,6 @@ class PreviewWindow(QMainWindow):
 
         main_layout.addWidget(content_widget)
 
-    def _get_main_style(self):
-        # Color Palette
-        P_PURPLE = "#A383D4"  # Primary/Update Button (Violet)
-        P_LIGHT_BG = "#F9F9FB"  # Main window background
-        P_CARD_BG = "white"  # Card background
-        P_TEXT_DARK = "#333333"  # Very dark text for high contrast
-        P_TEXT_MEDIUM = "#666666"
-        P_DANGER_RED = "#E55353"  # Danger red color
-        P_LIGHT_PURPLE = "#C5A3E8"  # Lighter purple for Add/Save buttons
-        P_LIGHT_GRAY = "#F8F8F8"  # Light background for the button part
-
-        # FIX: Use an f-string (f"""...""") for the entire return value and ensure proper indentation.
-        return f"""
-            /* --- Window and General Styling --- */
-            QMainWindow {{
-                background-color: {P_LIGHT_BG};
-            }}
-            #header {{
-                background-color: {P_CARD_BG};
-                border-bottom: 1px solid #D0D0D0;
-            }}
-            #schemaCard {{
-                background-color: {P_CARD_BG};
-                border-radius: 12px;
-                box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            }}
-
-            /* --- Titles and Labels --- */
-            #headerTitle {{
-                font-size: 20px;
-                font-weight: bold;
-                color: {P_TEXT_DARK};
-            }}
-            #mainTitle {{
-                font-size: 30px;
-                font-weight: bold;
-                color: {P_TEXT_DARK};
-            }}
-            #subTitle {{
-                font-size: 16px;
-                color: {P_TEXT_MEDIUM};
-            }}
-
-            /* --- Buttons --- */
-            #primaryButton {{
-                background-color: {P_PURPLE};
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 15px;
-                font-size: 14px;
-                font-weight: bold;
-            }}
-            #primaryButton:hover {{
-                background-color: {P_LIGHT_PURPLE};
-            }}
-            #previewButton {{
-                background-color: white;
-                color: {P_TEXT_DARK};
-                border: 1px solid #D0D0D0;
-                border-radius: 6px;
-                padding: 8px 15px;
-                font-size: 14px;
-            }}
-            #previewButton:hover {{
-                background-color: {P_LIGHT_GRAY};
-            }}
-
-            /* --- Standard Input Fields (QLineEdit) --- */
-            QLineEdit {{
-                border: 1px solid #D0D0D0;
-                border-radius: 6px;
-                padding: 8px 10px;
-                font-size: 14px;
-                background-color: white;
-            }}
-
-            /* --- CUSTOM DROPDOWN QSS (Revised Modern Look) --- */
-
-            /* 1. Style for the main display part (QLineEdit) */
-            #typeDisplay {{
-                /* Keep all borders from QLineEdit default, but remove right border for blending */
-                border-top-right-radius: 0px;
-                border-bottom-right-radius: 0px;
-                border-right: none;
-                background-color: white;
-            }}
-
-            /* 2. Style for the dropdown button (QPushButton) */
-            #dropdownButton {{
-                background-color: white; /* Clean white background */
-                border: 1px solid #D0D0D0;
-                /* Match the text input style except for left border and corners to blend */
-                border-top-left-radius: 0px;
-                border-bottom-left-radius: 0px;
-                border-left: none; /* Blend with QLineEdit */
-                padding: 0;
-                font-size: 14px;
-                font-weight: bold;
-                color: {P_PURPLE}; /* Use primary purple for the arrow */
-            }}
-            #dropdownButton:hover {{
-                background-color: {P_LIGHT_GRAY}; /* Subtle hover effect */
-                color: {P_PURPLE};
-            }}
-            /* ----------------------------------------------------- */
-
-            /* --- QMenu/Dropdown Menu Styling (Updated for modern look) --- */
-            QMenu {{
-                background-color: white;
-                border: 1px solid #D0D0D0;
-                border-radius: 6px;
-                padding: 5px; /* Padding around the items */
-            }}
-
-            QMenu::item {{
-                padding: 8px 15px; /* Increased padding for better touch/click targets */
-                border-radius: 4px;
-                color: {P_TEXT_DARK};
-                font-size: 14px;
-            }}
-
-            QMenu::item:selected {{
-                background-color: {P_PURPLE}; /* Primary color on hover/selection */
-                color: white;
-            }}
-            /* ----------------------------------------------------- */
-
-
-            /* --- Delete Button (Trash Icon) --- */
-            #deleteFieldButton {{
-                background-color: transparent;
-                border: 1px solid #D0D0D0;
-                border-radius: 6px;
-                font-size: 16px;
-                color: {P_DANGER_RED};
-            }}
-            #deleteFieldButton:hover {{
-                background-color: #FEE;
-                border: 1px solid {P_DANGER_RED};
-            }}
-
-            /* --- Hint Text (Small secondary text) --- */
-            #hintText {{
-                font-size: 11px;
-                color: {P_TEXT_MEDIUM};
-            }}
-
-            /* --- General Text (Ensuring QLabels default to the dark color) --- */
-            QLabel {{
-                font-family: Arial;
-                color: {P_TEXT_DARK};
-                font-size: 14px;
-            }}
-        """
-
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
@@ -7,6 +7,8 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont, QIcon
 
+from theme import SETTINGS_SCOPE, apply_theme
+
 
 class SettingsForm(QWidget):
     def __init__(self):
@@ -18,7 +20,8 @@ class SettingsForm(QWidget):
         # Set minimum window size to prevent too small display
         self.setMinimumSize(800, 600)
 
-        self.setStyleSheet(self.get_main_style())
+        self.setObjectName(SETTINGS_SCOPE)
+        apply_theme()
         self.init_ui()
 
     def init_ui(self):
@@ -221,7 +224,6 @@ class SettingsForm(QWidget):
         update_btn.setObjectName("updateButton")
         update_btn.setCursor(Qt.PointingHandCursor)
         update_btn.setFixedSize(590, 40)  # Fixed button size
-        update_btn.setStyleSheet("text-align: center;")  # Center button text
 
         layout.addSpacing(20)  # Space before button (Increased from 15)
         layout.addWidget(update_btn)
@@ -253,7 +255,6 @@ class SettingsForm(QWidget):
         signout_btn.setObjectName("signoutButton")
         signout_btn.setCursor(Qt.PointingHandCursor)
         signout_btn.setFixedSize(590, 40)  # Fixed button size
-        signout_btn.setStyleSheet("text-align: center;")  # Center button text
 
         layout.addSpacing(20)  # Space before button (Increased from 15)
         layout.addWidget(signout_btn)
@@ -266,145 +267,4 @@ class SettingsForm(QWidget):
         """Method to set the title text"""
         self.title_label.setText(text)
 
-    def get_main_style(self):
-        # Color Palette
-        P_PURPLE = "#A383D4"  # Primary/Update Button (Violet)
-        P_RED = "#E55353"  # Danger/Signout Button
-        P_LIGHT_BG = "#F9F9FB"  # Main window background
-        P_CARD_BG = "white"  # Card background
-        P_TEXT_DARK = "#333333"
-        P_TEXT_MEDIUM = "#666666"
-
-        return f"""
-            QWidget {{
-                background-color: {P_LIGHT_BG};
-                color: {P_TEXT_DARK};
-                font-family: Arial;
-            }}
-
-            /* --- Header --- */
-            #header {{
-                background-color: {P_CARD_BG};
-                border-bottom: 1px solid #E0E0E0;
-            }}
-
-            /* --- Typography --- */
-            #title {{
-                font-size: 28px;
-                font-weight: bold;
-                color: {P_TEXT_DARK};
-                margin-bottom: 0px;
-            }}
-            #subtitle {{
-                font-size: 14px;
-                color: {P_TEXT_MEDIUM};
-                margin-bottom: 0px;
-            }}
-            #cardTitle {{
-                font-size: 18px;
-                font-weight: bold;
-                color: {P_TEXT_DARK};
-                margin-bottom: 0px;
-            }}
-            #inputLabel {{
-                font-size: 13px;
-                font-weight: bold;
-                color: {P_TEXT_DARK};
-                margin-bottom: 2px;
-                background-color: white; /* Ensures labels match the white card background */
-                padding: 0px; /* Added to ensure no inherited padding causes gray borders */
-            }}
-            #hintText {{
-                font-size: 11px;
-                color: {P_TEXT_MEDIUM};
-                margin-top: 2px;
-                background-color: white; /* Ensures hint text background matches the white card */
-                padding: 0px; /* Added to ensure no inherited padding causes gray borders */
-            }}
-
-            /* --- Layout Cards --- */
-            #cardFrame {{
-                background-color: {P_CARD_BG};
-                border: 1px solid #E0E0E0;
-                border-radius: 8px;
-            }}
-            #signoutCardFrame {{
-                background-color: {P_CARD_BG};
-                border: 1px solid #E0E0E0;
-                border-radius: 8px;
-            }}
-
-            /* --- Inputs --- */
-            QLineEdit {{
-                border: 1px solid #CCCCCC;
-                border-radius: 6px;
-                padding: 10px 12px;
-                font-size: 13px;
-                text-align: left;
-            }}
-
-            /* Read-only fields - Confirmed background is white */
-            #readOnlyInput {{
-                background-color: white;
-                color: {P_TEXT_MEDIUM};
-            }}
-
-            /* Editable field focus style */
-            QLineEdit[isEditable="true"]:focus {{
-                border: 2px solid {P_PURPLE};
-                padding: 9px 11px;
-            }}
-
-            /* --- Buttons --- */
-            #backButton {{
-                background-color: transparent;
-                border: none;
-                color: {P_TEXT_MEDIUM};
-                font-size: 14px; 
-                padding: 8px 15px; 
-                border-radius: 6px; 
-                text-align: left;
-                font-weight: bold; 
-            }}
-            #backButton:hover {{
-                background-color: {P_PURPLE}; 
-                color: white; 
-                text-decoration: none; 
-                font-weight: bold; 
-            }}
-
-            #updateButton {{
-                background-color: {P_PURPLE};
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 0px;
-                border: none;
-                border-radius: 10px;
-                text-align: center;
-            }}
-            #updateButton:hover {{
-                background-color: #8D67B2;
-            }}
-
-            /* --- Sign Out Button (Danger) Styling --- */
-            /* Normal State: White background, Red text, Red border */
-            #signoutButton {{
-                background-color: white;
-                color: {P_RED};
-                font-size: 14px;
-                font-weight: bold;
-                padding: 0px;
-                border: 1px solid {P_RED}; 
-                border-radius: 10px; 
-                text-align: center;
-            }}
-            /* Hover State: Purple background (matching update button color), White text */
-            #signoutButton:hover {{
-                background-color: #A383D4; /* Used explicit hex code for robustness */
-                color: white;
-                border: 1px solid #A383D4; /* Match border to hover background */
-            }}
-        """
-
 
@@ -3,9 +3,13 @@ from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QFrame, QSizePolicy, QStackedWidget, QMainWindow
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QEvent
 # Import DatabaseManager (assuming it's in the same directory)
 from database_manager import DatabaseManager
+# Runs DatabaseManager calls on background threads so the UI never blocks on network I/O
+from db_worker import DatabaseExecutor
+# Every window's styles are compiled once and set on the QApplication
+from theme import AUTH_SCOPE, apply_theme
 
 # 💥 IMPORTING THE ACTUAL MAIN INTERFACE FROM main_interface.py
 from main_interface import MainInterface
@@ -20,7 +24,8 @@ class AuthForm(QWidget):
     def __init__(self, db_manager):
         super().__init__()
         self.db_manager = db_manager
-        self.setStyleSheet(self.get_styles())
+        self.setObjectName(AUTH_SCOPE)
+        apply_theme()
         self.init_ui()
 
     def init_ui(self):
@@ -82,183 +87,6 @@ class AuthForm(QWidget):
         self.btn_signin.style().polish(self.btn_signin)
         self.btn_signup.style().polish(self.btn_signup)
 
-    def get_styles(self):
-        FOCUS_PURPLE = "#a07ade"
-        PURPLE_HOVER = "#8d70b5"
-        ERROR_RED = "#dc2626"
-        SUCCESS_GREEN = "#10b981"
-        INFO_BLUE = "#3b82f6"
-
-        CARD_MIN_WIDTH = 450
-        NEW_BG_COLOR = "#f7f7f7"
-        CARD_BG_COLOR = "#ffffff"
-        BUTTON_LILAC = "#A68CC8"
-        TAB_FRAME_BG = "#ededed"
-
-        return f"""
-        /* --- General and Main Window --- */
-        QWidget {{
-            background-color: {NEW_BG_COLOR};
-            font-family: Arial, sans-serif;
-        }}
-
-        /* --- Title and Subtitle Styles --- */
-        QLabel#titleLabel {{
-            color: #333333;
-            font-size: 32px;
-            font-weight: bold;
-            margin: 0;
-            padding: 0;
-        }}
-
-        QLabel#subtitleLabel {{
-            color: #666666;
-            font-size: 16px;
-            font-weight: normal;
-            margin: 0;
-            padding: 0;
-        }}
-
-        /* --- Card Frame --- */
-        #card {{
-            background-color: {CARD_BG_COLOR};
-            border-radius: 16px;
-            min-width: {CARD_MIN_WIDTH}px;
-            border: 1px solid #d9d9d9;
-            box-shadow: 0px 4px 12px rgba(0, 0, 0, 0.08);
-        }}
-
-        QStackedWidget {{
-            background-color: transparent;
-        }}
-
-        /* --- Tab Frame and Buttons --- */
-        #tabFrame {{
-            background-color: {TAB_FRAME_BG};
-            border-radius: 8px;
-            padding: 0.5px;
-        }}
-
-        QPushButton#tabButton {{
-            padding: 6px 20px;
-            border: none;
-            font-weight: 500;
-            font-size: 13px;
-            color: #666666;
-            background-color: transparent;
-            border-radius: 6px;
-            min-height: 20px;
-            margin: 0.5px;
-        }}
-
-        QPushButton#tabButton[active="true"] {{
-            color: #000000;
-            background-color: #ffffff;
-            font-weight: 600;
-            box-shadow: 0px 1px 3px rgba(0, 0, 0, 0.05);
-            border-radius: 6px;
-        }}
-
-        /* --- Input Fields and Labels --- */
-        QLabel {{
-            color: #222222;
-            font-weight: 500;
-            margin-top: 15px;
-            margin-bottom: 5px;
-            font-size: 13px;
-            background: transparent;
-        }}
-
-        QLineEdit {{
-            padding: 10px 15px;
-            border: 1px solid #e0e0e0;
-            border-radius: 10px;
-            font-size: 14px;
-            background-color: #ffffff;
-            color: #000000;
-        }}
-
-        QLineEdit::placeholder {{
-            color: #999999;
-            font-weight: 400;
-        }}
-
-        QLineEdit[error="true"] {{
-            border: 1px solid {ERROR_RED};
-            background-color: rgba(220, 38, 38, 0.05);
-        }}
-
-        QLineEdit:focus {{
-            border: 1px solid {FOCUS_PURPLE};
-            outline: 2px solid rgba(160, 122, 222, 0.2);
-        }}
-
-        /* --- Main Action Button --- */
-        QPushButton#mainButton {{
-            background-color: {BUTTON_LILAC};
-            color: white;
-            padding: 14px 20px;
-            border-radius: 10px;
-            font-weight: 600;
-            margin-top: 25px;
-            font-size: 14px;
-        }}
-        QPushButton#mainButton:hover {{
-            background-color: {PURPLE_HOVER};
-        }}
-
-        /* --- Secondary Button --- */
-        QPushButton#secondaryButton {{
-            background-color: #f3f4f6;
-            color: #374151;
-            border: 1px solid #d1d5db;
-            padding: 10px 16px;
-            border-radius: 10px;
-            font-weight: 600;
-            font-size: 14px;
-        }}
-        QPushButton#secondaryButton:hover {{
-            background-color: #e5e7eb;
-        }}
-
-        /* --- Message Labels --- */
-        QLabel#errorMessage {{
-            color: {ERROR_RED};
-            font-size: 13px;
-            font-weight: 500;
-            padding: 8px 12px;
-            background-color: rgba(220, 38, 38, 0.08);
-            border-radius: 8px;
-            margin-top: 5px;
-            margin-bottom: 5px;
-            border: 1px solid rgba(220, 38, 38, 0.2);
-        }}
-
-        QLabel#successMessage {{
-            color: {SUCCESS_GREEN};
-            font-size: 13px;
-            font-weight: 500;
-            padding: 8px 12px;
-            background-color: rgba(16, 185, 129, 0.08);
-            border-radius: 8px;
-            margin-top: 5px;
-            margin-bottom: 5px;
-            border: 1px solid rgba(16, 185, 129, 0.2);
-        }}
-
-        QLabel#infoMessage {{
-            color: {INFO_BLUE};
-            font-size: 13px;
-            font-weight: 500;
-            padding: 8px 12px;
-            background-color: rgba(59, 130, 246, 0.08);
-            border-radius: 8px;
-            margin-top: 5px;
-            margin-bottom: 5px;
-            border: 1px solid rgba(59, 130, 246, 0.2);
-        }}
-        """
-
 
 # ====================================================================
 # --- Sign In Form (Signal Added) ---
@@ -267,9 +95,10 @@ class SignInForm(QWidget):
     # New signal emitted upon successful sign-in
     login_success = pyqtSignal()
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, db_executor: DatabaseExecutor):
         super().__init__()
         self.db_manager = db_manager
+        self.db_executor = db_executor
         self.setObjectName("signInForm")
         layout = QVBoxLayout(self)
 
@@ -320,11 +149,11 @@ class SignInForm(QWidget):
         layout.addWidget(self.info_message)
 
         # Sign In button
-        btn = QPushButton("Sign In")
-        btn.setObjectName("mainButton")
+        self.sign_in_btn = QPushButton("Sign In")
+        self.sign_in_btn.setObjectName("mainButton")
         # Connect button to handler
-        btn.clicked.connect(self.handle_sign_in)
-        layout.addWidget(btn)
+        self.sign_in_btn.clicked.connect(self.handle_sign_in)
+        layout.addWidget(self.sign_in_btn)
 
         layout.addStretch()
 
@@ -393,7 +222,12 @@ class SignInForm(QWidget):
         # Display a persistent message while sending (autohide=False)
         self.show_message("info", "Resending verification email...", autohide=False)
 
-        success, message = self.db_manager.resend_verification_email(email)
+        self.db_executor.submit("resend_verification_email", email,
+                                on_result=self._on_resend_finished,
+                                on_error=self._on_resend_failed)
+
+    def _on_resend_finished(self, result):
+        success, message = result
 
         if success:
             self.show_message("success", message)
@@ -403,6 +237,9 @@ class SignInForm(QWidget):
         self.resend_btn.setText("Resend Verification Email")
         self.resend_btn.setEnabled(True)
 
+    def _on_resend_failed(self, error):
+        self._on_resend_finished((False, f"❌ Error: {error}"))
+
     def handle_sign_in(self):
         email = self.email_input.text().strip()
         password = self.password_input.text().strip()
@@ -418,12 +255,22 @@ class SignInForm(QWidget):
             self.show_message("error", "Please enter a valid email address.", "email")
             return
 
-        # Attempt sign in (Uses the secure REST API check in DatabaseManager)
-        success, message = self.db_manager.sign_in_user(email, password)
+        # Attempt sign in on a worker thread (Uses the secure REST API check in DatabaseManager)
+        self.sign_in_btn.setText("Signing In...")
+        self.sign_in_btn.setEnabled(False)
+        self.db_executor.submit("sign_in_user", email, password,
+                                on_result=self._on_sign_in_finished,
+                                on_error=self._on_sign_in_failed)
 
         # Always clear password after an attempt for security
         self.password_input.clear()
 
+    def _on_sign_in_finished(self, result):
+        success, message = result
+
+        self.sign_in_btn.setText("Sign In")
+        self.sign_in_btn.setEnabled(True)
+
         if success:
             self.show_message("success", message)
             self.email_input.clear()  # Clear email on success
@@ -434,14 +281,18 @@ class SignInForm(QWidget):
         else:
             self.show_message("error", message, "email")
 
+    def _on_sign_in_failed(self, error):
+        self._on_sign_in_finished((False, f"❌ Error: {error}"))
+
 
 # ====================================================================
 # --- Sign Up Form ---
 # ====================================================================
 class SignUpForm(QWidget):
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, db_executor: DatabaseExecutor):
         super().__init__()
         self.db_manager = db_manager
+        self.db_executor = db_executor
         self.setObjectName("signUpForm")
         layout = QVBoxLayout(self)
 
@@ -490,10 +341,10 @@ class SignUpForm(QWidget):
         layout.addWidget(self.info_message)
 
         # Create Account button
-        btn = QPushButton("Create Account")
-        btn.setObjectName("mainButton")
-        btn.clicked.connect(self.handle_sign_up)
-        layout.addWidget(btn)
+        self.create_account_btn = QPushButton("Create Account")
+        self.create_account_btn.setObjectName("mainButton")
+        self.create_account_btn.clicked.connect(self.handle_sign_up)
+        layout.addWidget(self.create_account_btn)
 
         layout.addStretch()
 
@@ -577,8 +428,16 @@ class SignUpForm(QWidget):
         # Show info message while processing (autohide=False)
         self.show_message("info", "Creating account and sending verification email...", autohide=False)
 
-        # Attempt sign up
-        success, message = self.db_manager.sign_up_user(full_name, email, password)
+        # Attempt sign up on a worker thread; the result arrives in _on_sign_up_finished
+        self.create_account_btn.setEnabled(False)
+        self.db_executor.submit("sign_up_user", full_name, email, password,
+                                on_result=self._on_sign_up_finished,
+                                on_error=self._on_sign_up_failed)
+
+    def _on_sign_up_finished(self, result):
+        success, message = result
+
+        self.create_account_btn.setEnabled(True)
 
         # Now show the result, which will auto-hide
         if success:
@@ -596,6 +455,9 @@ class SignUpForm(QWidget):
 
             self.show_message("error", message, focus_field)
 
+    def _on_sign_up_failed(self, error):
+        self._on_sign_up_finished((False, f"❌ Could not create account: {error}"))
+
 
 # ====================================================================
 # --- Auth Window (Manages Stacks) ---
@@ -606,16 +468,20 @@ class AuthWindow(AuthForm):
     """
     STATIC_OVERHEAD = 220
 
+    # Events after which a form's size hint may have changed
+    LAYOUT_EVENTS = (QEvent.LayoutRequest, QEvent.Resize, QEvent.Show)
+
     # Propagate the login signal from SignInForm
     login_success = pyqtSignal()
 
-    def __init__(self, db_manager, initial_form="signup"):
+    def __init__(self, db_manager, initial_form="signup", db_executor=None):
         super().__init__(db_manager)
+        self.db_executor = db_executor or DatabaseExecutor(db_manager, parent=self)
 
         self.stacked = QStackedWidget()
 
-        self.signup_widget = SignUpForm(self.db_manager)
-        self.signin_widget = SignInForm(self.db_manager)
+        self.signup_widget = SignUpForm(self.db_manager, self.db_executor)
+        self.signin_widget = SignInForm(self.db_manager, self.db_executor)
 
         # Connect the SignInForm signal to AuthWindow's signal
         self.signin_widget.login_success.connect(self.login_success.emit)
@@ -628,9 +494,15 @@ class AuthWindow(AuthForm):
         self.switch_form.connect(self.change_form)
         self.change_form(initial_form)
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_card_height)
-        self.timer.start(50)
+        # Recompute the card height only when a form's layout actually changes
+        # (messages shown/hidden, text wrapping, resizes) instead of polling
+        self.signup_widget.installEventFilter(self)
+        self.signin_widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() in self.LAYOUT_EVENTS and watched is self.stacked.currentWidget():
+            self.update_card_height()
+        return super().eventFilter(watched, event)
 
     def update_card_height(self):
         """Dynamically adjusts the card height based on the current form's content."""
@@ -671,27 +543,36 @@ class AuthAppContainer(QMainWindow):
         self.app_stack = QStackedWidget()
         self.setCentralWidget(self.app_stack)
 
-        # 2. Instantiate the Auth UI (which manages sign-in/sign-up forms)
-        self.auth_component = AuthWindow(db_manager, initial_form)
+        # 2. Shared background executor for every DatabaseManager call
+        self.db_executor = DatabaseExecutor(db_manager, parent=self)
+
+        # 3. Instantiate the Auth UI (which manages sign-in/sign-up forms)
+        self.auth_component = AuthWindow(db_manager, initial_form, self.db_executor)
 
-        # 3. Instantiate the Main Interface
-        self.main_component = MainInterface()
+        # 4. Instantiate the Main Interface (projects are paged in from Firestore after sign-in)
+        self.main_component = MainInterface(db_manager, self.db_executor)
 
-        # 4. Add components to the main stack
+        # 5. Add components to the main stack
         self.app_stack.addWidget(self.auth_component)  # Index 0: Auth
         self.app_stack.addWidget(self.main_component)  # Index 1: Main App
 
-        # 5. Connect the signal from the AuthWindow to the switch method
+        # 6. Connect the signal from the AuthWindow to the switch method
         self.auth_component.login_success.connect(self.show_main_interface)
 
         # Start on the Auth screen
         self.app_stack.setCurrentIndex(0)
 
+    def closeEvent(self, event):
+        """Lets in-flight database calls finish before the window goes away."""
+        self.db_executor.wait_for_done(5000)
+        super().closeEvent(event)
+
     def show_main_interface(self):
         """Switches the QStackedWidget view to the main application interface."""
         # Switch to the MainInterface (Index 1)
         self.app_stack.setCurrentIndex(1)
         self.setWindowTitle("DataForge - Main Application")
+        self.main_component.load_projects()
 
 
 # Renamed to AuthAppContainer to resolve the import conflict
@@ -0,0 +1,88 @@
+"""
+Cold-start benchmark: time from launching a fresh interpreter to the first painted auth window.
+
+Each run starts a new process that builds the same window main.py shows
+(without a Firebase key or network access) and reports as soon as the first
+frame has been processed. Exits with status 1 if the median exceeds the budget.
+
+    python startup_benchmark.py [--runs 5] [--budget-ms 500]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+DEFAULT_BUDGET_MS = 500
+FIRST_FRAME_MARKER = "FIRST_FRAME"
+
+
+def run_child():
+    """Builds the auth window like main.py and prints the marker once the first frame is out."""
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt, QTimer
+
+    from database_manager import DatabaseManager
+    from sign_in_up import AuthAppContainer
+
+    app = QApplication(sys.argv[:1])
+    app.setAttribute(Qt.AA_EnableHighDpiScaling)
+    app.setStyle("Fusion")
+
+    window = AuthAppContainer(db_manager=DatabaseManager(), initial_form="signup")
+    window.show()
+
+    def first_frame():
+        print(FIRST_FRAME_MARKER, flush=True)
+        app.quit()
+
+    QTimer.singleShot(0, first_frame)
+    app.exec_()
+
+
+def measure_once():
+    """Returns milliseconds from process launch until the child reports its first frame."""
+    env = dict(os.environ)
+    if sys.platform.startswith("linux") and not env.get("DISPLAY") and not env.get("WAYLAND_DISPLAY"):
+        env.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    started = time.perf_counter()
+    child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--child"],
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                             text=True, env=env, cwd=os.path.dirname(os.path.abspath(__file__)))
+    for line in child.stdout:
+        if line.strip() == FIRST_FRAME_MARKER:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            child.wait()
+            return elapsed_ms
+
+    child.wait()
+    raise RuntimeError(f"Benchmark child exited with status {child.returncode} before the first frame")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure cold start to first frame.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child()
+        return 0
+
+    timings = [measure_once() for _ in range(args.runs)]
+    median = statistics.median(timings)
+    print("Cold start to first frame: " + ", ".join(f"{t:.0f}" for t in timings) + " ms")
+    print(f"Median {median:.0f} ms (budget {args.budget_ms:.0f} ms)")
+
+    if median > args.budget_ms:
+        print("❌ Startup is over budget")
+        return 1
+    print("✅ Startup is within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,12 @@
+import os
+
+import pytest
+
+# Widgets are created without a display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
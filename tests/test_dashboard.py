@@ -0,0 +1,70 @@
+import pytest
+
+
+@pytest.fixture
+def dashboard(qapp):
+    from main_interface import DataForgeApp, ProjectItem
+
+    window = DataForgeApp()
+    window.set_projects([ProjectItem(f"p{i}", f"Project {i}", "", "2026-01-01") for i in range(40)])
+    yield window
+    window.deleteLater()
+
+
+def _ids(window):
+    return [project.project_id for project in window.projects]
+
+
+def test_remove_keeps_the_newest_first_order(dashboard):
+    grid = dashboard.project_grid
+    cells_before = {pid: grid.cell_of(pid) for pid in grid.cards}
+    dashboard.remove_project("p1")
+
+    assert _ids(dashboard) == ["p0"] + [f"p{i}" for i in range(2, 40)]
+    assert grid.cell_of("p0") == cells_before["p0"]
+    assert all(grid.cell_of(f"p{i}") == cells_before[f"p{i - 1}"] for i in range(2, 40))
+
+
+def test_new_and_updated_projects_go_first(dashboard):
+    from main_interface import ProjectItem
+
+    dashboard.add_project(ProjectItem("new", "New", "", "2026-02-01"))
+    dashboard.add_project(ProjectItem("p5", "Renamed", "", "2026-02-02"))
+
+    assert _ids(dashboard)[:3] == ["p5", "new", "p0"]
+    assert len(dashboard.projects) == 41
+    assert dashboard.project_grid.cell_of("p5") == (0, 0)
+    assert dashboard.project_grid.cards["p5"].title_label.text() == "Renamed"
+
+
+def test_one_add_or_delete_touches_one_card_on_a_large_grid(dashboard, monkeypatch):
+    from main_interface import ProjectCard, ProjectItem
+
+    dashboard.set_projects([ProjectItem(f"p{i}", f"Project {i}", "", "2026-01-01") for i in range(300)])
+    grid = dashboard.project_grid
+    layout_calls, changed = [], []
+    insert_widget, remove_widget, set_item = grid.grid_layout.insertWidget, grid.grid_layout.removeWidget, ProjectCard.set_item
+
+    def counted_set_item(card, item):
+        result = set_item(card, item)
+        if result:
+            changed.append(item.project_id)
+        return result
+
+    monkeypatch.setattr(grid.grid_layout, "insertWidget", lambda index, widget: (layout_calls.append(("insert", index)),
+                                                                               insert_widget(index, widget)))
+    monkeypatch.setattr(grid.grid_layout, "removeWidget", lambda widget: (layout_calls.append(("remove", widget.item.project_id)),
+                                                                          remove_widget(widget)))
+    monkeypatch.setattr(ProjectCard, "set_item", counted_set_item)
+
+    dashboard.add_project(ProjectItem("new", "New", "", "2026-02-01"))
+    assert layout_calls == [("insert", 0)]
+    assert changed == ["new"]
+    assert grid.cell_of("new") == (0, 0) and grid.cell_of("p0") == (0, 1)
+
+    layout_calls.clear(), changed.clear()
+    dashboard.remove_project("p150")
+    assert layout_calls == [("remove", "p150")]
+    assert changed == []
+    assert grid.cell_of("p151") == divmod(151, 2)
+    assert _ids(dashboard) == ["new"] + [f"p{i}" for i in range(300) if i != 150]
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from data_generator import (
+    BLOCK_ROWS,
+    FIELD_TYPES,
+    IndexPermutation,
+    RecordBatch,
+    compile_schema,
+    generate,
+    generate_parallel,
+)
+from exporters import export
+from schema_model import Schema
+
+SCHEMA = Schema([(field_type, field_type) for field_type in FIELD_TYPES], name="Every type")
+SCHEMA.add_field("Adult", "Date of Birth", options={"min_age": 18, "max_age": 65})
+SCHEMA.add_field("Login", "Email Address", options={"unique": True})
+SEED = 11
+
+
+# --- Reproducibility ---
+# Rows that end mid-block, so shards and batches split blocks in different places
+NUM_ROWS = 3 * BLOCK_ROWS + 123
+
+
+def _columns_equal(left, right):
+    return left.field_names == right.field_names and all(
+        np.array_equal(left.columns[name], right.columns[name]) for name in left.field_names)
+
+
+@pytest.mark.parametrize("workers, batch_rows", [(1, BLOCK_ROWS), (1, 1000), (2, BLOCK_ROWS), (2, 2 * BLOCK_ROWS + 7)])
+def test_export_bytes_do_not_depend_on_workers_or_batch_size(tmp_path, workers, batch_rows):
+    reference = tmp_path / "reference.csv"
+    export(SCHEMA, str(reference), NUM_ROWS, seed=SEED, workers=1)
+    path = tmp_path / "rows.csv"
+    export(SCHEMA, str(path), NUM_ROWS, seed=SEED, workers=workers, batch_rows=batch_rows)
+
+    assert path.read_bytes() == reference.read_bytes()
+
+
+@pytest.mark.parametrize("workers, shard_rows", [(1, BLOCK_ROWS), (2, BLOCK_ROWS), (2, 5000)])
+def test_generate_parallel_matches_generate(workers, shard_rows):
+    expected = generate(SCHEMA, NUM_ROWS, seed=SEED)
+
+    assert _columns_equal(generate_parallel(SCHEMA, NUM_ROWS, seed=SEED, workers=workers, shard_rows=shard_rows), expected)
+
+
+def test_other_seeds_give_other_rows():
+    assert not _columns_equal(generate(SCHEMA, 100, seed=SEED), generate(SCHEMA, 100, seed=SEED + 1))
+
+
+# --- Unique columns ---
+UNIQUE_SCHEMA = Schema([
+    ("Login", "Email Address", {"unique": True}),
+    ("Phone", "Phone Number", {"unique": True}),
+])
+
+
+@pytest.mark.parametrize("size", [1, 2, 1000, 4097, 65536 + 5])
+def test_index_permutation_is_a_bijection(size):
+    permuted = IndexPermutation(size, SEED, 1)(np.arange(size, dtype=np.uint64))
+
+    assert np.array_equal(np.sort(permuted), np.arange(size))
+
+
+def test_unique_columns_never_repeat_across_shards():
+    batch = generate_parallel(UNIQUE_SCHEMA, NUM_ROWS, seed=SEED, workers=2, shard_rows=1000)
+
+    for name in UNIQUE_SCHEMA.field_names:
+        assert len(set(batch.columns[name])) == NUM_ROWS
+
+
+def test_unique_columns_are_the_same_in_one_range_or_slices():
+    plan = compile_schema(UNIQUE_SCHEMA)
+    whole = plan.generate_rows(0, NUM_ROWS, SEED)
+    bounds = [0, 1, BLOCK_ROWS - 1, BLOCK_ROWS + 500, 2 * BLOCK_ROWS, NUM_ROWS]
+    sliced = RecordBatch.concat(plan.generate_rows(start, stop, SEED) for start, stop in zip(bounds, bounds[1:]))
+
+    assert _columns_equal(sliced, whole)
+
+
+def test_rows_beyond_the_unique_capacity_are_rejected():
+    plan = compile_schema(UNIQUE_SCHEMA)
+    capacity = plan.by_name["Login"].unique_capacity
+
+    with pytest.raises(ValueError, match="distinct values"):
+        plan.generate_rows(capacity - 1, capacity + 1, SEED)
+    assert plan.generate_rows(capacity - 1, capacity, SEED).num_rows == 1
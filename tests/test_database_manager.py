@@ -0,0 +1,89 @@
+import threading
+import types
+
+import pytest
+
+import database_manager
+from database_manager import DatabaseManager
+from firestore_batch import FirestoreWriteBatcher
+from schema_model import Schema
+
+
+class FakeReference:
+    """A Firestore document or collection path; documents live in FakeFirestore.documents by path."""
+
+    def __init__(self, db, path):
+        self.db = db
+        self.path = path
+        self.id = path[-1]
+
+    def collection(self, name):
+        return FakeReference(self.db, self.path + (name,))
+
+    def document(self, document_id):
+        return FakeReference(self.db, self.path + (document_id,))
+
+    def list_documents(self):
+        depth = len(self.path) + 1
+        return [FakeReference(self.db, path) for path in self.db.documents
+                if len(path) == depth and path[:-1] == self.path]
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.operations = []
+
+    def set(self, reference, data, merge=False):
+        self.operations.append((reference.path, data))
+
+    def delete(self, reference):
+        self.operations.append((reference.path, None))
+
+    def commit(self):
+        for path, data in self.operations:
+            if data is None:
+                self.db.documents.pop(path, None)
+            else:
+                self.db.documents[path] = data
+
+
+class FakeFirestore:
+    def __init__(self):
+        self.documents = {}
+
+    def collection(self, name):
+        return FakeReference(self, (name,))
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(database_manager, "firestore", types.SimpleNamespace(SERVER_TIMESTAMP="now"))
+    manager = DatabaseManager()
+    manager._db = FakeFirestore()
+    manager._init_thread = threading.Thread(target=lambda: None)  # Firebase counts as initialized
+    manager._init_thread.start()
+    manager._writer = FirestoreWriteBatcher(manager._db, flush_interval=60)
+    yield manager
+    manager._writer.close()
+
+
+def _field_names(manager):
+    fields = sorted((path, data) for path, data in manager._db.documents.items() if path[-2] == "fields")
+    return [data["name"] for _, data in fields]
+
+
+def test_saving_a_shorter_schema_deletes_the_old_trailing_fields(manager):
+    long = Schema([("Name", "Full Name"), ("Email", "Email Address"), ("Phone", "Phone Number")], name="People")
+    short = Schema([("Login", "Email Address")], name="People")
+
+    assert manager.save_schema("project", long)[0]
+    assert _field_names(manager) == ["Name", "Email", "Phone"]
+    assert manager.save_schema("project", short)[0]
+
+    assert _field_names(manager) == ["Login"]
+    schema_document = manager._db.documents[("projects", "project", "schemas", "People")]
+    assert schema_document["field_count"] == 1
@@ -0,0 +1,98 @@
+import email
+import html
+import textwrap
+import time
+from email import policy
+from email.message import EmailMessage
+
+import pytest
+
+from email_templates import (
+    VERIFICATION_HTML,
+    VERIFICATION_SUBJECT,
+    VERIFICATION_TEXT,
+    CompiledTemplate,
+    VerificationEmailTemplate,
+)
+
+SENDER_NAME, SENDER_EMAIL = "DataForge", "app@example.com"
+LINK = "https://example.com/verify?oobCode=abc&mode=verifyEmail&lang=en"
+
+
+@pytest.fixture
+def template():
+    return VerificationEmailTemplate(SENDER_NAME, SENDER_EMAIL)
+
+
+def _expected(recipient, link):
+    """The same message built with the email package, as a reference."""
+    def fill(source, link_html):
+        body = textwrap.dedent(source).strip("\n")
+        return body.replace("{{link_html}}", link_html).replace("{{link}}", link).replace("{{year}}", time.strftime("%Y"))
+
+    message = EmailMessage()
+    message["Subject"] = VERIFICATION_SUBJECT
+    message["From"] = f"{SENDER_NAME} <{SENDER_EMAIL}>"
+    message["To"] = recipient
+    message.set_content(fill(VERIFICATION_TEXT, link))
+    message.add_alternative(fill(VERIFICATION_HTML, html.escape(link, quote=True)), subtype="html")
+    return email.message_from_bytes(message.as_bytes(), policy=policy.default)
+
+
+def _body(part):
+    return part.get_content().replace("\r\n", "\n").strip("\n")
+
+
+def _assert_same_message(rendered, expected):
+    message = email.message_from_bytes(rendered, policy=policy.default)
+    for header in ("Subject", "From", "To"):
+        assert str(message[header]) == str(expected[header])
+    assert message.get_content_type() == "multipart/alternative"
+
+    parts, expected_parts = list(message.iter_parts()), list(expected.iter_parts())
+    assert [part.get_content_type() for part in parts] == ["text/plain", "text/html"]
+    assert [_body(part) for part in parts] == [_body(part) for part in expected_parts]
+    return parts
+
+
+def test_compiled_template_fills_every_slot():
+    compiled = CompiledTemplate("a {{x}} b {{y}} {{x}}")
+
+    assert compiled.slot_names == {"x", "y"}
+    assert compiled.render({"x": b"1", "y": b"2"}) == b"a 1 b 2 1"
+
+
+def test_ascii_message_matches_the_email_package(template):
+    rendered = template.render("user@example.com", LINK)
+    text, html_part = _assert_same_message(rendered, _expected("user@example.com", LINK))
+
+    assert LINK in text.get_content()
+    assert html.escape(LINK, quote=True) in html_part.get_content()
+    assert LINK not in html_part.get_content()  # & must be escaped in the HTML part
+    assert rendered.isascii() and b"\r\n" in rendered and b"\n" not in rendered.replace(b"\r\n", b"")
+
+
+@pytest.mark.parametrize("recipient, link", [
+    ("josé@example.com", LINK),
+    ("user@example.com", "https://example.com/verify?name=José&oobCode=abc"),
+])
+def test_non_ascii_input_falls_back_to_the_email_package(template, recipient, link):
+    rendered = template.render(recipient, link)
+    text, html_part = _assert_same_message(rendered, _expected(recipient, link))
+
+    assert rendered.isascii()  # Headers and bodies are encoded for transport
+    assert link in text.get_content()
+    assert html.escape(link, quote=True) in html_part.get_content()
+
+
+def test_rendering_reuses_the_compiled_document(template):
+    first = template.render("a@example.com", LINK)
+    second = template.render("b@example.com", LINK)
+
+    assert first.replace(b"a@example.com", b"b@example.com") == second
+
+
+@pytest.mark.parametrize("recipient", ["user@example.com\r\nBcc: x@example.com", "user@example.com\nX: y"])
+def test_header_injection_is_rejected(template, recipient):
+    with pytest.raises(ValueError, match="Invalid recipient"):
+        template.render(recipient, LINK)
@@ -0,0 +1,75 @@
+import gzip
+
+import pytest
+
+import exporters
+from data_generator import FIELD_TYPES, compile_schema, generate
+from exporters import BatchEncoder, CsvWriter, export
+from schema_model import Schema
+
+SCHEMA = Schema([(field_type, field_type) for field_type in FIELD_TYPES], name="Every type")
+
+
+def test_compressed_export_round_trips(tmp_path):
+    path = tmp_path / "rows.csv.gz"
+    result = export(SCHEMA, str(path), 3000, seed=3, batch_rows=1000, codec_threads=2)
+
+    lines = gzip.decompress(path.read_bytes()).decode("utf-8").splitlines()
+    assert result.bytes_written == path.stat().st_size
+    assert lines[1:] == [",".join(row) for row in generate(SCHEMA, 3000, seed=3).to_rows()]
+
+
+@pytest.mark.parametrize("name, compression", [("rows.parquet", "snappy"), ("rows.arrow", "lz4")])
+def test_arrow_formats_take_their_writer_compression(tmp_path, name, compression):
+    pa = pytest.importorskip("pyarrow")
+    path = tmp_path / name
+    result = export(SCHEMA, str(path), 3000, seed=3, batch_rows=1000, compression=compression)
+
+    if name.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        metadata = pq.ParquetFile(str(path)).metadata
+        assert metadata.row_group(0).column(0).compression == compression.upper()
+        assert metadata.num_rows == 3000
+    else:
+        with pa.ipc.open_file(str(path)) as reader:
+            assert reader.read_all().num_rows == 3000
+    assert result.rows == 3000
+
+
+@pytest.mark.parametrize("name", ["rows.parquet", "rows.arrow"])
+def test_arrow_formats_reject_a_stream_codec(tmp_path, name):
+    pytest.importorskip("pyarrow")
+    with pytest.raises(ValueError, match="compressed internally"):
+        export(SCHEMA, str(tmp_path / name), 10, seed=3, codec="gzip")
+
+
+def test_failed_compressed_export_shuts_down_the_stream(tmp_path, monkeypatch):
+    streams = []
+
+    class RecordedStream(exporters.CompressedStream):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            streams.append(self)
+
+    def progress(rows):
+        raise RuntimeError("cancelled")
+
+    monkeypatch.setattr(exporters, "CompressedStream", RecordedStream)
+    with pytest.raises(RuntimeError, match="cancelled"):
+        export(SCHEMA, str(tmp_path / "rows.csv.zst"), 3000, seed=3, batch_rows=1000, codec_threads=2,
+               progress=progress)
+
+    [stream] = streams
+    assert stream.closed
+    with pytest.raises(RuntimeError):
+        stream._pool.submit(len, b"")  # The pool has been shut down
+
+
+def test_encoder_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(exporters, "_encoders", exporters.OrderedDict())
+    encode = BatchEncoder(CsvWriter)
+    for i in range(exporters.MAX_CACHED_ENCODERS + 5):
+        plan = compile_schema(Schema([(f"Name {i}", "Full Name")]))
+        encode(plan, plan.generate_rows(0, 1, seed=1))
+
+    assert len(exporters._encoders) == exporters.MAX_CACHED_ENCODERS
@@ -0,0 +1,31 @@
+import pytest
+
+import fakedatagen
+from exporters import parse_copy_text
+from schema_model import Schema
+
+SCHEMA = Schema([("Name", "Full Name"), ("Email", "Email Address")], name="People")
+
+
+@pytest.fixture
+def schema_path(tmp_path):
+    path = tmp_path / "people.json"
+    path.write_text(SCHEMA.to_json(), "utf-8")
+    return path
+
+
+def test_table_turns_pgcopy_output_into_a_copy_script(tmp_path, schema_path):
+    output = tmp_path / "rows.copy"
+    assert fakedatagen.main([str(schema_path), "-n", "3", "-o", str(output), "-s", "1", "--table", "people", "-q"]) == 0
+
+    data = output.read_bytes()
+    assert data.startswith(b'COPY "people" ("Name", "Email") FROM STDIN;\n')
+    assert data.endswith(b"\\.\n")
+    assert len(parse_copy_text(data.split(b"\n", 1)[1])) == 3
+
+
+@pytest.mark.parametrize("output", ["rows.parquet", "rows.arrow"])
+def test_compression_is_rejected_for_arrow_formats(tmp_path, schema_path, capsys, output):
+    with pytest.raises(SystemExit):
+        fakedatagen.parse_args([str(schema_path), "-n", "3", "-o", str(tmp_path / output), "-c", "zstd"])
+    assert "compressed internally" in capsys.readouterr().err
@@ -0,0 +1,116 @@
+import threading
+
+import pytest
+
+from firestore_batch import FirestoreWriteBatcher
+
+
+class FakeBatch:
+    def __init__(self, db):
+        self.db = db
+        self.operations = []
+
+    def set(self, reference, data, merge=False):
+        if not isinstance(data, dict):
+            raise TypeError("document data must be a dict")
+        self.operations.append(("set", reference, data, merge))
+
+    def update(self, reference, data):
+        self.operations.append(("update", reference, data))
+
+    def delete(self, reference):
+        self.operations.append(("delete", reference))
+
+    def commit(self):
+        with self.db.lock:
+            if self.db.fail_commits:
+                raise RuntimeError("commit rejected")
+            self.db.commits.append(self.operations)
+
+
+class FakeDB:
+    """Stands in for a Firestore client: only batch() is used, and every committed batch is recorded."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.commits = []
+        self.fail_commits = False
+
+    def batch(self):
+        return FakeBatch(self)
+
+
+@pytest.fixture
+def db():
+    return FakeDB()
+
+
+def test_writes_are_committed_in_chunks_of_max_ops(db):
+    writer = FirestoreWriteBatcher(db, max_ops=10, flush_interval=60)
+    futures = [writer.set(f"users/{i}", {"n": i}) for i in range(25)]
+
+    assert [len(batch) for batch in db.commits] == [10, 10]  # Two full chunks went out on their own
+    assert writer.flush() == 5
+    writer.close()
+
+    assert [len(batch) for batch in db.commits] == [10, 10, 5]
+    assert all(future.result(timeout=1) for future in futures)
+    assert [operation[1] for batch in db.commits for operation in batch] == [f"users/{i}" for i in range(25)]
+
+
+def test_each_operation_is_replayed_on_the_batch(db):
+    writer = FirestoreWriteBatcher(db, flush_interval=60)
+    writer.set("a", {"x": 1}, merge=True)
+    writer.update("b", {"y": 2})
+    writer.delete("c")
+    writer.close()
+
+    assert db.commits == [[("set", "a", {"x": 1}, True), ("update", "b", {"y": 2}), ("delete", "c")]]
+
+
+def test_failed_commit_fails_every_future_in_the_chunk(db):
+    db.fail_commits = True
+    writer = FirestoreWriteBatcher(db, flush_interval=60)
+    futures = [writer.set(f"users/{i}", {}) for i in range(3)]
+
+    assert writer.flush() == 0
+    for future in futures:
+        with pytest.raises(RuntimeError, match="commit rejected"):
+            future.result(timeout=1)
+    writer.close()
+
+
+def test_write_rejected_while_building_the_batch_fails_its_chunk(db):
+    writer = FirestoreWriteBatcher(db, flush_interval=60)
+    futures = [writer.set("users/1", "not a document"), writer.set("users/2", {})]
+
+    assert writer.flush() == 0
+    for future in futures:
+        with pytest.raises(TypeError, match="must be a dict"):
+            future.result(timeout=1)
+    writer.close()
+
+
+def test_background_flusher_survives_a_rejected_write(db):
+    writer = FirestoreWriteBatcher(db, flush_interval=0.01)
+
+    with pytest.raises(TypeError):
+        writer.set("users/1", "not a document").result(timeout=5)
+    assert writer.set("users/2", {}).result(timeout=5) is True
+    writer.close()
+
+
+def test_background_flusher_commits_pending_writes(db):
+    writer = FirestoreWriteBatcher(db, flush_interval=0.01)
+    future = writer.set("users/1", {})
+
+    assert future.result(timeout=5) is True
+    writer.close()
+
+
+def test_closed_batcher_rejects_writes(db):
+    writer = FirestoreWriteBatcher(db, flush_interval=60)
+    writer.close()
+
+    with pytest.raises(RuntimeError):
+        writer.set("users/1", {})
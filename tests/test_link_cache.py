@@ -0,0 +1,77 @@
+import pytest
+
+from link_cache import VerificationLinkCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return VerificationLinkCache(ttl=60, max_entries=3, min_send_interval=30, clock=clock)
+
+
+def test_links_expire_after_the_ttl(cache, clock):
+    cache.put("User@Example.com ", "link-1")
+
+    clock.advance(59.9)
+    assert cache.get("user@example.com") == "link-1"  # Addresses are matched case- and space-insensitively
+    clock.advance(0.1)
+    assert cache.get("user@example.com") is None
+
+
+def test_least_recently_used_link_is_evicted_at_capacity(cache):
+    for name in "abc":
+        cache.put(f"{name}@example.com", name)
+    assert cache.get("a@example.com") == "a"  # a is now the most recently used
+
+    cache.put("d@example.com", "d")
+
+    assert cache.get("b@example.com") is None
+    assert [cache.get(f"{name}@example.com") for name in "acd"] == ["a", "c", "d"]
+
+
+def test_sends_are_throttled_per_address(cache, clock):
+    assert cache.reserve_send("a@example.com")
+    assert not cache.reserve_send("A@example.com")
+    assert cache.reserve_send("b@example.com")  # Other addresses are not held up
+    assert cache.seconds_until_send_allowed("a@example.com") == 30
+
+    clock.advance(29.5)
+    assert not cache.reserve_send("a@example.com")
+    assert cache.seconds_until_send_allowed("a@example.com") == 1
+    clock.advance(0.5)
+    assert cache.seconds_until_send_allowed("a@example.com") == 0
+    assert cache.reserve_send("a@example.com")
+
+
+def test_cancelled_or_invalidated_sends_can_be_retried_at_once(cache):
+    assert cache.reserve_send("a@example.com")
+    cache.cancel_send("a@example.com")
+    assert cache.reserve_send("a@example.com")
+
+    cache.put("a@example.com", "link")
+    cache.invalidate("a@example.com")
+    assert cache.get("a@example.com") is None
+    assert cache.reserve_send("a@example.com")
+
+
+def test_send_history_is_bounded_by_max_entries(cache):
+    for name in "abcd":
+        assert cache.reserve_send(f"{name}@example.com")
+
+    assert cache.reserve_send("a@example.com")  # The oldest record was dropped to make room
+    assert not cache.reserve_send("d@example.com")
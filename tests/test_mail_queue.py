@@ -0,0 +1,138 @@
+import smtplib
+import socketserver
+import threading
+
+import pytest
+
+from mail_queue import MailQueue, smtp_connection_factory
+
+REJECTED = "reject@example.com"
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: every connection and accepted message is recorded on the server."""
+
+    def handle(self):
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self._reply("220 stand-in ESMTP")
+        recipients = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("ascii").strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self._reply("250 stand-in")
+            elif command.startswith("MAIL FROM"):
+                recipients = []
+                self._reply("250 OK")
+            elif command.startswith("RCPT TO"):
+                if REJECTED.upper() in command:
+                    self._reply("550 No such user")
+                else:
+                    recipients.append(command)
+                    self._reply("250 OK")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                while True:
+                    data_line = self.rfile.readline()
+                    if data_line in (b".\r\n", b""):
+                        break
+                    lines.append(data_line)
+                with server.lock:
+                    server.messages.append(b"".join(lines))
+                    drop = server.drop_after_next
+                    server.drop_after_next = False
+                if drop:
+                    return  # Hang up without acknowledging, like a dropped connection
+                self._reply("250 OK")
+            elif command in ("NOOP", "RSET"):
+                self._reply("250 OK")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Not implemented")
+
+    def _reply(self, text):
+        self.wfile.write(text.encode("ascii") + b"\r\n")
+
+
+class _SMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages = []
+        self.drop_after_next = False
+
+
+@pytest.fixture
+def smtp_server():
+    server = _SMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _connect(server):
+    host, port = server.server_address
+    return lambda: smtplib.SMTP(host, port, timeout=5)
+
+
+def test_delivers_every_message_over_pooled_connections(smtp_server):
+    mail = MailQueue(_connect(smtp_server), workers=2, backoff=0.01)
+    futures = [mail.enqueue("app@example.com", [f"user{i}@example.com"], f"Subject: {i}\r\n\r\nBody {i}\r\n".encode())
+               for i in range(25)]
+    mail.close()
+
+    assert all(future.result(timeout=5) for future in futures)
+    assert len(smtp_server.messages) == 25
+    assert smtp_server.connections <= 2
+
+
+def test_rejected_recipient_fails_only_its_message(smtp_server):
+    mail = MailQueue(_connect(smtp_server), workers=1, backoff=0.01)
+    good = mail.enqueue("app@example.com", ["ok@example.com"], b"Subject: ok\r\n\r\nok\r\n")
+    bad = mail.enqueue("app@example.com", [REJECTED], b"Subject: no\r\n\r\nno\r\n")
+    mail.close()
+
+    assert good.result(timeout=5) is True
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        bad.result(timeout=5)
+
+
+def test_dropped_connection_is_reopened_and_the_message_retried(smtp_server):
+    smtp_server.drop_after_next = True
+    mail = MailQueue(_connect(smtp_server), workers=1, backoff=0.01)
+    future = mail.enqueue("app@example.com", ["ok@example.com"], b"Subject: retry\r\n\r\nretry\r\n")
+    mail.close()
+
+    assert future.result(timeout=5) is True
+    assert smtp_server.connections == 2
+
+
+def test_connection_that_fails_tls_is_closed(smtp_server, monkeypatch):
+    opened = []
+
+    class RecordingSMTP(smtplib.SMTP):
+        def connect(self, *args, **kwargs):
+            opened.append(self)
+            return super().connect(*args, **kwargs)
+
+    monkeypatch.setattr(smtplib, "SMTP", RecordingSMTP)
+    host, port = smtp_server.server_address
+    connect = smtp_connection_factory({'smtp_server': host, 'smtp_port': port, 'use_tls': True,
+                                       'sender_email': "app@example.com", 'sender_password': "secret"})
+
+    with pytest.raises(smtplib.SMTPNotSupportedError):  # The stand-in server offers no STARTTLS
+        connect()
+    assert len(opened) == 1 and opened[0].sock is None
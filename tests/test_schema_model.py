@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+import fakedatagen
+from schema_model import Schema
+
+SCHEMA = Schema([("Name", "Full Name"), ("Birthday", "Date of Birth")], name="People")
+SCHEMA.add_field("Adult", "Date of Birth", options={"min_age": 18})
+
+
+def test_binary_and_json_round_trip():
+    assert Schema.from_bytes(SCHEMA.to_bytes()) == SCHEMA
+    assert Schema.from_json(SCHEMA.to_json()) == SCHEMA
+
+
+@pytest.mark.parametrize("size", range(len(SCHEMA.to_bytes())))
+def test_truncated_binary_schema_raises_value_error(size):
+    with pytest.raises(ValueError):
+        Schema.from_bytes(SCHEMA.to_bytes()[:size])
+
+
+@pytest.mark.parametrize("options", ["[1]", "18", '"adult"', "true"])
+def test_binary_schema_with_non_object_options_raises_value_error(options):
+    options_json = SCHEMA[2]._options_json().encode()
+    # Same length, so every length prefix stays valid and only the options are wrong
+    corrupt = SCHEMA.to_bytes().replace(options_json, options.encode().ljust(len(options_json)))
+
+    with pytest.raises(ValueError, match="Malformed field options"):
+        Schema.from_bytes(corrupt)
+
+
+@pytest.mark.parametrize("data", [
+    {"fields": [{"name": "Name"}]},
+    {"fields": [{"type": "Full Name"}]},
+    {"fields": ["Name"]},
+    {"fields": [{"name": "Name", "type": "Full Name", "options": [1]}]},
+    {"version": "2"},
+    ["Name", "Full Name"],
+])
+def test_malformed_json_schema_raises_value_error(data):
+    with pytest.raises(ValueError, match="Malformed schema"):
+        Schema.from_dict(data)
+
+
+@pytest.mark.parametrize("suffix, content", [
+    (".json", json.dumps({"fields": [{"name": "Name"}]}).encode()),
+    (".dfschema", SCHEMA.to_bytes()[:8]),
+])
+def test_cli_reports_broken_schema_files_without_a_traceback(tmp_path, capsys, suffix, content):
+    path = tmp_path / f"broken{suffix}"
+    path.write_bytes(content)
+
+    assert fakedatagen.main([str(path), "-n", "5", "-o", str(tmp_path / "rows.csv")]) == 1
+    assert capsys.readouterr().err.startswith("❌ ")
@@ -0,0 +1,108 @@
+import datetime
+import io
+import sqlite3
+import struct
+
+import numpy as np
+import pytest
+
+from data_generator import ColumnPlan, FIELD_TYPES, RecordBatch, compile_schema, generate
+from exporters import (
+    DEFAULT_TABLE,
+    PostgresCopyWriter,
+    SqlInsertWriter,
+    export,
+    load_sqlite,
+    parse_copy_binary,
+    parse_copy_text,
+)
+from schema_model import Schema
+
+SCHEMA = Schema([(field_type, field_type) for field_type in FIELD_TYPES], name="Every type")
+NUM_ROWS = 2500
+SEED = 7
+
+
+@pytest.fixture(scope="module")
+def expected_rows():
+    return generate(SCHEMA, NUM_ROWS, seed=SEED).to_rows()
+
+
+def _select_all(connection):
+    return connection.execute(f'SELECT * FROM "{DEFAULT_TABLE}" ORDER BY rowid').fetchall()
+
+
+def _encode(writer_class, batch, **options):
+    stream = io.BytesIO()
+    writer = writer_class(stream, compile_schema(SCHEMA), **options)
+    writer.begin()
+    writer.write_batch(batch)
+    writer.close()
+    return stream.getvalue()
+
+
+def _awkward_batch():
+    """Two rows whose text holds every character the SQL and COPY writers have to escape."""
+    values = ["O'Brien \\ tab\there", "line\nbreak\r\n", "", "ünïcødé ✓", "back\\slash''"]
+    columns = {field_type: np.array([value, value[::-1]], dtype=object) for field_type, value in zip(FIELD_TYPES, values)}
+    return RecordBatch(0, 2, columns)
+
+
+def test_sql_script_loads_into_sqlite(tmp_path, expected_rows):
+    path = tmp_path / "rows.sql"
+    result = export(SCHEMA, str(path), NUM_ROWS, seed=SEED, batch_rows=1000, rows_per_statement=300)
+
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(path.read_text("utf-8"))
+    assert result.rows == NUM_ROWS
+    assert _select_all(connection) == expected_rows
+
+
+def test_sql_script_escapes_quotes(monkeypatch):
+    monkeypatch.setattr(ColumnPlan, "may_contain", lambda self, characters: True)
+    batch = _awkward_batch()
+
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(_encode(SqlInsertWriter, batch).decode("utf-8"))
+    assert _select_all(connection) == batch.to_rows()
+
+
+def test_load_sqlite_matches_generate(tmp_path, expected_rows):
+    path = tmp_path / "rows.db"
+    result = load_sqlite(SCHEMA, str(path), NUM_ROWS, seed=SEED, batch_rows=1000)
+
+    with sqlite3.connect(path) as connection:
+        assert result.rows == NUM_ROWS
+        assert _select_all(connection) == expected_rows
+
+
+def test_copy_text_round_trip(tmp_path, expected_rows):
+    path = tmp_path / "rows.copy"
+    export(SCHEMA, str(path), NUM_ROWS, seed=SEED, batch_rows=1000)
+
+    assert parse_copy_text(path.read_bytes()) == expected_rows
+
+
+def test_copy_text_escapes_special_characters(monkeypatch):
+    monkeypatch.setattr(ColumnPlan, "may_contain", lambda self, characters: True)
+    batch = _awkward_batch()
+
+    assert parse_copy_text(_encode(PostgresCopyWriter, batch)) == batch.to_rows()
+
+
+def test_copy_binary_round_trip(tmp_path, expected_rows):
+    path = tmp_path / "rows.pgcopy"
+    export(SCHEMA, str(path), NUM_ROWS, seed=SEED, batch_rows=1000)
+
+    pg_epoch = datetime.date(2000, 1, 1)
+    decoded = []
+    for row in parse_copy_binary(path.read_bytes()):
+        *text, days = row
+        date = pg_epoch + datetime.timedelta(days=struct.unpack(">i", days)[0])
+        decoded.append(tuple(value.decode("utf-8") for value in text) + (date.isoformat(),))
+    assert decoded == expected_rows
+
+
+def test_copy_binary_rejects_other_data():
+    with pytest.raises(ValueError):
+        parse_copy_binary(b"not a copy file")
@@ -0,0 +1,702 @@
+"""
+Application-wide theme.
+
+Every window's rules live here and are compiled into a single stylesheet the
+first time apply_theme() runs; it is then set once on the QApplication, so Qt
+parses the styles a single time instead of once per window. Each section is
+namespaced under its window's root objectName (see the *_SCOPE constants), so
+rules such as #header or QMainWindow from one window never leak into another.
+"""
+import re
+
+from PyQt5.QtWidgets import QApplication
+
+# --- Shared Palette ---
+P_PURPLE = "#A383D4"  # Primary/Update Button (Violet)
+P_LIGHT_PURPLE = "#C5A3E8"  # Lighter purple for Add/Save buttons
+P_LIGHT_BG = "#F9F9FB"  # Main window background
+P_CARD_BG = "white"  # Card background
+P_TEXT_DARK = "#333333"  # Very dark text for high contrast
+P_TEXT_MEDIUM = "#666666"
+P_DANGER_RED = "#E55353"  # Danger/Signout Button
+P_LIGHT_GRAY = "#F8F8F8"  # Light background for the button part
+
+# --- Window Scopes (root objectNames) ---
+AUTH_SCOPE = "authForm"
+DASHBOARD_SCOPE = "dashboard"
+SCHEMA_BUILDER_SCOPE = "schemaBuilder"
+DATA_PREVIEW_SCOPE = "dataPreview"
+SETTINGS_SCOPE = "settingsForm"
+
+
+def _auth_rules():
+    FOCUS_PURPLE = "#a07ade"
+    PURPLE_HOVER = "#8d70b5"
+    ERROR_RED = "#dc2626"
+    SUCCESS_GREEN = "#10b981"
+    INFO_BLUE = "#3b82f6"
+
+    CARD_MIN_WIDTH = 450
+    NEW_BG_COLOR = "#f7f7f7"
+    CARD_BG_COLOR = "#ffffff"
+    BUTTON_LILAC = "#A68CC8"
+    TAB_FRAME_BG = "#ededed"
+
+    return f"""
+    /* --- General and Main Window --- */
+    QWidget {{
+        background-color: {NEW_BG_COLOR};
+        font-family: Arial, sans-serif;
+    }}
+
+    /* --- Title and Subtitle Styles --- */
+    QLabel#titleLabel {{
+        color: #333333;
+        font-size: 32px;
+        font-weight: bold;
+        margin: 0;
+        padding: 0;
+    }}
+
+    QLabel#subtitleLabel {{
+        color: #666666;
+        font-size: 16px;
+        font-weight: normal;
+        margin: 0;
+        padding: 0;
+    }}
+
+    /* --- Card Frame --- */
+    #card {{
+        background-color: {CARD_BG_COLOR};
+        border-radius: 16px;
+        min-width: {CARD_MIN_WIDTH}px;
+        border: 1px solid #d9d9d9;
+        box-shadow: 0px 4px 12px rgba(0, 0, 0, 0.08);
+    }}
+
+    QStackedWidget {{
+        background-color: transparent;
+    }}
+
+    /* --- Tab Frame and Buttons --- */
+    #tabFrame {{
+        background-color: {TAB_FRAME_BG};
+        border-radius: 8px;
+        padding: 0.5px;
+    }}
+
+    QPushButton#tabButton {{
+        padding: 6px 20px;
+        border: none;
+        font-weight: 500;
+        font-size: 13px;
+        color: #666666;
+        background-color: transparent;
+        border-radius: 6px;
+        min-height: 20px;
+        margin: 0.5px;
+    }}
+
+    QPushButton#tabButton[active="true"] {{
+        color: #000000;
+        background-color: #ffffff;
+        font-weight: 600;
+        box-shadow: 0px 1px 3px rgba(0, 0, 0, 0.05);
+        border-radius: 6px;
+    }}
+
+    /* --- Input Fields and Labels --- */
+    QLabel {{
+        color: #222222;
+        font-weight: 500;
+        margin-top: 15px;
+        margin-bottom: 5px;
+        font-size: 13px;
+        background: transparent;
+    }}
+
+    QLineEdit {{
+        padding: 10px 15px;
+        border: 1px solid #e0e0e0;
+        border-radius: 10px;
+        font-size: 14px;
+        background-color: #ffffff;
+        color: #000000;
+    }}
+
+    QLineEdit::placeholder {{
+        color: #999999;
+        font-weight: 400;
+    }}
+
+    QLineEdit[error="true"] {{
+        border: 1px solid {ERROR_RED};
+        background-color: rgba(220, 38, 38, 0.05);
+    }}
+
+    QLineEdit:focus {{
+        border: 1px solid {FOCUS_PURPLE};
+        outline: 2px solid rgba(160, 122, 222, 0.2);
+    }}
+
+    /* --- Main Action Button --- */
+    QPushButton#mainButton {{
+        background-color: {BUTTON_LILAC};
+        color: white;
+        padding: 14px 20px;
+        border-radius: 10px;
+        font-weight: 600;
+        margin-top: 25px;
+        font-size: 14px;
+    }}
+    QPushButton#mainButton:hover {{
+        background-color: {PURPLE_HOVER};
+    }}
+
+    /* --- Secondary Button --- */
+    QPushButton#secondaryButton {{
+        background-color: #f3f4f6;
+        color: #374151;
+        border: 1px solid #d1d5db;
+        padding: 10px 16px;
+        border-radius: 10px;
+        font-weight: 600;
+        font-size: 14px;
+    }}
+    QPushButton#secondaryButton:hover {{
+        background-color: #e5e7eb;
+    }}
+
+    /* --- Message Labels --- */
+    QLabel#errorMessage {{
+        color: {ERROR_RED};
+        font-size: 13px;
+        font-weight: 500;
+        padding: 8px 12px;
+        background-color: rgba(220, 38, 38, 0.08);
+        border-radius: 8px;
+        margin-top: 5px;
+        margin-bottom: 5px;
+        border: 1px solid rgba(220, 38, 38, 0.2);
+    }}
+
+    QLabel#successMessage {{
+        color: {SUCCESS_GREEN};
+        font-size: 13px;
+        font-weight: 500;
+        padding: 8px 12px;
+        background-color: rgba(16, 185, 129, 0.08);
+        border-radius: 8px;
+        margin-top: 5px;
+        margin-bottom: 5px;
+        border: 1px solid rgba(16, 185, 129, 0.2);
+    }}
+
+    QLabel#infoMessage {{
+        color: {INFO_BLUE};
+        font-size: 13px;
+        font-weight: 500;
+        padding: 8px 12px;
+        background-color: rgba(59, 130, 246, 0.08);
+        border-radius: 8px;
+        margin-top: 5px;
+        margin-bottom: 5px;
+        border: 1px solid rgba(59, 130, 246, 0.2);
+    }}
+    """
+
+
+def _dashboard_rules():
+    return """
+    /* --- General Window and Background --- */
+    QMainWindow, QWidget {
+        background-color: #F8F8F8;
+        font-family: Arial, sans-serif;
+    }
+
+    /* --- Logo and Titles --- */
+    #Logo {
+        font-size: 24pt;
+        font-weight: bold;
+        color: #5D5D5D; /* Darker text */
+    }
+    #PageTitle {
+        font-size: 20pt;
+        font-weight: bold;
+        padding-top: 10px;
+    }
+    #PageSubtitle {
+        font-size: 11pt;
+        color: #6A6A6A;
+        padding-left: 20px;
+        padding-bottom: 10px;
+    }
+
+    /* --- Header Buttons --- */
+    #SettingsButton {
+        background-color: white;
+        border: 1px solid #E0E0E0;
+        border-radius: 6px;
+        padding: 8px 15px;
+        color: #5D5D5D;
+    }
+    #SettingsButton:hover {
+        background-color: #F0F0F0; /* Light hover */
+    }
+
+    #SignOutButton, #NewProjectButton, #CreateProjectButton {
+        background-color: #A995C9; /* Default purple */
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 15px;
+        font-weight: bold;
+    }
+    #SignOutButton:hover, #NewProjectButton:hover, #CreateProjectButton:hover {
+        background-color: #8C7BA9; /* Darker purple on hover */
+    }
+
+    /* --- Project Card Styles --- */
+    #ProjectCard {
+        background-color: white;
+        border-radius: 10px;
+        /* Using border for a subtle card look, as true box-shadow requires advanced techniques */
+        border: 1px solid #E0E0E0; 
+    }
+    #ProjectCard:hover {
+        border: 1px solid #A995C9; /* Highlight border on hover */
+        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1); /* Simulate shadow */
+    }
+
+    #CardIcon {
+        padding: 5px;
+        background-color: #F3E8FF;
+        border-radius: 8px;
+    }
+    #CardDescription, #EmptyStateHint {
+        color: #6A6A6A;
+    }
+    #CardDate {
+        color: #6A6A6A;
+        font-size: 11pt;
+    }
+
+    /* --- Delete Button on Card Hover (Image_fe35a0.png) --- */
+    #DeleteButton {
+        background: transparent;
+        border: none;
+        /* Initially faint icon - setting the image directly can be complex, so we'll style the background on hover */
+    }
+    #DeleteButton:hover {
+        background-color: #A995C9; /* Purple square on hover */
+        border-radius: 5px;
+        /* You would typically swap to a white trash icon here for contrast */
+        /* This example uses a standard system icon, which may not change color */
+    }
+
+    #HeaderSeparator {
+        background-color: #E0E0E0;
+    }
+
+    /* --- Scrollable Project Grid --- */
+    QScrollArea {
+        border: none;
+    }
+
+    /* --- Empty State Container --- */
+    #EmptyState {
+        background-color: white;
+        border-radius: 10px;
+        border: 1px solid #E0E0E0;
+        min-height: 350px;
+        margin: 20px;
+    }
+    """
+
+
+def _builder_shared_rules():
+    """Rules the schema builder and the data preview window have in common."""
+    return f"""
+        QMainWindow {{
+            background-color: {P_LIGHT_BG};
+        }}
+        #previewButton {{
+            background-color: white;
+            color: {P_TEXT_DARK};
+            border: 1px solid #D0D0D0;
+            border-radius: 6px;
+            padding: 8px 15px;
+            font-size: 14px;
+        }}
+        #previewButton:hover {{
+            background-color: {P_LIGHT_GRAY};
+        }}
+    """
+
+
+def _schema_builder_rules():
+    return f"""
+        /* --- Window and General Styling --- */
+        #header {{
+            background-color: {P_CARD_BG};
+            border-bottom: 1px solid #D0D0D0;
+        }}
+        #schemaCard {{
+            background-color: {P_CARD_BG};
+            border-radius: 12px;
+            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+        }}
+
+        /* --- Titles and Labels --- */
+        #headerTitle {{
+            font-size: 20px;
+            font-weight: bold;
+            color: {P_TEXT_DARK};
+        }}
+        #mainTitle {{
+            font-size: 30px;
+            font-weight: bold;
+            color: {P_TEXT_DARK};
+        }}
+        #subTitle {{
+            font-size: 16px;
+            color: {P_TEXT_MEDIUM};
+        }}
+
+        /* --- Buttons --- */
+        #primaryButton {{
+            background-color: {P_PURPLE};
+            color: white;
+            border: none;
+            border-radius: 6px;
+            padding: 10px 15px;
+            font-size: 14px;
+            font-weight: bold;
+        }}
+        #primaryButton:hover {{
+            background-color: {P_LIGHT_PURPLE};
+        }}
+
+        /* --- Standard Input Fields (QLineEdit) --- */
+        QLineEdit {{
+            border: 1px solid #D0D0D0;
+            border-radius: 6px;
+            padding: 8px 10px;
+            font-size: 14px;
+            background-color: white;
+        }}
+
+        /* --- CUSTOM DROPDOWN QSS (Revised Modern Look) --- */
+
+        /* 1. Style for the main display part (QLineEdit) */
+        #typeDisplay {{
+            /* Keep all borders from QLineEdit default, but remove right border for blending */
+            border-top-right-radius: 0px;
+            border-bottom-right-radius: 0px;
+            border-right: none;
+            background-color: white;
+        }}
+
+        /* 2. Style for the dropdown button (QPushButton) */
+        #dropdownButton {{
+            background-color: white; /* Clean white background */
+            border: 1px solid #D0D0D0;
+            /* Match the text input style except for left border and corners to blend */
+            border-top-left-radius: 0px;
+            border-bottom-left-radius: 0px;
+            border-left: none; /* Blend with QLineEdit */
+            padding: 0;
+            font-size: 14px;
+            font-weight: bold;
+            color: {P_PURPLE}; /* Use primary purple for the arrow */
+        }}
+        #dropdownButton:hover {{
+            background-color: {P_LIGHT_GRAY}; /* Subtle hover effect */
+            color: {P_PURPLE};
+        }}
+        /* ----------------------------------------------------- */
+
+        /* --- QMenu/Dropdown Menu Styling (Updated for modern look) --- */
+        QMenu {{
+            background-color: white;
+            border: 1px solid #D0D0D0;
+            border-radius: 6px;
+            padding: 5px; /* Padding around the items */
+        }}
+
+        QMenu::item {{
+            padding: 8px 15px; /* Increased padding for better touch/click targets */
+            border-radius: 4px;
+            color: {P_TEXT_DARK};
+            font-size: 14px;
+        }}
+
+        QMenu::item:selected {{
+            background-color: {P_PURPLE}; /* Primary color on hover/selection */
+            color: white;
+        }}
+        /* ----------------------------------------------------- */
+
+
+        /* --- Delete Button (Trash Icon) --- */
+        #deleteFieldButton {{
+            background-color: transparent;
+            border: 1px solid #D0D0D0;
+            border-radius: 6px;
+            font-size: 16px;
+            color: {P_DANGER_RED};
+        }}
+        #deleteFieldButton:hover {{
+            background-color: #FEE;
+            border: 1px solid {P_DANGER_RED};
+        }}
+
+        /* --- Hint Text (Small secondary text) --- */
+        #hintText {{
+            font-size: 11px;
+            color: {P_TEXT_MEDIUM};
+        }}
+
+        /* --- General Text (Ensuring QLabels default to the dark color) --- */
+        QLabel {{
+            font-family: Arial;
+            color: {P_TEXT_DARK};
+            font-size: 14px;
+        }}
+    """
+
+
+def _data_preview_rules():
+    return f"""
+        #mainTitle {{
+            font-size: 24px;
+            font-weight: bold;
+            color: {P_TEXT_DARK};
+        }}
+        #subTitle {{
+            font-size: 13px;
+            color: {P_TEXT_MEDIUM};
+        }}
+        QTableView {{
+            background-color: white;
+            border: 1px solid #D0D0D0;
+            border-radius: 8px;
+            gridline-color: #EEEEEE;
+            font-size: 13px;
+            color: {P_TEXT_DARK};
+            selection-background-color: {P_PURPLE};
+        }}
+        QHeaderView::section {{
+            background-color: {P_LIGHT_GRAY};
+            color: {P_TEXT_MEDIUM};
+            border: none;
+            border-bottom: 1px solid #D0D0D0;
+            padding: 6px;
+            font-weight: bold;
+        }}
+    """
+
+
+def _settings_rules():
+    return f"""
+        QWidget {{
+            background-color: {P_LIGHT_BG};
+            color: {P_TEXT_DARK};
+            font-family: Arial;
+        }}
+
+        /* --- Header --- */
+        #header {{
+            background-color: {P_CARD_BG};
+            border-bottom: 1px solid #E0E0E0;
+        }}
+
+        /* --- Typography --- */
+        #title {{
+            font-size: 28px;
+            font-weight: bold;
+            color: {P_TEXT_DARK};
+            margin-bottom: 0px;
+        }}
+        #subtitle {{
+            font-size: 14px;
+            color: {P_TEXT_MEDIUM};
+            margin-bottom: 0px;
+        }}
+        #cardTitle {{
+            font-size: 18px;
+            font-weight: bold;
+            color: {P_TEXT_DARK};
+            margin-bottom: 0px;
+        }}
+        #inputLabel {{
+            font-size: 13px;
+            font-weight: bold;
+            color: {P_TEXT_DARK};
+            margin-bottom: 2px;
+            background-color: white; /* Ensures labels match the white card background */
+            padding: 0px; /* Added to ensure no inherited padding causes gray borders */
+        }}
+        #hintText {{
+            font-size: 11px;
+            color: {P_TEXT_MEDIUM};
+            margin-top: 2px;
+            background-color: white; /* Ensures hint text background matches the white card */
+            padding: 0px; /* Added to ensure no inherited padding causes gray borders */
+        }}
+
+        /* --- Layout Cards --- */
+        #cardFrame {{
+            background-color: {P_CARD_BG};
+            border: 1px solid #E0E0E0;
+            border-radius: 8px;
+        }}
+        #signoutCardFrame {{
+            background-color: {P_CARD_BG};
+            border: 1px solid #E0E0E0;
+            border-radius: 8px;
+        }}
+
+        /* --- Inputs --- */
+        QLineEdit {{
+            border: 1px solid #CCCCCC;
+            border-radius: 6px;
+            padding: 10px 12px;
+            font-size: 13px;
+            text-align: left;
+        }}
+
+        /* Read-only fields - Confirmed background is white */
+        #readOnlyInput {{
+            background-color: white;
+            color: {P_TEXT_MEDIUM};
+        }}
+
+        /* Editable field focus style */
+        QLineEdit[isEditable="true"]:focus {{
+            border: 2px solid {P_PURPLE};
+            padding: 9px 11px;
+        }}
+
+        /* --- Buttons --- */
+        #backButton {{
+            background-color: transparent;
+            border: none;
+            color: {P_TEXT_MEDIUM};
+            font-size: 14px; 
+            padding: 8px 15px; 
+            border-radius: 6px; 
+            text-align: left;
+            font-weight: bold; 
+        }}
+        #backButton:hover {{
+            background-color: {P_PURPLE}; 
+            color: white; 
+            text-decoration: none; 
+            font-weight: bold; 
+        }}
+
+        #updateButton {{
+            background-color: {P_PURPLE};
+            color: white;
+            font-size: 14px;
+            font-weight: bold;
+            padding: 0px;
+            border: none;
+            border-radius: 10px;
+            text-align: center;
+        }}
+        #updateButton:hover {{
+            background-color: #8D67B2;
+        }}
+
+        /* --- Sign Out Button (Danger) Styling --- */
+        /* Normal State: White background, Red text, Red border */
+        #signoutButton {{
+            background-color: white;
+            color: {P_DANGER_RED};
+            font-size: 14px;
+            font-weight: bold;
+            padding: 0px;
+            border: 1px solid {P_DANGER_RED}; 
+            border-radius: 10px; 
+            text-align: center;
+        }}
+        /* Hover State: Purple background (matching update button color), White text */
+        #signoutButton:hover {{
+            background-color: #A383D4; /* Used explicit hex code for robustness */
+            color: white;
+            border: 1px solid #A383D4; /* Match border to hover background */
+        }}
+    """
+
+# --- Compiling ---
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_RULE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_BARE_TYPE = re.compile(r"^([A-Za-z]\w*)((?:::?[\w-]+)*)$")  # e.g. QMainWindow, QWidget:hover
+
+
+def scope_rules(scopes, qss):
+    """
+    Rewrites every selector in `qss` so it only matches inside the widgets named `scopes`.
+
+    "#header" becomes "#scope #header". A bare type selector such as
+    "QMainWindow" additionally matches the scoped root itself
+    ("QMainWindow#scope"), as it did when the sheet was set on that window.
+    """
+    if isinstance(scopes, str):
+        scopes = (scopes,)
+
+    rules = []
+    for selectors, body in _RULE.findall(_COMMENT.sub("", qss)):
+        scoped = []
+        for selector in (s.strip() for s in selectors.split(",")):
+            for scope in scopes:
+                scoped.append(f"#{scope} {selector}")
+                bare = _BARE_TYPE.match(selector)
+                if bare:
+                    scoped.append(f"{bare.group(1)}#{scope}{bare.group(2)}")
+        declarations = " ".join(line.strip() for line in body.strip().splitlines())
+        rules.append(f"{', '.join(scoped)} {{ {declarations} }}")
+    return "\n".join(rules)
+
+
+class ThemeRegistry:
+    """Compiles the registered sections into one stylesheet and installs it on the application."""
+
+    def __init__(self):
+        self._sections = []  # (scopes, builder)
+        self._stylesheet = None
+        self._applied_to = None
+
+    def register(self, scopes, builder):
+        self._sections.append((scopes, builder))
+        self._stylesheet = None
+
+    @property
+    def stylesheet(self):
+        if self._stylesheet is None:
+            self._stylesheet = "\n".join(scope_rules(scopes, builder()) for scopes, builder in self._sections)
+        return self._stylesheet
+
+    def apply(self, app=None):
+        """Sets the compiled stylesheet on the QApplication; repeated calls are no-ops."""
+        app = app or QApplication.instance()
+        if app is None or (app is self._applied_to and app.styleSheet() == self.stylesheet):
+            return
+        app.setStyleSheet(self.stylesheet)
+        self._applied_to = app
+
+
+registry = ThemeRegistry()
+registry.register(AUTH_SCOPE, _auth_rules)
+registry.register(DASHBOARD_SCOPE, _dashboard_rules)
+registry.register((SCHEMA_BUILDER_SCOPE, DATA_PREVIEW_SCOPE), _builder_shared_rules)
+registry.register(SCHEMA_BUILDER_SCOPE, _schema_builder_rules)
+registry.register(DATA_PREVIEW_SCOPE, _data_preview_rules)
+registry.register(SETTINGS_SCOPE, _settings_rules)
+
+
+def apply_theme(app=None):
+    registry.apply(app)
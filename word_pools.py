@@ -0,0 +1,175 @@
+"""
+Pre-packed word pools, memory-mapped from data/word_pools.bin.
+
+Each pool is stored as an array of uint32 byte offsets plus one UTF-8 blob,
+so opening the file parses nothing: the offsets are NumPy views straight onto
+the mapped pages, and only those raw pages are shared (through the OS page
+cache) between the processes that open the file. A pool is decoded into
+Python strings the first time a generator gathers from it, and that decoded
+copy is private to each process: a worker that uses every pool holds about
+14 MB of strings and spends about 28 ms building them. Gathering references
+from a decoded object array is far cheaper per batch than building a new
+string per cell from the mapped bytes, so that copy is kept on purpose.
+The file is written by build_word_pools.py.
+
+File layout (little-endian):
+    magic b"DFWP", u32 version, u32 pool count
+    per pool: u16 + UTF-8 name, u32 entry count, u64 offsets position, u64 blob position
+    then the offset arrays ((count + 1) x u32, relative to the pool's blob) and
+    the blobs, each section aligned to 8 bytes
+"""
+import mmap
+import os
+import struct
+
+import numpy as np
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DEFAULT_PATH = os.path.join(DATA_DIR, "word_pools.bin")
+
+FORMAT_VERSION = 1
+_MAGIC = b"DFWP"
+_HEADER = struct.Struct("<4sII")
+_ENTRY = struct.Struct("<IQQ")
+_NAME_LENGTH = struct.Struct("<H")
+
+
+class PackedPool:
+    """
+    One pool of strings backed by offsets into a (memory-mapped) UTF-8 blob.
+
+    Slicing returns another PackedPool over the same bytes. `values` is the
+    pool as a read-only object array for fancy indexing, decoded on first use
+    and cached per process (it is not shared with other processes).
+    """
+
+    __slots__ = ("name", "offsets", "blob", "_values", "_contains")
+
+    def __init__(self, name, offsets, blob):
+        self.name = name
+        self.offsets = offsets  # uint32 array of len + 1 byte positions into blob
+        self.blob = blob  # buffer (memoryview over the mapped file)
+        self._values = None
+        self._contains = {}  # characters -> whether any entry contains one of them
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                raise ValueError("PackedPool slices must be contiguous")
+            stop = max(start, stop)
+            pool = PackedPool(f"{self.name}[{start}:{stop}]", self.offsets[start:stop + 1], self.blob)
+            if self._values is not None:
+                pool._values = self._values[start:stop]
+            return pool
+        if key < 0:
+            key += len(self)
+        return str(self.blob[int(self.offsets[key]):int(self.offsets[key + 1])], "utf-8")
+
+    def contains_any(self, characters):
+        """True if any entry contains one of `characters` (checked on the raw bytes, once per set)."""
+        found = self._contains.get(characters)
+        if found is None:
+            data = bytes(self.blob[int(self.offsets[0]):int(self.offsets[-1])])
+            found = any(character.encode("utf-8") in data for character in characters)
+            self._contains[characters] = found
+        return found
+
+    @property
+    def values(self):
+        if self._values is None:
+            first, last = int(self.offsets[0]), int(self.offsets[-1])
+            data = bytes(self.blob[first:last])
+            bounds = (self.offsets - first).tolist()
+            if data.isascii():
+                # Byte offsets are character offsets, so slice one decoded string
+                text = data.decode("ascii")
+                words = [text[a:b] for a, b in zip(bounds, bounds[1:])]
+            else:
+                words = [data[a:b].decode("utf-8") for a, b in zip(bounds, bounds[1:])]
+            values = np.empty(len(words), dtype=object)
+            values[:] = words
+            values.flags.writeable = False
+            self._values = values
+        return self._values
+
+
+def write_pools(path, pools):
+    """Packs {name: list of strings} into a pool file at `path` (written atomically)."""
+    encoded = {name: [word.encode("utf-8") for word in words] for name, words in pools.items()}
+
+    directory_size = _HEADER.size + sum(
+        _NAME_LENGTH.size + len(name.encode("utf-8")) + _ENTRY.size for name in encoded
+    )
+    position = _align(directory_size)
+
+    entries = []
+    sections = []
+    for name, words in encoded.items():
+        offsets = np.zeros(len(words) + 1, dtype="<u4")
+        offsets[1:] = np.cumsum([len(word) for word in words])
+        blob = b"".join(words)
+
+        offsets_position = position
+        position = _align(position + offsets.nbytes)
+        blob_position = position
+        position = _align(position + len(blob))
+
+        entries.append((name, len(words), offsets_position, blob_position))
+        sections.append((offsets_position, offsets.tobytes()))
+        sections.append((blob_position, blob))
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, FORMAT_VERSION, len(entries)))
+        for name, count, offsets_position, blob_position in entries:
+            name_bytes = name.encode("utf-8")
+            f.write(_NAME_LENGTH.pack(len(name_bytes)) + name_bytes)
+            f.write(_ENTRY.pack(count, offsets_position, blob_position))
+        for section_position, data in sections:
+            f.write(b"\0" * (section_position - f.tell()))
+            f.write(data)
+    os.replace(temporary_path, path)
+
+
+def open_pools(path=DEFAULT_PATH):
+    """Memory-maps a pool file and returns {name: PackedPool}; nothing is copied or decoded."""
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, count = _HEADER.unpack_from(mapped, 0)
+    if magic != _MAGIC:
+        raise ValueError(f"{path} is not a word pool file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path} has pool format {version}, expected {FORMAT_VERSION}; rerun build_word_pools.py")
+
+    buffer = memoryview(mapped)
+    pools = {}
+    position = _HEADER.size
+    for _ in range(count):
+        (name_length,) = _NAME_LENGTH.unpack_from(mapped, position)
+        position += _NAME_LENGTH.size
+        name = str(buffer[position:position + name_length], "utf-8")
+        position += name_length
+        entry_count, offsets_position, blob_position = _ENTRY.unpack_from(mapped, position)
+        position += _ENTRY.size
+
+        offsets = np.frombuffer(mapped, dtype="<u4", count=entry_count + 1, offset=offsets_position)
+        pools[name] = PackedPool(name, offsets, buffer[blob_position:])
+    return pools
+
+
+def load_default_pools():
+    """Opens the shipped pool file, building it first if it is missing (e.g. in a fresh checkout)."""
+    if not os.path.exists(DEFAULT_PATH):
+        import build_word_pools
+        build_word_pools.build(DEFAULT_PATH)
+    return open_pools(DEFAULT_PATH)
+
+
+def _align(position, alignment=8):
+    return -(-position // alignment) * alignment